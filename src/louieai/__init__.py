@@ -8,7 +8,15 @@ except ImportError:
     # Fallback for development installs without setuptools_scm
     __version__ = "0.0.0+unknown"
 
+from ._cancel import CancelToken, QueryFuture
+from ._circuit import CircuitOpenError
 from ._client import Response, Thread
+from ._instrumentation import Instrumentation, OpenTelemetryInstrumentation
+from ._metrics import MetricsRegistry
+from ._ratelimit import RateLimiter
+from ._shared_cache import SharedTableCache
+from ._timings import QueryTimings
+from ._watchdog import StreamTimeoutError
 from .notebook import Cursor
 
 
@@ -126,6 +134,35 @@ def louie(
             - server: PyGraphistry server (default: from env or "hub.graphistry.com")
             - timeout: Overall timeout in seconds (default: 300s/5min)
             - streaming_timeout: Timeout for streaming chunks (default: 120s/2min)
+            - first_element_timeout: Max wait for the first result (default: off)
+            - total_timeout: Max duration of a whole chat stream (default: off)
+            - rate_limit: Maximum requests per second (default: unlimited)
+            - max_in_flight: Maximum concurrent requests (default: unlimited)
+            - rate_limiter: Shared RateLimiter instance
+            - failure_threshold: Consecutive failures before failing fast (default: off)
+            - recovery_timeout: Seconds before probing an open circuit (default: 30s)
+            - record_to: Record all responses to this cassette file
+            - replay_from: Replay responses from this cassette file, offline
+            - replay_speed: Replay pacing multiplier, None for no delays (default: 1.0)
+            - instrumentation: Hooks around chat, Arrow and auth operations
+            - metrics: MetricsRegistry to record request counters and histograms
+            - result_backend: Dataframe type: "pandas" (default), "pyarrow",
+              "polars", "duckdb" or "spark"
+            - spark_staging_dir: Directory for staging large Spark results
+              as Parquet, e.g. "/dbfs/tmp/louie"
+            - arrow_compression: Arrow IPC codec to request for dataframes,
+              "zstd" or "lz4" (default: none)
+            - arrow_segments: Download dataframes through a temporary file
+              with resumable Range requests, in up to this many parallel
+              segments
+            - dataframe_cache_bytes: Arrow memory for reusing fetched
+              dataframes (default: 256 MiB, 0 to disable)
+            - shared_cache: SharedTableCache to share fetched dataframes with
+              other processes on the host
+            - optimize_dataframes: Categorize repetitive strings and downcast
+              numbers in pandas results to save memory (default: False)
+            - thread_cache_ttl: Seconds thread metadata is cached before
+              being revalidated with the server (default: 60)
 
     Returns:
         Cursor: A callable interface for natural language queries
@@ -193,8 +230,18 @@ def louie(
 
 
 __all__ = [
+    "CancelToken",
+    "CircuitOpenError",
     "Cursor",
+    "Instrumentation",
+    "MetricsRegistry",
+    "OpenTelemetryInstrumentation",
+    "QueryFuture",
+    "QueryTimings",
+    "RateLimiter",
     "Response",
+    "SharedTableCache",
+    "StreamTimeoutError",
     "Thread",
     "__version__",
     "louie",
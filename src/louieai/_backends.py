@@ -0,0 +1,426 @@
+"""Result backends: which dataframe type fetched tables are returned as.
+
+Dataframe blocks arrive as Arrow IPC and are decoded into a ``pyarrow.Table``
+that references the response buffer without copying. The table is then
+handed to the requested engine: returned as is for ``"pyarrow"``, wrapped
+by Polars (zero-copy for most column types), DuckDB or Spark, or converted
+to pandas by default.
+"""
+
+import atexit
+import contextlib
+import importlib
+import io
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+PANDAS = "pandas"
+PYARROW = "pyarrow"
+POLARS = "polars"
+DUCKDB = "duckdb"
+SPARK = "spark"
+
+RESULT_BACKENDS = (PANDAS, PYARROW, POLARS, DUCKDB, SPARK)
+
+# Top-level packages whose objects count as result frames
+_FRAME_MODULES = frozenset({"polars", "duckdb", "pyspark"})
+
+# Tables at least this large go to Spark through a staged Parquet file,
+# when a staging directory is configured
+SPARK_STAGING_ROWS = 1_000_000
+
+
+def validate_backend(backend: str) -> str:
+    """Check a result backend name, and that its package is installed.
+
+    Args:
+        backend: Requested backend
+
+    Returns:
+        The backend name
+
+    Raises:
+        ValueError: If the backend is not supported
+        ImportError: If the backend's package is not installed
+    """
+    if backend not in RESULT_BACKENDS:
+        raise ValueError(
+            f"Invalid result_backend: '{backend}'. "
+            f"Must be one of: {', '.join(RESULT_BACKENDS)}"
+        )
+    import_backend(backend)
+    return backend
+
+
+# Package each optional backend needs, and the extra that installs it
+_BACKEND_PACKAGES = {
+    POLARS: ("polars", "polars"),
+    DUCKDB: ("duckdb", "duckdb"),
+    SPARK: ("pyspark", "spark"),
+}
+
+
+def import_backend(backend: str) -> Any:
+    """Import the package an optional backend needs.
+
+    Args:
+        backend: One of RESULT_BACKENDS
+
+    Returns:
+        The backend's package, or None for the built-in backends
+
+    Raises:
+        ImportError: If the package is not installed
+    """
+    if backend not in _BACKEND_PACKAGES:
+        return None
+    package, extra = _BACKEND_PACKAGES[backend]
+    try:
+        return importlib.import_module(package)
+    except ImportError as e:
+        raise ImportError(
+            f"result_backend='{backend}' requires {package}. "
+            f"Install it with: pip install louieai[{extra}]"
+        ) from e
+
+
+# Arrow IPC buffer codecs a server can be asked for, by request name
+IPC_CODECS = {"zstd": "zstd", "lz4": "lz4_frame"}
+
+
+def validate_compression(codec: str | None) -> str | None:
+    """Check an Arrow IPC compression codec name.
+
+    Args:
+        codec: Requested codec, or None for uncompressed
+
+    Returns:
+        The codec name
+
+    Raises:
+        ValueError: If the codec is unknown or this pyarrow cannot decode it
+    """
+    if codec is None:
+        return None
+    if codec not in IPC_CODECS:
+        raise ValueError(
+            f"Invalid arrow_compression: '{codec}'. "
+            f"Must be one of: {', '.join(IPC_CODECS)}"
+        )
+    if not pa.Codec.is_available(IPC_CODECS[codec]):
+        raise ValueError(f"This pyarrow build cannot decompress {codec}")
+    return codec
+
+
+def read_arrow_ipc(payload: bytes | pa.Buffer) -> pa.Table:
+    """Decode Arrow IPC bytes into a table without copying the buffers.
+
+    Compressed IPC buffers (LZ4 or ZSTD) are decompressed as they are read.
+
+    Args:
+        payload: Arrow IPC file or stream bytes, or a buffer over them
+
+    Returns:
+        Table whose columns reference payload
+    """
+    buffer = pa.py_buffer(payload)
+    # Try file format first (most common), then stream format
+    try:
+        return pa.ipc.open_file(buffer).read_all()
+    except Exception:
+        return pa.ipc.open_stream(buffer).read_all()
+
+
+# Leading magic of the Arrow IPC file format; streams start with a message
+_FILE_MAGIC = b"ARROW1"
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes], head: bytes = b""):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(head)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+def iter_arrow_batches(
+    chunks: Iterable[bytes], batch_rows: int | None = None
+) -> Iterator[pa.RecordBatch]:
+    """Decode Arrow IPC bytes into record batches as they arrive.
+
+    The stream format is decoded straight off the chunks. The file format
+    keeps its index at the end, so it is spooled to a temporary file first
+    and read back one batch at a time; either way only one batch is held in
+    memory.
+
+    Args:
+        chunks: Arrow IPC file or stream bytes, in pieces
+        batch_rows: Split batches larger than this many rows (zero-copy)
+
+    Yields:
+        Record batches, in order
+    """
+    if batch_rows is not None and batch_rows < 1:
+        raise ValueError("batch_rows must be at least 1")
+    chunks = iter(chunks)
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= len(_FILE_MAGIC):
+            break
+
+    if head.startswith(_FILE_MAGIC):
+        with tempfile.TemporaryFile() as spool:
+            spool.write(head)
+            for chunk in chunks:
+                spool.write(chunk)
+            spool.seek(0)
+            reader = pa.ipc.open_file(spool)
+            batches: Iterator[pa.RecordBatch] = (
+                reader.get_batch(i) for i in range(reader.num_record_batches)
+            )
+            yield from _split(batches, batch_rows)
+        return
+
+    stream = pa.ipc.open_stream(io.BufferedReader(_ChunkReader(chunks, head)))
+    yield from _split(stream, batch_rows)
+
+
+def _split(
+    batches: Iterable[pa.RecordBatch], batch_rows: int | None
+) -> Iterator[pa.RecordBatch]:
+    """Re-slice batches to at most batch_rows rows each."""
+    for batch in batches:
+        if batch_rows is None or batch.num_rows <= batch_rows:
+            yield batch
+            continue
+        for offset in range(0, batch.num_rows, batch_rows):
+            yield batch.slice(offset, batch_rows)
+
+
+def project_table(
+    table: pa.Table,
+    columns: list[str] | None = None,
+    limit: int | None = None,
+    offset: int | None = None,
+) -> pa.Table:
+    """Apply a column selection and row window to a table.
+
+    The table holds the block's first rows, up to at least the end of the
+    window. Selecting and slicing are zero-copy, so dropped columns and rows
+    never reach the result backend.
+
+    Args:
+        table: Decoded Arrow table
+        columns: Columns to keep, in order
+        limit: Maximum rows to keep
+        offset: Rows to skip first
+
+    Returns:
+        Projected table
+
+    Raises:
+        KeyError: If a requested column does not exist
+    """
+    if columns is not None and table.column_names != list(columns):
+        missing = [c for c in columns if c not in table.column_names]
+        if missing:
+            raise KeyError(f"Columns not in dataframe: {missing}")
+        table = table.select(list(columns))
+    if limit is not None or offset:
+        table = table.slice(offset or 0, limit)
+    return table
+
+
+def compact_table(table: pa.Table) -> pa.Table:
+    """Copy a table into buffers of its own.
+
+    A zero-copy selection or slice keeps the whole buffer it was cut from
+    alive; a compacted copy holds only its own rows and columns.
+
+    Args:
+        table: Table, typically projected from a larger decoded block
+
+    Returns:
+        Table with the same contents and newly allocated buffers
+    """
+    arrays = [
+        pa.concat_arrays(column.chunks)
+        if column.num_chunks
+        else pa.array([], type=column.type)
+        for column in table.columns
+    ]
+    return pa.Table.from_arrays(arrays, schema=table.schema)
+
+
+def convert_table(
+    table: pa.Table, backend: str, spark_staging_dir: str | None = None
+) -> Any:
+    """Convert an Arrow table to the requested backend's dataframe type.
+
+    Args:
+        table: Decoded Arrow table
+        backend: One of RESULT_BACKENDS
+        spark_staging_dir: Directory for staging large tables as Parquet
+            for Spark to read (default: never stage)
+
+    Returns:
+        pandas DataFrame, pyarrow Table, polars DataFrame, DuckDB relation
+        or Spark DataFrame
+
+    Raises:
+        ImportError: If the backend's package is not installed
+    """
+    if backend == PANDAS:
+        return table.to_pandas()
+    if backend == PYARROW:
+        return table
+    if backend == POLARS:
+        return import_backend(POLARS).from_arrow(table, rechunk=False)
+    if backend == DUCKDB:
+        return import_backend(DUCKDB).from_arrow(table)
+    if backend == SPARK:
+        return to_spark(table, spark_staging_dir)
+    raise ValueError(f"Unknown result backend: {backend}")
+
+
+def to_spark(table: pa.Table, staging_dir: str | None = None) -> Any:
+    """Load an Arrow table into the active Spark session.
+
+    Small tables are handed to Spark from memory: directly on Spark 4, or
+    through pandas with Arrow transfer on earlier versions. Tables of at
+    least SPARK_STAGING_ROWS rows are written to a Parquet file in
+    staging_dir, when given, and read back by the cluster in parallel. The
+    DataFrame is then materialized with a local checkpoint and the file
+    removed; where Spark cannot checkpoint locally, the file is removed
+    when the interpreter exits instead.
+
+    Args:
+        table: Decoded Arrow table
+        staging_dir: Directory the driver can write and Spark can read;
+            Databricks ``/dbfs/...`` paths are read back as ``dbfs:/...``
+
+    Returns:
+        Spark DataFrame
+
+    Raises:
+        ImportError: If pyspark is not installed
+    """
+    pyspark = import_backend(SPARK)
+    from pyspark.sql import SparkSession
+
+    spark = SparkSession.getActiveSession() or SparkSession.builder.getOrCreate()
+
+    if staging_dir is not None and table.num_rows >= SPARK_STAGING_ROWS:
+        import pyarrow.parquet as pq
+
+        path = os.path.join(staging_dir, f"louie-{uuid.uuid4().hex}.parquet")
+        pq.write_table(table, path)
+        spark_path = path
+        if path.startswith("/dbfs/"):
+            spark_path = "dbfs:/" + path[len("/dbfs/") :]
+        try:
+            frame = spark.read.parquet(spark_path)
+        except BaseException:
+            _remove_staged(path)
+            raise
+        try:
+            # Read the file into the executors so it can be removed now
+            checkpointed = frame.localCheckpoint(eager=True)
+        except Exception:
+            logger.debug("Local checkpoint unavailable; keeping %s", path)
+            _remove_at_exit(path)
+            return frame
+        _remove_staged(path)
+        return checkpointed
+
+    if int(pyspark.__version__.split(".", 1)[0]) >= 4:
+        return spark.createDataFrame(table)
+    return spark.createDataFrame(table.to_pandas())
+
+
+# Staged Parquet files that lazy Spark DataFrames may still read
+_staged_at_exit: set[str] = set()
+_staged_lock = threading.Lock()
+
+
+def _remove_staged(path: str) -> None:
+    """Delete a staged Parquet file, if it is still there."""
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+def _remove_at_exit(path: str) -> None:
+    """Delete a staged Parquet file when the interpreter exits."""
+    with _staged_lock:
+        _staged_at_exit.add(path)
+
+
+def _remove_all_staged() -> None:
+    """Delete every staged Parquet file left for exit."""
+    with _staged_lock:
+        paths = list(_staged_at_exit)
+        _staged_at_exit.clear()
+    for path in paths:
+        _remove_staged(path)
+
+
+atexit.register(_remove_all_staged)
+
+
+def to_arrow(frame: Any) -> pa.Table:
+    """Convert a result frame from any backend back to an Arrow table.
+
+    Args:
+        frame: pandas or polars DataFrame, Arrow table, DuckDB relation or
+            Spark DataFrame
+
+    Returns:
+        Arrow table
+
+    Raises:
+        TypeError: If frame is not a result frame
+    """
+    if isinstance(frame, pa.Table):
+        return frame
+    if isinstance(frame, pd.DataFrame):
+        return pa.Table.from_pandas(frame)
+    module = type(frame).__module__.split(".", 1)[0]
+    if module == POLARS:
+        return frame.to_arrow()
+    if module == DUCKDB:
+        return frame.to_arrow_table()
+    if module == "pyspark":
+        return pa.Table.from_pandas(frame.toPandas())
+    raise TypeError(f"Not a result frame: {type(frame).__name__}")
+
+
+def is_result_frame(value: Any) -> bool:
+    """Whether value is a dataframe produced by one of the result backends."""
+    if isinstance(value, pd.DataFrame | pa.Table):
+        return True
+    return type(value).__module__.split(".", 1)[0] in _FRAME_MODULES
@@ -0,0 +1,125 @@
+"""Cancellation of in-flight Louie queries."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+from ._watchdog import CANCELLED, StreamWatchdog
+
+if TYPE_CHECKING:
+    from ._client import Response
+
+
+class CancelToken:
+    """Thread-safe flag that stops a query's stream when set.
+
+    A token is passed to ``add_cell`` (or created by ``submit``). Cancelling
+    it closes the connection promptly; the query then returns a Response
+    holding the elements received so far, with ``truncation_reason`` set to
+    ``"cancelled"``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an uncancelled token."""
+        self._cancelled = threading.Event()
+        self._watchdog: StreamWatchdog | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation, aborting the attached stream if any."""
+        with self._lock:
+            self._cancelled.set()
+            watchdog = self._watchdog
+        if watchdog is not None:
+            watchdog.expire(CANCELLED)
+
+    def attach(self, watchdog: StreamWatchdog) -> None:
+        """Attach the watchdog of a newly opened stream.
+
+        If the token was already cancelled the stream is aborted immediately.
+
+        Args:
+            watchdog: Running watchdog for the stream
+        """
+        with self._lock:
+            self._watchdog = watchdog
+            cancelled = self.cancelled
+        if cancelled:
+            watchdog.expire(CANCELLED)
+
+    def detach(self) -> None:
+        """Detach the stream once it has finished."""
+        with self._lock:
+            self._watchdog = None
+
+
+class QueryFuture(Future["Response"]):
+    """Future for a query running in the background.
+
+    Unlike a plain ``concurrent.futures.Future``, ``cancel()`` also works
+    while the query is running: the stream is closed and the future resolves
+    with the partial Response instead of raising ``CancelledError``.
+
+    Awaiting the future from asyncio code is supported; cancelling the
+    awaiting task cancels the query, and the partial Response remains
+    available from ``result()``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a pending future with its cancel token."""
+        super().__init__()
+        self.token = CancelToken()
+
+    def cancel(self) -> bool:
+        """Cancel the query.
+
+        Returns:
+            True unless the query had already finished
+        """
+        if super().cancel():
+            return True
+        if self.done():
+            return False
+        self.token.cancel()
+        return True
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether cancel() was called on a running query."""
+        return self.token.cancelled
+
+    def __await__(self) -> Generator[Any, None, "Response"]:
+        """Await the Response from asyncio code."""
+        return asyncio.wrap_future(self).__await__()
+
+
+def run_in_background(query: Callable[[CancelToken], "Response"]) -> QueryFuture:
+    """Run a query on a daemon worker thread.
+
+    Args:
+        query: Callable running the query with the future's cancel token
+
+    Returns:
+        QueryFuture resolving to the query's Response or exception
+    """
+    future = QueryFuture()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            response = query(future.token)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(response)
+
+    threading.Thread(target=run, name="louie-query", daemon=True).start()
+    return future
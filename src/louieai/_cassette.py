@@ -0,0 +1,384 @@
+"""Record and replay Louie HTTP traffic for offline reproduction.
+
+A cassette is a zip file holding every response a client received: chat
+streams as JSONL lines with their arrival offsets, and other responses
+(Arrow blocks, thread listings) as raw bytes. ``RecordingTransport`` captures
+one while talking to a live server; ``ReplayTransport`` serves it back at the
+original pace, faster, or without delays.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import zipfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+# Response headers worth keeping; everything else (cookies, auth) is dropped
+_KEPT_HEADERS = ("content-type", "content-encoding")
+
+
+class CassetteMissError(RuntimeError):
+    """Raised when replay finds no recorded response for a request."""
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response.
+
+    Attributes:
+        method: HTTP method
+        path: URL path
+        query: URL query string
+        status_code: Response status
+        headers: Response content headers
+        body: Raw body for non-streaming responses
+        lines: ``(seconds since request, line)`` pairs for streamed responses
+    """
+
+    method: str
+    path: str
+    query: str
+    status_code: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    lines: list[tuple[float, str]] | None = None
+
+
+class Cassette:
+    """Ordered collection of recorded interactions."""
+
+    def __init__(self, interactions: list[Interaction] | None = None):
+        """Initialize the cassette.
+
+        Args:
+            interactions: Previously recorded interactions
+        """
+        self.interactions: list[Interaction] = list(interactions or [])
+        self._next: dict[tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, interaction: Interaction) -> None:
+        """Append an interaction."""
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def find(self, method: str, path: str, query: str) -> Interaction:
+        """Find the recorded response for a request.
+
+        Matches on method and path, preferring an identical query string.
+        Repeated requests cycle through the matching recordings in order,
+        so a cassette can be replayed any number of times.
+
+        Args:
+            method: HTTP method
+            path: URL path
+            query: URL query string
+
+        Returns:
+            Matching interaction
+
+        Raises:
+            CassetteMissError: If nothing was recorded for the path
+        """
+        with self._lock:
+            same_path = [
+                i for i in self.interactions if i.method == method and i.path == path
+            ]
+            exact = [i for i in same_path if i.query == query]
+            candidates = exact or same_path
+            if not candidates:
+                raise CassetteMissError(
+                    f"No recorded response for {method} {path}"
+                    + (f"?{query}" if query else "")
+                )
+            key = (method, path, query if exact else "")
+            index = self._next.get(key, 0)
+            self._next[key] = index + 1
+            return candidates[index % len(candidates)]
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the cassette to a zip file.
+
+        Args:
+            path: Destination file
+        """
+        with self._lock:
+            interactions = list(self.interactions)
+        manifest = []
+        tmp_path = f"{os.fspath(path)}.tmp"
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for n, interaction in enumerate(interactions):
+                entry: dict[str, Any] = {
+                    "method": interaction.method,
+                    "path": interaction.path,
+                    "query": interaction.query,
+                    "status_code": interaction.status_code,
+                    "headers": interaction.headers,
+                }
+                if interaction.lines is not None:
+                    name = entry["lines"] = f"streams/{n:05d}.jsonl"
+                    zf.writestr(
+                        name,
+                        "".join(f"{t:.6f}\t{line}\n" for t, line in interaction.lines),
+                    )
+                else:
+                    name = entry["body"] = f"bodies/{n:05d}.bin"
+                    zf.writestr(name, interaction.body)
+                manifest.append(entry)
+            zf.writestr(
+                "cassette.json",
+                json.dumps({"version": CASSETTE_VERSION, "interactions": manifest}),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "Cassette":
+        """Read a cassette written by save().
+
+        Args:
+            path: Cassette file
+
+        Returns:
+            Loaded cassette
+        """
+        interactions = []
+        with zipfile.ZipFile(path) as zf:
+            manifest = json.loads(zf.read("cassette.json"))
+            if manifest.get("version") != CASSETTE_VERSION:
+                raise ValueError(
+                    f"Unsupported cassette version {manifest.get('version')} in {path}"
+                )
+            for entry in manifest["interactions"]:
+                lines = None
+                body = b""
+                if "lines" in entry:
+                    lines = []
+                    for row in zf.read(entry["lines"]).decode().splitlines():
+                        offset, _, line = row.partition("\t")
+                        lines.append((float(offset), line))
+                else:
+                    body = zf.read(entry["body"])
+                interactions.append(
+                    Interaction(
+                        method=entry["method"],
+                        path=entry["path"],
+                        query=entry["query"],
+                        status_code=entry["status_code"],
+                        headers=entry["headers"],
+                        body=body,
+                        lines=lines,
+                    )
+                )
+        return cls(interactions)
+
+
+def _is_stream(request: httpx.Request) -> bool:
+    """Check whether a request is a chat stream recorded line by line."""
+    return request.url.path.rstrip("/").endswith("/api/chat")
+
+
+class _RecordingStream(httpx.SyncByteStream):
+    """Pass a response body through while capturing it."""
+
+    def __init__(
+        self,
+        inner: httpx.SyncByteStream,
+        on_done: Callable[[bytes, list[tuple[float, str]] | None], None],
+        start: float,
+        timed_lines: bool,
+    ):
+        self._inner = inner
+        self._on_done = on_done
+        self._start = start
+        self._timed_lines = timed_lines
+        self._chunks: list[bytes] = []
+        self._lines: list[tuple[float, str]] = []
+        self._pending = b""
+        self._done = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._inner:
+            if self._timed_lines:
+                offset = time.monotonic() - self._start
+                *complete, self._pending = (self._pending + chunk).split(b"\n")
+                for line in complete:
+                    if line.strip():
+                        self._lines.append((offset, line.decode()))
+            else:
+                self._chunks.append(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._inner.close()
+        finally:
+            if not self._done:
+                self._done = True
+                if self._timed_lines:
+                    if self._pending.strip():
+                        offset = time.monotonic() - self._start
+                        self._lines.append((offset, self._pending.decode()))
+                    self._on_done(b"", self._lines)
+                else:
+                    self._on_done(b"".join(self._chunks), None)
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport that forwards requests and records responses to a cassette.
+
+    Responses are kept in memory and the cassette is written once, when the
+    transport is closed (or at interpreter exit if it never is).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        inner: httpx.BaseTransport | None = None,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            path: Cassette file to write
+            inner: Transport performing the real requests
+        """
+        self.path = path
+        self.cassette = Cassette()
+        self._inner = inner or httpx.HTTPTransport()
+        self._closed = False
+        atexit.register(self.close)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward a request, recording its response."""
+        timed_lines = _is_stream(request)
+        if timed_lines:
+            # Lines can only be timestamped in an unencoded body
+            request.headers["Accept-Encoding"] = "identity"
+        start = time.monotonic()
+        response = self._inner.handle_request(request)
+
+        def on_done(body: bytes, lines: list[tuple[float, str]] | None) -> None:
+            self.cassette.add(
+                Interaction(
+                    method=request.method,
+                    path=request.url.path,
+                    query=request.url.query.decode(),
+                    status_code=response.status_code,
+                    headers={
+                        k: v
+                        for k, v in response.headers.items()
+                        if k.lower() in _KEPT_HEADERS
+                    },
+                    body=body,
+                    lines=lines,
+                )
+            )
+
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_RecordingStream(response.stream, on_done, start, timed_lines),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        """Write the cassette and close the wrapped transport."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        try:
+            self.cassette.save(self.path)
+        except OSError:
+            logger.warning(f"Failed to save cassette {self.path}", exc_info=True)
+        finally:
+            self._inner.close()
+
+
+class SharedTransport(httpx.BaseTransport):
+    """Lend a transport to short-lived clients without letting them close it."""
+
+    def __init__(self, inner: httpx.BaseTransport):
+        """Initialize the wrapper.
+
+        Args:
+            inner: Transport owned by someone else
+        """
+        self._inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward a request to the shared transport."""
+        return self._inner.handle_request(request)
+
+    def close(self) -> None:
+        """Leave the shared transport open for its owner to close."""
+
+
+class _ReplayStream(httpx.SyncByteStream):
+    """Emit recorded lines, sleeping to reproduce their arrival times."""
+
+    def __init__(self, lines: list[tuple[float, str]], speed: float | None):
+        self._lines = lines
+        self._speed = speed
+        self._closed = threading.Event()
+
+    def __iter__(self) -> Iterator[bytes]:
+        start = time.monotonic()
+        for offset, line in self._lines:
+            if self._speed:
+                delay = offset / self._speed - (time.monotonic() - start)
+                if delay > 0 and self._closed.wait(delay):
+                    return
+            if self._closed.is_set():
+                return
+            yield line.encode() + b"\n"
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Transport that serves responses from a cassette without network access."""
+
+    def __init__(self, cassette: Cassette, speed: float | None = 1.0):
+        """Initialize the replayer.
+
+        Args:
+            cassette: Recorded interactions
+            speed: Playback speed for chat streams (1.0 = as recorded,
+                10.0 = ten times faster, None = no delays)
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be positive or None, got {speed}")
+        self.cassette = cassette
+        self.speed = speed
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve the recorded response for a request."""
+        interaction = self.cassette.find(
+            request.method, request.url.path, request.url.query.decode()
+        )
+        if interaction.lines is not None:
+            return httpx.Response(
+                status_code=interaction.status_code,
+                headers=interaction.headers,
+                stream=_ReplayStream(interaction.lines, self.speed),
+                request=request,
+            )
+        return httpx.Response(
+            status_code=interaction.status_code,
+            headers=interaction.headers,
+            content=interaction.body,
+            request=request,
+        )
@@ -0,0 +1,177 @@
+"""Circuit breaker for failing Louie endpoints."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+import httpx
+
+from ._watchdog import StreamTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Endpoint classes guarded by separate breakers
+ENDPOINT_CLASSES = ("chat", "arrow", "threads")
+
+
+@dataclass
+class RequestOutcome:
+    """Lets a guarded request report failure without raising (e.g. timeouts)."""
+
+    failed: bool = False
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is rejected because its circuit is open."""
+
+    def __init__(self, endpoint: str, failures: int, retry_in: float):
+        """Initialize with breaker state for a helpful message.
+
+        Args:
+            endpoint: Endpoint class that is failing ("chat", "arrow", "threads")
+            failures: Consecutive failures that opened the circuit
+            retry_in: Seconds until a probe request will be allowed
+        """
+        self.endpoint = endpoint
+        self.failures = failures
+        self.retry_in = retry_in
+        super().__init__(
+            f"Louie {endpoint} endpoint is unavailable: circuit open after "
+            f"{failures} consecutive failures. Failing fast; a probe request "
+            f"will be attempted in {retry_in:.1f}s."
+        )
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one endpoint class.
+
+    States:
+        closed: Requests flow normally; failures are counted
+        open: Requests fail immediately with CircuitOpenError
+        half_open: After ``recovery_timeout`` one probe request is let
+            through; success closes the circuit, failure re-opens it
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            endpoint: Endpoint class name used in errors and logs
+            failure_threshold: Consecutive failures before opening
+            recovery_timeout: Seconds to stay open before probing
+        """
+        if failure_threshold < 1:
+            raise ValueError(
+                f"failure_threshold must be at least 1, got {failure_threshold}"
+            )
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout passes."""
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.recovery_timeout
+            ):
+                self._state = self.HALF_OPEN
+            return self._state
+
+    @property
+    def failures(self) -> int:
+        """Consecutive failures recorded."""
+        return self._failures
+
+    def before_request(self) -> None:
+        """Check whether a request may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe
+                already in flight
+        """
+        state = self.state
+        with self._lock:
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                logger.info(f"Louie {self.endpoint} circuit half-open; probing")
+                return
+            retry_in = max(
+                0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)
+            )
+        raise CircuitOpenError(self.endpoint, self._failures, retry_in)
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Louie {self.endpoint} circuit closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"Louie {self.endpoint} circuit opened after "
+                        f"{self._failures} consecutive failures"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """Abandon a half-open probe without recording an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def reset(self) -> None:
+        """Force the circuit closed."""
+        self.record_success()
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """Check whether an error indicates the endpoint itself is failing.
+
+    Transport errors (connect failures, timeouts), stream timeouts and 5xx
+    responses count;
+    client errors such as 401, 404 or 429 do not.
+
+    Args:
+        error: Exception raised by a request
+
+    Returns:
+        True if the error should count towards opening the circuit
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status = getattr(error.response, "status_code", None)
+        return isinstance(status, int) and status >= 500
+    if isinstance(error, httpx.TransportError | StreamTimeoutError):
+        return True
+    cause = error.__cause__
+    return cause is not None and is_endpoint_failure(cause)
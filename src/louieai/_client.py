@@ -1,40 +1,271 @@
 """Enhanced Louie client that matches the documented API."""
 
+import base64
+import hashlib
 import json
 import logging
+import os
 import time
-from dataclasses import dataclass
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
 import httpx
-import pandas as pd
 import pyarrow as pa
 
+from ._backends import (
+    PANDAS,
+    compact_table,
+    convert_table,
+    iter_arrow_batches,
+    project_table,
+    read_arrow_ipc,
+    validate_backend,
+    validate_compression,
+)
+from ._cancel import CancelToken, QueryFuture, run_in_background
+from ._cassette import Cassette, RecordingTransport, ReplayTransport, SharedTransport
+from ._circuit import (
+    ENDPOINT_CLASSES,
+    CircuitBreaker,
+    CircuitOpenError,
+    RequestOutcome,
+    is_endpoint_failure,
+)
+from ._download import Download, DownloadIntegrityError, spool_download
+from ._ingest import to_pandas_optimized
+from ._instrumentation import (
+    ARROW_FETCH,
+    CHAT,
+    FIRST_BYTE,
+    RETRY,
+    Instrumentation,
+    MultiInstrumentation,
+    Operation,
+    StreamEvents,
+    current_operation,
+    instrument,
+    response_attributes,
+)
+from ._metrics import MetricsInstrumentation, MetricsRegistry
+from ._ratelimit import RateLimiter, parse_retry_after
+from ._shared_cache import SharedTableCache
+from ._table_cache import ATTACHED, DEFAULT_CACHE_BYTES, TableCache
+from ._thread_cache import DEFAULT_THREAD_TTL, ThreadCache
+from ._timings import ArrowFetchTiming, QueryTimings, current_timings, record_timings
+from ._watchdog import (
+    CANCELLED,
+    TIMEOUT_REASONS,
+    RequestAborter,
+    StreamDeadlines,
+    StreamTimeoutError,
+    StreamWatchdog,
+)
 from .auth import AuthManager, auto_retry_auth
 
+if TYPE_CHECKING:
+    from ._export import ExportReport
+
 logger = logging.getLogger(__name__)
 
 
+# JWT claims that identify who a token was issued to
+_IDENTITY_CLAIMS = ("user_id", "username", "sub", "org_name", "org")
+
+
+def _digest(secret: str) -> str:
+    """Short, non-reversible fingerprint of a secret."""
+    return hashlib.sha256(secret.encode()).hexdigest()[:32]
+
+
+def _token_identity(token: str) -> str:
+    """Identity claims of a JWT, or a digest of an opaque token."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except (IndexError, ValueError):
+        claims = None
+    if isinstance(claims, dict):
+        identity = {k: claims[k] for k in _IDENTITY_CLAIMS if k in claims}
+        if identity:
+            return json.dumps(identity, sort_keys=True, default=str)
+    return "token:" + _digest(token)
+
+
+@dataclass
+class _ArrowTransfer:
+    """An Arrow block downloaded and decoded by this client."""
+
+    table: pa.Table
+    payload_bytes: int
+    wire_bytes: int | None
+    table_bytes: int
+    decode_s: float
+    download: Download | None = None
+
+
+# Errors fetching or decoding an Arrow block that leave a dataframe element
+# without its table, rather than failing the query
+_DATAFRAME_FETCH_ERRORS = (
+    httpx.HTTPError,
+    pa.ArrowException,
+    DownloadIntegrityError,
+    CircuitOpenError,
+)
+
+
+def _is_unauthorized(error: Exception) -> bool:
+    """Whether an error is the server rejecting the request's credentials."""
+    return (
+        isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 401
+    )
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    """Raise for an error status on a streamed response.
+
+    The error body is read first, so handlers such as the auth manager can
+    inspect its detail.
+    """
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError:
+        response.read()
+        raise
+
+
+def _wire_bytes(response: httpx.Response) -> int | None:
+    """Bytes received for a response before content decoding, if known."""
+    n = getattr(response, "num_bytes_downloaded", None)
+    return n if isinstance(n, int) else None
+
+
+# Element types carrying a dataframe block
+DATAFRAME_TYPES = ("DfElement", "df", "DataFrame", "dataframe")
+
+
+def dataframe_block_id(elem: dict[str, Any]) -> str | None:
+    """Find the Arrow block ID of a dataframe element.
+
+    Args:
+        elem: Dataframe element
+
+    Returns:
+        df_id or block_id, directly or under "data", else the element id
+    """
+    df_id = elem.get("df_id") or elem.get("block_id")
+    if not df_id and isinstance(elem.get("data"), dict):
+        df_id = elem["data"].get("df_id") or elem["data"].get("block_id")
+    return df_id or elem.get("id")
+
+
+def read_chat_stream(
+    opened: AbstractContextManager[tuple[httpx.Response | None, StreamWatchdog]],
+    on_line: Callable[[str], None],
+    timings: QueryTimings,
+    op: Operation | None,
+    timeout_settings: str,
+) -> str | None:
+    """Read a chat stream line by line while its watchdog enforces deadlines.
+
+    Shared by LouieClient and the notebook streaming display, so both end,
+    cancel and time out a stream the same way.
+
+    Args:
+        opened: Context manager opening the stream, yielding the response
+            (None if a deadline passed before the server answered) and the
+            watchdog armed on it
+        on_line: Called with each non-empty line as it arrives
+        timings: Timings of the query, told when the stream ends
+        op: Instrumented chat operation, if instrumentation is enabled
+        timeout_settings: Current timeout options, for the timeout message
+
+    Returns:
+        Why the stream was cut short, or None if it ended normally
+
+    Raises:
+        StreamTimeoutError: If a deadline passed before any line arrived
+        KeyboardInterrupt: If interrupted before any line arrived; once
+            lines have arrived, an interrupt cancels the stream instead
+    """
+    events = StreamEvents(op) if op is not None else None
+    received = 0
+    start_time = time.time()
+    with opened as (response, watchdog):
+        if op is not None and response is not None:
+            op.event(FIRST_BYTE)
+        try:
+            for line in watchdog.iter_lines(response):
+                received += 1
+                if events is not None:
+                    events.on_line(line)
+                on_line(line)
+        except KeyboardInterrupt:
+            # Keep what already arrived; with nothing to keep, let the
+            # interrupt through
+            if not received:
+                raise
+            watchdog.expire(CANCELLED)
+        timings.on_stream_end()
+        if events is not None:
+            events.on_end(watchdog.reason)
+
+        if watchdog.reason in TIMEOUT_REASONS and not received:
+            elapsed = time.time() - start_time
+            raise StreamTimeoutError(
+                f"Louie API timeout ({watchdog.reason}) after "
+                f"{elapsed:.1f}s waiting for response. No data received. "
+                f"Agentic flows can take time - consider increasing "
+                f"timeouts (current: {timeout_settings}). "
+                f"Set them when creating LouieClient.",
+                reason=str(watchdog.reason),
+            )
+        return watchdog.reason
+
+
 @dataclass
 class Thread:
     """Represents a Louie conversation thread."""
 
     id: str
     name: str | None = None
+    # Server timestamp of the latest change, when reported
+    last_modified: str | None = None
 
 
 class Response:
     """Response containing thread_id and multiple elements from a query."""
 
-    def __init__(self, thread_id: str, elements: list[dict[str, Any]]):
+    def __init__(
+        self,
+        thread_id: str,
+        elements: list[dict[str, Any]],
+        *,
+        truncated: bool = False,
+        truncation_reason: str | None = None,
+        timings: QueryTimings | None = None,
+    ):
         """Initialize response with thread ID and elements.
 
         Args:
             thread_id: The thread ID this response belongs to
             elements: List of element dictionaries from the response
+            truncated: Whether the stream was cut short before completing
+            truncation_reason: Why the stream was cut short, e.g.
+                "idle_timeout", "total_timeout", "first_element_timeout" or
+                "cancelled"
+            timings: Breakdown of where the query's time went
         """
         self.thread_id = thread_id
         self.elements = elements
+        self.truncated = truncated
+        self.truncation_reason = truncation_reason
+        self.timings = timings
 
     @property
     def text_elements(self) -> list[dict[str, Any]]:
@@ -96,6 +327,26 @@ class LouieClient:
         server: str | None = None,
         timeout: float = 300.0,  # 5 minutes default for agentic flows
         streaming_timeout: float = 120.0,  # 2 minutes for streaming chunks
+        rate_limit: float | None = None,
+        max_in_flight: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        failure_threshold: int | None = None,
+        recovery_timeout: float = 30.0,
+        first_element_timeout: float | None = None,
+        total_timeout: float | None = None,
+        record_to: str | os.PathLike[str] | None = None,
+        replay_from: str | os.PathLike[str] | None = None,
+        replay_speed: float | None = 1.0,
+        instrumentation: Instrumentation | None = None,
+        metrics: MetricsRegistry | None = None,
+        result_backend: str = PANDAS,
+        spark_staging_dir: str | None = None,
+        arrow_compression: str | None = None,
+        arrow_segments: int | None = None,
+        dataframe_cache_bytes: int = DEFAULT_CACHE_BYTES,
+        shared_cache: SharedTableCache | None = None,
+        optimize_dataframes: bool = False,
+        thread_cache_ttl: float = DEFAULT_THREAD_TTL,
     ):
         """Initialize the Louie client.
 
@@ -111,7 +362,59 @@ class LouieClient:
             api: API version (default: 3)
             server: Graphistry server URL for direct authentication
             timeout: Overall timeout in seconds for requests (default: 300s/5min)
-            streaming_timeout: Timeout for streaming chunks (default: 120s/2min)
+            streaming_timeout: Idle deadline - maximum gap between streamed
+                chunks (default: 120s/2min)
+            rate_limit: Maximum requests per second across chat, Arrow and
+                thread calls (default: unlimited)
+            max_in_flight: Maximum concurrent requests (default: unlimited)
+            rate_limiter: Existing RateLimiter to share with other clients;
+                overrides rate_limit and max_in_flight
+            failure_threshold: Consecutive failures or timeouts per endpoint
+                class (chat, arrow, threads) before its circuit opens and
+                requests fail fast with CircuitOpenError (default: disabled)
+            recovery_timeout: Seconds an open circuit waits before letting a
+                probe request through (default: 30s)
+            first_element_timeout: Maximum wait for the first response element
+                of a chat stream (default: no limit)
+            total_timeout: Maximum duration of a whole chat stream, even
+                while chunks keep arriving (default: no limit)
+            record_to: Record every response to this cassette file for
+                later replay
+            replay_from: Serve responses from this cassette file instead of
+                the server; no network access or authentication is needed
+            replay_speed: Chat stream playback speed when replaying (1.0 =
+                as recorded, None = no delays)
+            instrumentation: Hooks called around chat requests, stream
+                events, Arrow fetches, auth refreshes and retries, e.g.
+                OpenTelemetryInstrumentation (default: none)
+            metrics: Registry to count requests, retries, timeouts and auth
+                refreshes in and time streams and Arrow fetches into; may be
+                shared between clients (default: none)
+            result_backend: Type dataframe elements are returned as:
+                "pandas", "pyarrow", "polars", "duckdb" (a DuckDB
+                relation) or "spark" (default: "pandas")
+            spark_staging_dir: With result_backend="spark", directory where
+                large dataframes are staged as Parquet for the cluster to
+                read, e.g. "/dbfs/tmp/louie" (default: load from memory)
+            arrow_compression: Ask the server to compress Arrow blocks with
+                this IPC buffer codec, "zstd" or "lz4" (default: none). HTTP
+                content encoding is negotiated separately by httpx.
+            arrow_segments: Download Arrow blocks to a temporary file with
+                resumable HTTP Range requests, in up to this many parallel
+                segments when the server supports ranges (default: one
+                in-memory request)
+            dataframe_cache_bytes: Keep decoded dataframe blocks up to this
+                much Arrow memory, so repeated fetches skip the network;
+                concurrent fetches of a block always share one download
+                (default: 256 MiB, 0 to cache nothing)
+            shared_cache: Share fetched dataframe blocks with other
+                processes on this host through memory-mapped files
+            optimize_dataframes: With the pandas backend, categorize
+                low-cardinality strings, keep other strings Arrow-backed and
+                downcast numbers where no value changes (default: False)
+            thread_cache_ttl: Seconds get_thread and get_threads serve
+                cached thread metadata before revalidating it with a
+                conditional request (default: 60, 0 to always revalidate)
 
         Examples:
             # Use existing graphistry authentication
@@ -142,11 +445,71 @@ class LouieClient:
             # Use existing graphistry client
             g = graphistry.nodes(df)
             client = LouieClient(graphistry_client=g)
+
+            # Share one request budget between clients
+            limiter = RateLimiter.shared("den", rate=5, max_in_flight=4)
+            client_a = LouieClient(rate_limiter=limiter)
+            client_b = LouieClient(rate_limiter=limiter)
+
+            # Record a session, then reproduce it offline at 10x speed
+            client = LouieClient(record_to="session.cassette")
+            client = LouieClient(replay_from="session.cassette", replay_speed=10)
+
+            # Export request metrics for Prometheus to scrape
+            metrics = MetricsRegistry()
+            client = LouieClient(metrics=metrics)
+            text = metrics.to_prometheus()
         """
         self.server_url = server_url.rstrip("/")
         self._timeout = timeout
         self._streaming_timeout = streaming_timeout
-        self._client = httpx.Client(timeout=timeout)
+        self._first_element_timeout = first_element_timeout
+        self._total_timeout = total_timeout
+        if metrics is not None:
+            metrics_hooks = MetricsInstrumentation(metrics)
+            instrumentation = (
+                metrics_hooks
+                if instrumentation is None
+                else MultiInstrumentation(instrumentation, metrics_hooks)
+            )
+        self._instrumentation = instrumentation
+        self._result_backend = validate_backend(result_backend)
+        self._spark_staging_dir = spark_staging_dir
+        self._arrow_compression = validate_compression(arrow_compression)
+        if arrow_segments is not None and arrow_segments < 1:
+            raise ValueError(f"arrow_segments must be at least 1, got {arrow_segments}")
+        self._arrow_segments = arrow_segments
+        self._table_cache = TableCache(dataframe_cache_bytes)
+        self._shared_cache = shared_cache
+        self._optimize_dataframes = optimize_dataframes
+        self._thread_cache = ThreadCache(thread_cache_ttl)
+
+        # Optional record/replay of all HTTP traffic
+        if record_to is not None and replay_from is not None:
+            raise ValueError("record_to and replay_from cannot be combined")
+        self._transport: httpx.BaseTransport | None = None
+        if record_to is not None:
+            self._transport = RecordingTransport(record_to)
+        elif replay_from is not None:
+            self._transport = ReplayTransport(
+                Cassette.load(replay_from), speed=replay_speed
+            )
+        self._client = self._http_client(timeout)
+
+        # Optional client-side rate limiting
+        if rate_limiter is None and (
+            rate_limit is not None or max_in_flight is not None
+        ):
+            rate_limiter = RateLimiter(rate=rate_limit, max_in_flight=max_in_flight)
+        self._rate_limiter = rate_limiter
+
+        # Optional per-endpoint circuit breakers
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        if failure_threshold is not None:
+            self._circuit_breakers = {
+                kind: CircuitBreaker(kind, failure_threshold, recovery_timeout)
+                for kind in ENDPOINT_CLASSES
+            }
 
         # Set up authentication
         self._auth_manager = AuthManager(
@@ -193,6 +556,16 @@ class LouieClient:
         """Get the authentication manager."""
         return self._auth_manager
 
+    @property
+    def result_backend(self) -> str:
+        """Type dataframe elements are returned as, e.g. "pandas"."""
+        return self._result_backend
+
+    @result_backend.setter
+    def result_backend(self, value: str) -> None:
+        """Set the type dataframe elements are returned as."""
+        self._result_backend = validate_backend(value)
+
     def register(self, **kwargs: Any) -> "LouieClient":
         """Register authentication credentials (passthrough to graphistry).
 
@@ -209,55 +582,506 @@ class LouieClient:
         self._auth_manager._graphistry_client.register(**kwargs)
         return self
 
-    @auto_retry_auth
-    def _fetch_dataframe_arrow(
-        self, thread_id: str, block_id: str
-    ) -> pd.DataFrame | None:
-        """Fetch a dataframe using Arrow format.
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Get the rate limiter, if one is configured."""
+        return self._rate_limiter
+
+    @property
+    def circuit_breakers(self) -> dict[str, CircuitBreaker]:
+        """Get circuit breakers by endpoint class (empty if disabled)."""
+        return self._circuit_breakers
+
+    @contextmanager
+    def _request_slot(self, kind: str) -> Iterator[RequestOutcome]:
+        """Guard a request with the circuit breaker and rate limiter.
+
+        Args:
+            kind: Endpoint class - "chat", "arrow" or "threads"
+
+        Yields:
+            Outcome to mark as failed when a request fails without raising
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+        """
+        breaker = self._circuit_breakers.get(kind)
+        if breaker is not None:
+            breaker.before_request()
+        outcome = RequestOutcome()
+        try:
+            if self._rate_limiter is None:
+                yield outcome
+            else:
+                with self._rate_limiter.slot():
+                    yield outcome
+        except Exception as e:
+            if breaker is not None:
+                if is_endpoint_failure(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            raise
+        except BaseException:
+            # Interrupted (e.g. KeyboardInterrupt) - no verdict on the endpoint
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+        if breaker is not None:
+            if outcome.failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    def _should_retry_throttled(self, response: httpx.Response, attempt: int) -> bool:
+        """Report a response to the rate limiter and decide whether to retry.
+
+        Args:
+            response: Response whose headers have been received
+            attempt: Zero-based attempt number for this request
+
+        Returns:
+            True if the response was a 429 and the request should be retried
+        """
+        if self._rate_limiter is None:
+            return False
+        if response.status_code != 429:
+            self._rate_limiter.on_success()
+            return False
+        self._rate_limiter.on_throttle(
+            parse_retry_after(response.headers.get("Retry-After"))
+        )
+        retry = attempt < self._rate_limiter.max_retries
+        op = current_operation()
+        if retry and op is not None:
+            op.event(RETRY, **{"http.status_code": 429, "louie.attempt": attempt + 1})
+        return retry
+
+    def _http_client(self, timeout: float | httpx.Timeout) -> httpx.Client:
+        """Create an HTTP client, routed through any record/replay transport."""
+        if self._transport is None:
+            return httpx.Client(timeout=timeout)
+        return httpx.Client(timeout=timeout, transport=SharedTransport(self._transport))
+
+    def _timeout_settings(self) -> str:
+        """Describe the stream timeout options, for timeout messages."""
+        return (
+            f"streaming_timeout={self._streaming_timeout}, "
+            f"first_element_timeout={self._first_element_timeout}, "
+            f"total_timeout={self._total_timeout}"
+        )
+
+    def _stream_deadlines(self) -> StreamDeadlines:
+        """Get the deadlines enforced on chat streams."""
+        return StreamDeadlines(
+            total=self._total_timeout,
+            idle=self._streaming_timeout,
+            first_element=self._first_element_timeout,
+        )
+
+    @contextmanager
+    def _open_chat_stream(
+        self,
+        stream_client: httpx.Client,
+        headers: dict[str, str],
+        params: dict[str, str],
+        cancel_token: CancelToken | None = None,
+    ) -> Iterator[tuple[httpx.Response | None, StreamWatchdog]]:
+        """Open the chat stream, retrying while the server throttles us.
+
+        The watchdog and cancel token are armed before the request is sent,
+        so deadlines and cancellation also cover a server that never
+        answers.
+
+        Args:
+            stream_client: HTTP client configured with streaming timeouts
+            headers: Request headers
+            params: Chat query parameters
+            cancel_token: Token that aborts the stream when cancelled
+
+        Yields:
+            Streaming response with a successful status (None if the
+            watchdog stopped the request before the server answered), and
+            the running watchdog enforcing the client's deadlines on it
+        """
+        timings = current_timings()
+        aborter = RequestAborter(timings.http_trace if timings is not None else None)
+        attempt = 0
+        with StreamWatchdog(
+            self._stream_deadlines(), on_expire=aborter.abort
+        ) as watchdog:
+            if cancel_token is not None:
+                cancel_token.attach(watchdog)
+            try:
+                while True:
+                    with self._request_slot("chat") as outcome, ExitStack() as stack:
+                        response = None
+                        try:
+                            if not watchdog.expired:
+                                response = stack.enter_context(
+                                    stream_client.stream(
+                                        "POST",
+                                        f"{self.server_url}/api/chat/",
+                                        headers=headers,
+                                        params=params,
+                                        extensions={"trace": aborter.trace},
+                                    )
+                                )
+                        except httpx.TransportError:
+                            if not watchdog.expired:
+                                raise
+                        if response is not None:
+                            if self._should_retry_throttled(response, attempt):
+                                attempt += 1
+                                continue
+                            _raise_for_status(response)
+                            aborter.set_response(response)
+                            if timings is not None:
+                                timings.on_headers()
+                        yield response, watchdog
+                        # A timed-out stream counts against the circuit even
+                        # though its partial result is returned
+                        outcome.failed = watchdog.reason in TIMEOUT_REASONS
+                        return
+            finally:
+                if cancel_token is not None:
+                    cancel_token.detach()
+
+    def _get(self, kind: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a guarded GET request, retrying when throttled.
+
+        Args:
+            kind: Endpoint class - "arrow" or "threads"
+            url: Request URL
+            **kwargs: Passed through to httpx.Client.get
+
+        Returns:
+            Successful response
+
+        Raises:
+            httpx.HTTPStatusError: On error status after any retries
+        """
+        attempt = 0
+        while True:
+            with self._request_slot(kind):
+                response = self._client.get(url, **kwargs)
+                if self._should_retry_throttled(response, attempt):
+                    attempt += 1
+                    continue
+                # Not Modified answers a conditional request; callers check it
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+
+    @contextmanager
+    def _stream_get(
+        self, kind: str, url: str, **kwargs: Any
+    ) -> Iterator[httpx.Response]:
+        """Send a guarded GET request and stream its body, retrying when throttled.
+
+        The request slot is held until the body has been read.
+
+        Args:
+            kind: Endpoint class - "arrow" or "threads"
+            url: Request URL
+            **kwargs: Passed through to httpx.Client.stream
+
+        Yields:
+            Successful response, body not yet read
+
+        Raises:
+            httpx.HTTPStatusError: On error status after any retries
+        """
+        attempt = 0
+        while True:
+            with self._request_slot(kind):
+                with self._client.stream("GET", url, **kwargs) as response:
+                    if self._should_retry_throttled(response, attempt):
+                        attempt += 1
+                        continue
+                    _raise_for_status(response)
+                    yield response
+                    return
+
+    def iter_dataframe_batches(
+        self, thread_id: str, block_id: str, batch_rows: int | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream a dataframe block as Arrow record batches.
+
+        Batches are decoded as they come off the wire, so a block larger
+        than memory can be written out piece by piece.
 
         Args:
             thread_id: The thread ID
             block_id: The block ID for the dataframe
+            batch_rows: Split batches larger than this many rows
+
+        Yields:
+            Arrow record batches, in order
+
+        Raises:
+            httpx.HTTPStatusError: If the block cannot be fetched
+
+        Example:
+            >>> import pyarrow.parquet as pq
+            >>> with pq.ParquetWriter("out.parquet", schema) as writer:
+            ...     for batch in client.iter_dataframe_batches(tid, bid):
+            ...         writer.write_batch(batch)
+        """
+        url = f"{self.server_url}/api/dthread/{thread_id}/df/block/{block_id}/arrow"
+        kwargs: dict[str, Any] = {"headers": self._get_headers()}
+        if self._arrow_compression is not None:
+            kwargs["params"] = self._arrow_params()
+        with self._stream_get("arrow", url, **kwargs) as response:
+            yield from iter_arrow_batches(response.iter_bytes(), batch_rows)
+
+    def _arrow_params(self) -> dict[str, Any]:
+        """Query parameters common to every Arrow block request."""
+        if self._arrow_compression is None:
+            return {}
+        return {"compression": self._arrow_compression}
+
+    def _download_arrow(
+        self, url: str, headers: dict[str, str], params: dict[str, Any]
+    ) -> Download:
+        """Download an Arrow block through a temporary file with Range requests.
+
+        Args:
+            url: Block URL
+            headers: Request headers
+            params: Query parameters
 
         Returns:
-            DataFrame or None if fetch fails
+            The memory-mapped body and transfer details
         """
-        try:
-            headers = self._get_headers()
-            url = f"{self.server_url}/api/dthread/{thread_id}/df/block/{block_id}/arrow"
 
-            response = self._client.get(url, headers=headers)
-            response.raise_for_status()
+        def open_stream(extra: dict[str, str]) -> Any:
+            kwargs: dict[str, Any] = {"headers": {**headers, **extra}}
+            if params:
+                kwargs["params"] = params
+            return self._stream_get("arrow", url, **kwargs)
 
-            # Parse Arrow format
-            # Try file format first (most common), then stream format
-            try:
-                file_reader = pa.ipc.open_file(response.content)
-                table = file_reader.read_all()
-            except Exception:
-                # Fallback to stream format
-                stream_reader = pa.ipc.open_stream(response.content)
-                table = stream_reader.read_all()
+        return spool_download(open_stream, segments=self._arrow_segments or 1)
 
-            # Convert to pandas
-            df = table.to_pandas()
-            return df
+    def _transfer_table(
+        self,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any],
+        columns: list[str] | None,
+        limit: int | None,
+        offset: int | None,
+        projected: bool,
+    ) -> "_ArrowTransfer":
+        """Download an Arrow block and decode it into a projected table.
 
-        except Exception as e:
-            import warnings
+        Args:
+            url: Block URL
+            headers: Request headers
+            params: Query parameters
+            columns: Columns to keep, if selected
+            limit: Maximum rows to keep
+            offset: Rows to skip first
+            projected: Whether a selection or window was requested
 
-            warnings.warn(
-                f"Failed to fetch dataframe {block_id} from thread {thread_id}. "
-                f"URL: {url if 'url' in locals() else 'not constructed'}. "
-                f"Error: {type(e).__name__}: {e}",
-                RuntimeWarning,
-                stacklevel=2,
-            )
-            logger.debug("Full error details: ", exc_info=True)
-            return None
+        Returns:
+            Decoded table and transfer details
+        """
+        download = None
+        if self._arrow_segments is not None:
+            download = self._download_arrow(url, headers, params)
+            payload = download.buffer
+            wire_bytes: int | None = download.wire_bytes
+        else:
+            if params:
+                response = self._get("arrow", url, headers=headers, params=params)
+            else:
+                response = self._get("arrow", url, headers=headers)
+            payload = response.content
+            wire_bytes = _wire_bytes(response)
+        decode_start = time.perf_counter()
+
+        # Decode without copying
+        table = read_arrow_ipc(payload)
+        table_bytes = table.nbytes
+        if projected:
+            projection = project_table(table, columns, limit, offset)
+            # Copy a smaller selection off the payload so cached tables do not
+            # keep the whole block alive
+            if projection.nbytes < table.nbytes:
+                projection = compact_table(projection)
+            table = projection
+        return _ArrowTransfer(
+            table=table,
+            payload_bytes=len(payload),
+            wire_bytes=wire_bytes,
+            table_bytes=table_bytes,
+            decode_s=time.perf_counter() - decode_start,
+            download=download,
+        )
+
+    @auto_retry_auth
+    def _fetch_dataframe_arrow(
+        self,
+        thread_id: str,
+        block_id: str,
+        columns: list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> Any:
+        """Fetch a dataframe using Arrow format.
+
+        Column selection and the rows up to the end of the window are sent
+        to the server as query parameters; the selection is applied again and
+        the window sliced while decoding, which is correct whether or not the
+        server applied them.
+
+        Args:
+            thread_id: The thread ID
+            block_id: The block ID for the dataframe
+            columns: Only fetch these columns, in this order
+            limit: Fetch at most this many rows
+            offset: Skip this many rows first
+
+        Returns:
+            Dataframe in the client's result backend, or None if the block
+            cannot be downloaded or decoded
+
+        Raises:
+            ValueError: If limit or offset is negative
+            KeyError: If a requested column does not exist
+            ImportError: If the result backend's package is not installed
+            httpx.HTTPStatusError: If the server rejects the credentials,
+                including after a token refresh
+        """
+        if (limit is not None and limit < 0) or (offset is not None and offset < 0):
+            raise ValueError("limit and offset must not be negative")
+        params = self._arrow_params()
+        projected = columns is not None or limit is not None or bool(offset)
+        if columns is not None:
+            params["columns"] = list(columns)
+        if limit is not None:
+            # Servers are not asked to skip rows: one that ignored the offset
+            # could not be told apart from one that applied it, so only the
+            # first offset + limit rows are requested and sliced locally
+            params["limit"] = (offset or 0) + limit
+
+        with instrument(
+            self._instrumentation,
+            ARROW_FETCH,
+            {"louie.thread_id": thread_id, "louie.block_id": block_id},
+        ) as op:
+            try:
+                headers = self._get_headers()
+                if op is not None:
+                    headers = op.inject(headers)
+                url = (
+                    f"{self.server_url}/api/dthread/{thread_id}"
+                    f"/df/block/{block_id}/arrow"
+                )
+
+                # Concurrent and repeated fetches of the same block and
+                # window share one download and decoded table
+                key = (
+                    thread_id,
+                    block_id,
+                    None if columns is None else tuple(columns),
+                    limit,
+                    offset or 0,
+                )
+                transfers: list[_ArrowTransfer] = []
+                attached: list[bool] = []
+
+                def transfer() -> pa.Table:
+                    shared_key = (self.server_url, self._cache_identity(headers), *key)
+                    if self._shared_cache is not None:
+                        table = self._shared_cache.load(shared_key)
+                        if table is not None:
+                            attached.append(True)
+                            return table
+                    transfers.append(
+                        self._transfer_table(
+                            url, headers, params, columns, limit, offset, projected
+                        )
+                    )
+                    if self._shared_cache is not None:
+                        return self._shared_cache.store(shared_key, transfers[0].table)
+                    return transfers[0].table
+
+                fetch_start = time.perf_counter()
+                table, cache = self._table_cache.get(key, transfer)
+                if attached:
+                    cache = ATTACHED
+                pandas_start = time.perf_counter()
+                report = None
+                if self._optimize_dataframes and self._result_backend == PANDAS:
+                    df, report = to_pandas_optimized(table)
+                else:
+                    df = convert_table(
+                        table, self._result_backend, self._spark_staging_dir
+                    )
+                done = transfers[0] if transfers else None
+
+                timings = current_timings()
+                if timings is not None:
+                    timings.arrow_fetches.append(
+                        ArrowFetchTiming(
+                            block_id=block_id,
+                            fetch_s=pandas_start
+                            - fetch_start
+                            - (done.decode_s if done else 0.0),
+                            bytes=done.payload_bytes if done else 0,
+                            decode_s=done.decode_s if done else 0.0,
+                            pandas_s=time.perf_counter() - pandas_start,
+                            start_s=timings.elapsed(fetch_start),
+                            wire_bytes=done.wire_bytes if done else None,
+                            table_bytes=done.table_bytes if done else None,
+                            cache=cache,
+                            pandas_bytes_saved=report.saved_bytes if report else None,
+                        )
+                    )
+                if op is not None:
+                    op.attributes.update(
+                        {
+                            "louie.arrow.rows": table.num_rows,
+                            "louie.arrow.columns": table.num_columns,
+                            "louie.arrow.cache": cache,
+                        }
+                    )
+                    if done is not None:
+                        op.attributes["louie.arrow.bytes"] = done.payload_bytes
+                    if report is not None:
+                        op.attributes["louie.pandas.bytes"] = report.after_bytes
+                        op.attributes["louie.pandas.bytes_saved"] = report.saved_bytes
+                    if done is not None and done.download is not None:
+                        op.attributes["louie.arrow.segments"] = done.download.segments
+                        op.attributes["louie.arrow.resumes"] = done.download.resumes
+                return df
+
+            except _DATAFRAME_FETCH_ERRORS as e:
+                if _is_unauthorized(e):
+                    # Left to auto_retry_auth to refresh the token and retry
+                    raise
+                import warnings
+
+                if op is not None:
+                    op.attributes["error.type"] = type(e).__name__
+
+                warnings.warn(
+                    f"Failed to fetch dataframe {block_id} from thread {thread_id}. "
+                    f"URL: {url if 'url' in locals() else 'not constructed'}. "
+                    f"Error: {type(e).__name__}: {e}",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                logger.debug("Full error details: ", exc_info=True)
+                return None
 
     def _get_headers(self) -> dict[str, str]:
         """Get authorization headers using auth manager."""
+        if isinstance(self._transport, ReplayTransport):
+            # Replayed responses need no credentials
+            return {}
         token = self._auth_manager.get_token()
         headers = {"Authorization": f"Bearer {token}"}
 
@@ -273,6 +1097,29 @@ class LouieClient:
 
         return headers
 
+    def _cache_identity(self, headers: dict[str, str]) -> str:
+        """Identify the user and organization requests are made as.
+
+        Keys in a SharedTableCache include it, so only processes acting as
+        the same user share tables. The configured credentials name the user
+        when given; otherwise the auth token's identity claims do, or failing
+        that a digest of the token itself.
+
+        Args:
+            headers: Request headers from _get_headers()
+
+        Returns:
+            Identity string; holds no secrets
+        """
+        credentials = getattr(self._auth_manager, "_credentials", None) or {}
+        user = credentials.get("username") or credentials.get("personal_key_id")
+        if not user and credentials.get("api_key"):
+            user = "key:" + _digest(credentials["api_key"])
+        if not user:
+            token = headers.get("Authorization", "").removeprefix("Bearer ")
+            user = _token_identity(token)
+        return f"{user}@{headers.get('X-Graphistry-Org', '')}"
+
     def _to_slug(self, text: str) -> str:
         """Convert text to slug format.
 
@@ -300,16 +1147,36 @@ class LouieClient:
         - dthread_id: The thread ID
         - elements: List of response elements
         """
+        return self._parse_jsonl_lines(response_text.strip().split("\n"))
+
+    def _parse_jsonl_lines(
+        self,
+        lines: list[str],
+        arrivals: list[float] | None = None,
+        timings: QueryTimings | None = None,
+    ) -> dict[str, Any]:
+        """Parse JSONL response lines into structured data.
+
+        Args:
+            lines: Response lines
+            arrivals: perf_counter() reading when each line arrived
+            timings: Record to note thread id and element arrivals in
+
+        Returns:
+            Dict with dthread_id and elements, as _parse_jsonl_response
+        """
         result: dict[str, Any] = {"dthread_id": None, "elements": []}
 
         # Track elements by ID to handle streaming updates
         elements_by_id: dict[str, dict[str, Any]] = {}
 
-        for line in response_text.strip().split("\n"):
+        for i, line in enumerate(lines):
             if not line:
                 continue
             try:
                 data = json.loads(line)
+                if timings is not None and arrivals is not None:
+                    timings.on_line(data, arrivals[i])
 
                 # First line contains thread ID
                 if "dthread_id" in data:
@@ -381,21 +1248,29 @@ class LouieClient:
         *,
         traces: bool = False,
         share_mode: str = "Private",
+        cancel_token: CancelToken | None = None,
+        fetch_dataframes: bool = True,
     ) -> Response:
         """Add a cell (query) to a thread and get response.
 
+        Cancelling ``cancel_token``, or interrupting with Ctrl-C once output
+        has started arriving, closes the stream and returns the elements
+        received so far with ``truncation_reason="cancelled"``.
+
         Args:
             thread_id: Thread ID to add to (empty string creates new thread)
             prompt: Natural language query
             agent: Agent to use (default: LouieAgent)
             traces: Whether to include reasoning traces in response (default: False)
             share_mode: Visibility mode - "Private", "Organization", or "Public"
+            cancel_token: Token for cancelling the query from another thread
+            fetch_dataframes: Download dataframe elements into their "table"
+                (default: True); turn off to stream large ones later with
+                iter_dataframe_batches()
 
         Returns:
             Response object containing thread_id and all elements
         """
-        headers = self._get_headers()
-
         # Build query parameters
         params: dict[str, str] = {
             "query": prompt,
@@ -409,74 +1284,87 @@ class LouieClient:
         if thread_id:
             params["dthread_id"] = thread_id
 
-        # Make streaming request with custom timeout handling
-        response_text = ""
-        lines_received = 0
+        with instrument(
+            self._instrumentation,
+            CHAT,
+            {
+                "louie.thread_id": thread_id or None,
+                "louie.agent": agent,
+                "louie.share_mode": share_mode,
+            },
+        ) as op:
+            response = self._stream_cell(
+                thread_id, params, cancel_token, op, fetch_dataframes
+            )
+            self._thread_cache.invalidate(response.thread_id)
+            if op is not None:
+                op.attributes.update(
+                    response_attributes(response.thread_id, response.elements)
+                )
+                op.attributes["louie.truncation_reason"] = response.truncation_reason
+            return response
+
+    def _stream_cell(
+        self,
+        thread_id: str,
+        params: dict[str, str],
+        cancel_token: CancelToken | None,
+        op: Operation | None,
+        fetch_dataframes: bool = True,
+    ) -> Response:
+        """Stream a query's response and fetch its dataframes.
+
+        Args:
+            thread_id: Thread ID the query was added to (may be empty)
+            params: Chat query parameters
+            cancel_token: Token for cancelling the query from another thread
+            op: Instrumented chat operation, if instrumentation is enabled
+            fetch_dataframes: Whether to download dataframe elements
+
+        Returns:
+            Response object containing thread_id and all elements
+        """
+        # add_cell's auth retry opens the timings, so a refresh between
+        # attempts is recorded against this query
+        timings = current_timings() or QueryTimings()
+        headers = self._get_headers()
+        timings.headers_s = timings.elapsed()
+        if op is not None:
+            headers = op.inject(headers)
+
+        # Make streaming request; the watchdog enforces total, idle and
+        # first-element deadlines and ends the stream early when one passes
+        lines: list[str] = []
+        arrivals: list[float] = []
         start_time = time.time()
 
-        # Use configured timeouts
-        stream_client = httpx.Client(
-            timeout=httpx.Timeout(
-                self._timeout,  # Overall timeout
-                read=self._streaming_timeout,  # Per-chunk timeout
-            )
+        def on_line(line: str) -> None:
+            lines.append(line)
+            arrivals.append(time.perf_counter())
+
+        # httpx read timeout backs up the watchdog's idle deadline
+        stream_client = self._http_client(
+            httpx.Timeout(self._timeout, read=self._streaming_timeout)
         )
 
-        with stream_client:
-            with stream_client.stream(
-                "POST", f"{self.server_url}/api/chat/", headers=headers, params=params
-            ) as response:
-                response.raise_for_status()
-
-                # Collect streaming lines
-                last_activity = start_time
-                try:
-                    for line in response.iter_lines():
-                        if line:
-                            response_text += line + "\n"
-                            lines_received += 1
-                            last_activity = time.time()
-
-                            # Keep reading all elements until stream ends
-                            # Don't break early just because we got a text element
-
-                        # Only timeout if no activity for streaming_timeout duration
-                        # Allow total_timeout for overall request
-                        # but don't break active streams
-                        time_since_activity = time.time() - last_activity
-                        if time_since_activity > self._streaming_timeout:
-                            logger.warning(
-                                f"Streaming timeout after {time_since_activity:.1f}s "
-                                f"of inactivity. "
-                                f"Received {lines_received} lines. "
-                                f"This may result in truncated responses."
-                            )
-                            break
-
-                except httpx.ReadTimeout as e:
-                    elapsed = time.time() - start_time
-                    # Accept any response with at least the thread ID line
-                    # Don't require minimum line count that could drop
-                    # valid short responses
-                    if lines_received >= 1:
-                        logger.debug(
-                            f"ReadTimeout after {elapsed:.1f}s with "
-                            f"{lines_received} lines received. "
-                            f"Treating as complete response."
-                        )
-                    else:
-                        raise RuntimeError(
-                            f"Louie API timeout after {elapsed:.1f}s waiting for "
-                            f"response. Only received {lines_received} lines. "
-                            f"Agentic flows can take time - consider increasing "
-                            f"timeout (current: {self._streaming_timeout}s per chunk, "
-                            f"{self._timeout}s total). "
-                            f"Set timeout parameter when creating LouieClient."
-                        ) from e
+        with stream_client, record_timings(timings):
+            truncation_reason = read_chat_stream(
+                self._open_chat_stream(stream_client, headers, params, cancel_token),
+                on_line,
+                timings,
+                op,
+                self._timeout_settings(),
+            )
+
+        if truncation_reason == CANCELLED:
+            logger.warning(
+                f"Louie query cancelled after {time.time() - start_time:.1f}s; "
+                f"returning {len(lines)} partial lines"
+            )
 
         # Log if request took a long time
         total_time = time.time() - start_time
-        if total_time > 30:
+        if total_time > 30 and truncation_reason != CANCELLED:
             import warnings
 
             warnings.warn(
@@ -485,31 +1373,25 @@ class LouieClient:
                 f"seeing timeouts, consider increasing the timeout parameter "
                 f"when creating LouieClient.",
                 RuntimeWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
 
         # Parse JSONL response
-        result = self._parse_jsonl_response(response_text)
+        result = self._parse_jsonl_lines(lines, arrivals, timings)
 
-        # Get the thread ID
+        # Get the thread ID (a query cancelled early may not have one yet)
         actual_thread_id = result["dthread_id"]
+        if actual_thread_id is None and truncation_reason == CANCELLED:
+            actual_thread_id = thread_id
 
         # Fetch dataframes for any DfElements
-        for elem in result["elements"]:
-            if elem.get("type") in ["DfElement", "df", "DataFrame", "dataframe"]:
-                # Check for df_id, block_id, or id (including nested data)
-                df_id = elem.get("df_id") or elem.get("block_id")
-
-                # Check nested data field if exists
-                if not df_id and isinstance(elem.get("data"), dict):
-                    df_id = elem["data"].get("df_id") or elem["data"].get("block_id")
-
-                # Fall back to element ID if no specific df_id found
-                if not df_id:
-                    df_id = elem.get("id")
+        for elem in result["elements"] if fetch_dataframes else []:
+            if elem.get("type") in DATAFRAME_TYPES:
+                df_id = dataframe_block_id(elem)
                 if df_id:
                     # Fetch the actual dataframe via Arrow
-                    df = self._fetch_dataframe_arrow(actual_thread_id, df_id)
+                    with record_timings(timings):
+                        df = self._fetch_dataframe_arrow(actual_thread_id, df_id)
                     if df is not None:
                         elem["table"] = df
                     else:
@@ -521,7 +1403,14 @@ class LouieClient:
                     logger.warning(f"DfElement missing identifier: {elem}")
 
         # Return Response with all elements
-        return Response(thread_id=actual_thread_id, elements=result["elements"])
+        timings.total_s = timings.elapsed()
+        return Response(
+            thread_id=actual_thread_id,
+            elements=result["elements"],
+            truncated=truncation_reason is not None,
+            truncation_reason=truncation_reason,
+            timings=timings,
+        )
 
     def __call__(
         self,
@@ -531,6 +1420,7 @@ class LouieClient:
         traces: bool = False,
         agent: str = "LouieAgent",
         share_mode: str = "Private",
+        cancel_token: CancelToken | None = None,
         **kwargs: Any,
     ) -> Response:
         """Make the client callable for ergonomic usage.
@@ -547,6 +1437,7 @@ class LouieClient:
             traces: Whether to include reasoning traces
             agent: Agent to use (default: LouieAgent)
             share_mode: Visibility mode - "Private", "Organization", or "Public"
+            cancel_token: Token for cancelling the query from another thread
             **kwargs: Additional arguments (reserved for future use)
 
         Returns:
@@ -570,6 +1461,7 @@ class LouieClient:
             agent=agent,
             traces=traces,
             share_mode=share_mode,
+            cancel_token=cancel_token,
         )
 
         # Store thread_id for next call
@@ -578,57 +1470,355 @@ class LouieClient:
 
         return response
 
-    @auto_retry_auth
-    def list_threads(self, page: int = 1, page_size: int = 20) -> list[Thread]:
+    def submit(
+        self,
+        prompt: str,
+        *,
+        thread_id: str | None = None,
+        traces: bool = False,
+        agent: str = "LouieAgent",
+        share_mode: str = "Private",
+    ) -> QueryFuture:
+        """Run a query in the background.
+
+        ```python
+        future = client.submit("Summarize last week's alerts")
+        ...
+        future.cancel()  # Stop early, keeping what has arrived
+        response = future.result()
+        ```
+
+        In asyncio code the future can be awaited directly; cancelling the
+        awaiting task cancels the query.
+
+        Args:
+            prompt: Natural language query
+            thread_id: Thread ID to use (None continues the current thread)
+            traces: Whether to include reasoning traces
+            agent: Agent to use (default: LouieAgent)
+            share_mode: Visibility mode - "Private", "Organization", or "Public"
+
+        Returns:
+            QueryFuture resolving to the Response; a running query that is
+            cancelled resolves to a partial Response flagged ``truncated``
+        """
+        return run_in_background(
+            lambda token: self(
+                prompt,
+                thread_id=thread_id,
+                traces=traces,
+                agent=agent,
+                share_mode=share_mode,
+                cancel_token=token,
+            )
+        )
+
+    def list_threads(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        sort_by: str = "last_modified",
+        sort_order: str = "desc",
+        **filters: Any,
+    ) -> list[Thread]:
         """List available threads.
 
         Args:
             page: Page number (1-based)
-            page_size: Number of items per page
+            page_size: Number of items per page; the server may serve fewer
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            **filters: Further query parameters, passed to the server as-is
 
         Returns:
             List of Thread objects
         """
+        threads, _ = self._list_threads_page(
+            page, page_size, sort_by, sort_order, **filters
+        )
+        return threads
+
+    @auto_retry_auth
+    def _list_threads_page(
+        self,
+        page: int,
+        page_size: int,
+        sort_by: str,
+        sort_order: str,
+        **filters: Any,
+    ) -> tuple[list[Thread], bool]:
+        """Fetch one page of the thread listing.
+
+        Returns:
+            The page's threads, and whether it is the last page: it is empty,
+            shorter than the page size the server reports serving, the
+            server says there are no more, or the ``total`` it reports is
+            covered
+        """
         headers = self._get_headers()
 
-        response = self._client.get(
+        response = self._get(
+            "threads",
             f"{self.server_url}/api/dthreads",
             headers=headers,
             params={
+                **filters,
                 "page": page,
                 "page_size": page_size,
-                "sort_by": "last_modified",
-                "sort_order": "desc",
+                "sort_by": sort_by,
+                "sort_order": sort_order,
             },
         )
-        response.raise_for_status()
 
         data = response.json()
+        items = data.get("items") or []
         threads = []
-        for item in data.get("items", []):
-            threads.append(Thread(id=item.get("id", ""), name=item.get("name")))
+        for item in items:
+            threads.append(
+                Thread(
+                    id=item.get("id", ""),
+                    name=item.get("name"),
+                    last_modified=item.get("last_modified"),
+                )
+            )
 
-        return threads
+        # Pages are numbered in the page size the server actually served
+        total = data.get("total")
+        reported = data.get("page_size")
+        served = reported or len(items)
+        last = (
+            not items
+            or (isinstance(reported, int) and len(items) < reported)
+            or data.get("has_more") is False
+            or (isinstance(total, int) and (page - 1) * served + len(items) >= total)
+        )
+        return threads, last
+
+    def iter_threads(
+        self,
+        page_size: int = 100,
+        prefetch: int = 2,
+        sort_by: str = "last_modified",
+        sort_order: str = "desc",
+        **filters: Any,
+    ) -> Iterator[Thread]:
+        """Iterate over every thread, fetching pages ahead in the background.
+
+        While the caller works through one page, the next ``prefetch``
+        pages are already being requested, so enumerating many threads is
+        bound by bandwidth rather than round trips. Iteration stops once
+        the server reports no more threads, or at a page that is short or
+        adds no new threads. Servers may serve fewer threads per page than
+        asked for, so a page only counts as short against the page size the
+        server reports or, failing that, the largest page it has served.
+        Requests for pages beyond the last are cancelled or their results
+        discarded. A thread pushed onto a later page while iterating, e.g.
+        because another was added, is yielded only once.
+
+        Args:
+            page_size: Threads per request
+            prefetch: Pages to request ahead of the one being consumed;
+                0 fetches one page at a time
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            **filters: Further query parameters, passed to the server as-is
+
+        Yields:
+            Thread objects, in the requested order
+
+        Raises:
+            ValueError: If page_size is below 1 or prefetch is negative
+            httpx.HTTPStatusError: If a page cannot be fetched
+
+        Example:
+            >>> for thread in client.iter_threads(page_size=200, prefetch=4):
+            ...     print(thread.id, thread.name)
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        if prefetch < 0:
+            raise ValueError(f"prefetch must not be negative, got {prefetch}")
+
+        def fetch(page: int) -> tuple[list[Thread], bool]:
+            return self._list_threads_page(
+                page, page_size, sort_by, sort_order, **filters
+            )
+
+        pool = ThreadPoolExecutor(
+            max_workers=prefetch + 1, thread_name_prefix="louie-threads"
+        )
+        pending: deque[Future[tuple[list[Thread], bool]]] = deque()
+        next_page = 1
+        # Ids on the most recent pages; pages in flight were fetched at
+        # different times, so a shifted thread can reappear that far on
+        recent: deque[set[str]] = deque(maxlen=prefetch + 2)
+        # Largest page served so far, standing in for a page size the
+        # server capped without saying so
+        largest = 0
+        try:
+            while True:
+                while len(pending) <= prefetch:
+                    pending.append(pool.submit(fetch, next_page))
+                    next_page += 1
+                threads, last = pending.popleft().result()
+                ids = set()
+                for thread in threads:
+                    if thread.id in ids or any(thread.id in s for s in recent):
+                        continue
+                    ids.add(thread.id)
+                    yield thread
+                recent.append(ids)
+                largest = max(largest, len(threads))
+                # A page of only known threads means the server is not
+                # paging, e.g. it ignores the page parameter
+                if last or not ids or len(threads) < min(page_size, largest):
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
 
     @auto_retry_auth
     def get_thread(self, thread_id: str) -> Thread:
         """Get a specific thread by ID.
 
+        Metadata is cached for ``thread_cache_ttl`` seconds, then revalidated
+        with the ETag or Last-Modified time the server sent.
+
         Args:
             thread_id: Thread ID to retrieve
 
         Returns:
             Thread object
         """
+        thread = self._thread_cache.fresh(thread_id)
+        if thread is not None:
+            return thread
+
+        url = f"{self.server_url}/api/dthreads/{thread_id}"
+        headers = {**self._get_headers(), **self._thread_cache.validators(thread_id)}
+        response = self._get("threads", url, headers=headers)
+        if response.status_code == 304:
+            thread = self._thread_cache.revalidated(thread_id)
+            if thread is not None:
+                return thread
+            # Evicted since the request was sent; fetch it in full
+            response = self._get("threads", url, headers=self._get_headers())
+
+        data = response.json()
+        thread = Thread(
+            id=data.get("id", ""),
+            name=data.get("name"),
+            last_modified=data.get("last_modified"),
+        )
+        self._thread_cache.store(
+            thread_id,
+            thread,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        return thread
+
+    def get_threads(
+        self, thread_ids: Iterable[str], concurrency: int = 8
+    ) -> list[Thread]:
+        """Get many threads by ID, fetching uncached ones concurrently.
+
+        Threads looked up within the last ``thread_cache_ttl`` seconds are
+        served from memory. The rest are requested in parallel, as
+        conditional requests when an older copy is cached, so unchanged
+        threads cost an empty 304 response.
+
+        Args:
+            thread_ids: Thread IDs to retrieve; duplicates are fetched once
+            concurrency: Requests in flight at the same time
+
+        Returns:
+            Thread objects, in the order of thread_ids; a repeated id gets a
+            copy of its own
+
+        Raises:
+            ValueError: If concurrency is below 1
+            httpx.HTTPStatusError: If a thread cannot be fetched
+
+        Example:
+            >>> threads = client.get_threads(ids, concurrency=16)
+            >>> names = {t.id: t.name for t in threads}
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        ids = list(thread_ids)
+        found: dict[str, Thread] = {}
+        missing = []
+        for thread_id in dict.fromkeys(ids):
+            thread = self._thread_cache.fresh(thread_id)
+            if thread is None:
+                missing.append(thread_id)
+            else:
+                found[thread_id] = thread
+
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(missing)),
+                thread_name_prefix="louie-threads",
+            ) as pool:
+                found.update(
+                    zip(missing, pool.map(self.get_thread, missing), strict=True)
+                )
+        return [replace(found[thread_id]) for thread_id in ids]
+
+    @auto_retry_auth
+    def _get_thread_detail(self, thread_id: str) -> dict[str, Any]:
+        """Fetch a thread's full record, including its elements.
+
+        Args:
+            thread_id: Thread ID to retrieve
+
+        Returns:
+            Thread JSON as returned by the server
+        """
         headers = self._get_headers()
 
-        response = self._client.get(
-            f"{self.server_url}/api/dthreads/{thread_id}", headers=headers
+        response = self._get(
+            "threads", f"{self.server_url}/api/dthreads/{thread_id}", headers=headers
         )
-        response.raise_for_status()
+        data: dict[str, Any] = response.json()
+        return data
 
-        data = response.json()
-        return Thread(id=data.get("id", ""), name=data.get("name"))
+    def export_threads(
+        self,
+        path: str | os.PathLike[str],
+        threads: Iterable[Thread | str] | None = None,
+        concurrency: int = 4,
+        incremental: bool = True,
+    ) -> "ExportReport":
+        """Export threads and their dataframes to a partitioned Parquet dataset.
+
+        Writes ``elements/thread_id=<id>/`` with one row per element and
+        ``blocks/thread_id=<id>/block_id=<id>/`` with each dataframe's rows,
+        both readable with ``pyarrow.dataset.dataset(..., partitioning="hive")``.
+        Threads are exported concurrently, and dataframes are streamed to
+        disk batch by batch.
+
+        Args:
+            path: Export directory
+            threads: Threads or thread ids to export (default: all threads)
+            concurrency: Threads exported at the same time
+            incremental: Skip threads unchanged since the last export into
+                path, going by their last_modified time or element contents
+
+        Returns:
+            ExportReport with counts of exported, skipped and failed threads
+
+        Example:
+            >>> report = client.export_threads("archive/")
+            >>> report.exported, report.skipped, report.failed
+            (12, 488, {})
+        """
+        from ._export import ThreadExporter
+
+        exporter = ThreadExporter(self, path, concurrency, incremental)
+        return exporter.export(threads)
 
     def __enter__(self):
         """Context manager support."""
@@ -636,4 +1826,10 @@ class LouieClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clean up client on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the client's connections, writing any cassette being recorded."""
         self._client.close()
+        if self._transport is not None:
+            self._transport.close()
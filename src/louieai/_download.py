@@ -0,0 +1,289 @@
+"""Resumable downloads of large Arrow blocks over HTTP Range requests.
+
+Instead of holding one response body in memory, the block is spooled to a
+temporary file. When the server advertises ``Accept-Ranges: bytes``, a
+dropped connection resumes from the last byte received rather than starting
+over, and blocks large enough are fetched as several ranged segments in
+parallel. The finished file is checked against the advertised length and,
+when the server sends one, its SHA-256 ``Repr-Digest``, then memory-mapped
+so Arrow decodes it without copying it into the heap.
+"""
+
+import base64
+import contextvars
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from typing import IO
+
+import httpx
+import pyarrow as pa
+
+from ._instrumentation import RETRY, current_operation
+
+# Blocks are only split into segments of at least this many bytes
+MIN_SEGMENT_BYTES = 8 * 1024 * 1024
+
+# Times each segment is resumed after a dropped connection before giving up
+MAX_RESUMES = 3
+
+# Opens a streaming GET for the block with extra request headers
+StreamOpener = Callable[[dict[str, str]], AbstractContextManager[httpx.Response]]
+
+# Ranges address the encoded body, so ranged transfers must not be encoded
+_IDENTITY = {"Accept-Encoding": "identity"}
+
+
+class DownloadIntegrityError(RuntimeError):
+    """A download does not match its advertised length or digest."""
+
+
+@dataclass
+class Download:
+    """A completed download.
+
+    Attributes:
+        buffer: Response body, memory-mapped from the spool file
+        headers: Headers of the first response
+        wire_bytes: Body bytes received, including any cut off by a drop
+        segments: Ranged segments the body was fetched in
+        resumes: Times a dropped connection was resumed
+    """
+
+    buffer: pa.Buffer
+    headers: httpx.Headers
+    wire_bytes: int
+    segments: int = 1
+    resumes: int = 0
+
+
+@dataclass
+class _Segment:
+    """Byte range [start, end) of the body and how far it has been written."""
+
+    start: int
+    end: int | None
+    pos: int = 0
+
+    def __post_init__(self) -> None:
+        self.pos = self.start
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None and self.pos >= self.end
+
+
+def expected_sha256(headers: httpx.Headers) -> bytes | None:
+    """Get the SHA-256 digest a response advertises for its body, if any.
+
+    Reads ``Repr-Digest: sha-256=:<base64>:`` (RFC 9530) and the older
+    ``Digest: SHA-256=<base64>`` (RFC 3230).
+    """
+    for name in ("Repr-Digest", "Digest"):
+        for item in headers.get(name, "").split(","):
+            algorithm, _, value = item.strip().partition("=")
+            if algorithm.lower() == "sha-256" and value:
+                return base64.b64decode(value.strip(":"))
+    return None
+
+
+def _plan(total: int, segments: int, min_segment_bytes: int) -> list[_Segment]:
+    """Split a body of total bytes into at most segments ranges."""
+    if total == 0:
+        return [_Segment(0, 0)]
+    n = max(1, min(segments, total // min_segment_bytes))
+    size = -(-total // n)
+    return [_Segment(s, min(s + size, total)) for s in range(0, total, size)]
+
+
+class _RangedDownload:
+    """Fills segments of a spool file, resuming after dropped connections."""
+
+    def __init__(self, spool: IO[bytes], open_stream: StreamOpener):
+        self.spool = spool
+        self.open_stream = open_stream
+        # ETag or Last-Modified of the first response, to resume against
+        self.validator: str | None = None
+        self.lock = threading.Lock()
+        self.abort = threading.Event()
+        self.wire_bytes = 0
+        self.resumes = 0
+
+    def read(self, response: httpx.Response, seg: _Segment) -> None:
+        """Write a response body into the segment until it ends or is full."""
+        for chunk in response.iter_bytes():
+            if self.abort.is_set():
+                return
+            if seg.end is not None and seg.pos + len(chunk) > seg.end:
+                if response.status_code == 206:
+                    raise DownloadIntegrityError(
+                        "Server sent more bytes than the range requested"
+                    )
+                # A full body serving the first segment; keep our part
+                chunk = chunk[: seg.end - seg.pos]
+            with self.lock:
+                self.spool.seek(seg.pos)
+                self.spool.write(chunk)
+                self.wire_bytes += len(chunk)
+            seg.pos += len(chunk)
+            if seg.done:
+                return
+
+    def fill(self, seg: _Segment, error: Exception | None = None) -> None:
+        """Fetch the rest of a segment with Range requests.
+
+        Args:
+            seg: Segment to complete
+            error: Why the previous attempt stopped short, if one did
+
+        Raises:
+            httpx.TransportError: If the connection keeps dropping
+            DownloadIntegrityError: If the server stops honouring the range
+        """
+        assert seg.end is not None
+        attempts = 0
+        while not seg.done and not self.abort.is_set():
+            if error is not None:
+                if attempts >= MAX_RESUMES:
+                    raise error
+                attempts += 1
+                self._note_resume(seg)
+            headers = {**_IDENTITY, "Range": f"bytes={seg.pos}-{seg.end - 1}"}
+            if self.validator:
+                headers["If-Range"] = self.validator
+            try:
+                with self.open_stream(headers) as response:
+                    if response.status_code != 206:
+                        raise DownloadIntegrityError(
+                            "Server ignored the range request; "
+                            "the block changed or does not support ranges"
+                        )
+                    self.read(response, seg)
+            except httpx.TransportError as e:
+                error = e
+                continue
+            if not seg.done:
+                error = DownloadIntegrityError(
+                    f"Range response ended {seg.end - seg.pos} bytes short"
+                )
+
+    def _note_resume(self, seg: _Segment) -> None:
+        with self.lock:
+            self.resumes += 1
+        op = current_operation()
+        if op is not None:
+            op.event(
+                RETRY,
+                **{"louie.retry.reason": "resume", "louie.download.offset": seg.pos},
+            )
+
+    def finish(self, headers: httpx.Headers, total: int | None) -> pa.Buffer:
+        """Validate the spool file and map it into memory.
+
+        Raises:
+            DownloadIntegrityError: If the length or digest does not match
+        """
+        self.spool.flush()
+        size = self.spool.seek(0, os.SEEK_END)
+        if total is not None and size != total:
+            raise DownloadIntegrityError(
+                f"Downloaded {size} bytes, server advertised {total}"
+            )
+        if size == 0:
+            return pa.py_buffer(b"")
+        # The mapping outlives the file object; the OS removes the file
+        # once both are gone
+        buffer = pa.py_buffer(
+            mmap.mmap(self.spool.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+        digest = expected_sha256(headers)
+        if digest is not None and hashlib.sha256(buffer).digest() != digest:
+            raise DownloadIntegrityError("Downloaded bytes do not match Repr-Digest")
+        return buffer
+
+
+def spool_download(
+    open_stream: StreamOpener,
+    segments: int = 1,
+    min_segment_bytes: int | None = None,
+) -> Download:
+    """Download a body to a temporary file, resuming and splitting with Ranges.
+
+    The first request is a plain GET. If its response advertises byte ranges
+    and a length, the rest of the body is fetched as up to segments ranged
+    requests in parallel (the first response supplies the first segment),
+    and any segment whose connection drops is resumed where it stopped.
+    Without range support the body is read in one pass.
+
+    Args:
+        open_stream: Opens a streaming GET with the given extra headers
+        segments: Maximum parallel ranged requests
+        min_segment_bytes: Do not split into segments smaller than this
+            (default: MIN_SEGMENT_BYTES)
+
+    Returns:
+        The downloaded body and transfer details
+
+    Raises:
+        httpx.HTTPError: If a request fails and cannot be resumed
+        DownloadIntegrityError: If the body does not match its advertised
+            length or digest
+    """
+    # Context (timings, instrumentation) for the segment worker threads
+    context = contextvars.copy_context()
+    with (
+        tempfile.TemporaryFile() as spool,
+        ThreadPoolExecutor(
+            max_workers=max(segments - 1, 1), thread_name_prefix="louie-download"
+        ) as executor,
+    ):
+        job = _RangedDownload(spool, open_stream)
+        try:
+            with open_stream(dict(_IDENTITY)) as response:
+                headers = response.headers
+                # A server that encodes anyway can only be read in one pass
+                encoded = headers.get("Content-Encoding", "identity") != "identity"
+                length = headers.get("Content-Length")
+                total = int(length) if length is not None and not encoded else None
+                job.validator = headers.get("ETag") or headers.get("Last-Modified")
+                ranged = total is not None and "bytes" in headers.get(
+                    "Accept-Ranges", ""
+                ).lower().split(",")
+
+                parts = (
+                    _plan(total, segments, min_segment_bytes or MIN_SEGMENT_BYTES)
+                    if ranged and total is not None
+                    else [_Segment(0, total)]
+                )
+                futures = [
+                    executor.submit(context.copy().run, job.fill, seg)
+                    for seg in parts[1:]
+                ]
+                first, error = parts[0], None
+                try:
+                    job.read(response, first)
+                except httpx.TransportError as e:
+                    if not ranged:
+                        raise
+                    error = e
+
+            if ranged and not first.done:
+                job.fill(first, error)
+            for future in futures:
+                future.result()
+            return Download(
+                buffer=job.finish(headers, total),
+                headers=headers,
+                wire_bytes=job.wire_bytes,
+                segments=len(parts),
+                resumes=job.resumes,
+            )
+        finally:
+            # Stop any segments still running before the spool is closed
+            job.abort.set()
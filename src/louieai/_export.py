@@ -0,0 +1,319 @@
+"""Bulk export of threads to a partitioned Parquet dataset.
+
+An export directory holds two hive-partitioned datasets and a manifest:
+
+- ``elements/thread_id=<id>/part-0.parquet``: one row per element, with
+  its type, text, dataframe block id and remaining fields as JSON
+- ``blocks/thread_id=<id>/block_id=<id>/part-0.parquet``: the rows of each
+  dataframe block, streamed from Arrow straight into Parquet
+- ids in partition names are URL-escaped, as hive partitioning expects
+- ``_manifest.json``: what was exported for each thread, so a later export
+  into the same directory can skip threads that have not changed
+
+Both datasets open with ``pyarrow.dataset.dataset(path, partitioning="hive")``
+or any engine that reads hive partitions (DuckDB, Spark, polars).
+
+A thread is written to a staging directory first and swapped into place
+once complete, so an interrupted export never leaves half a thread behind;
+its manifest entry is only updated after the swap, so it is retried next
+time.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ._client import LouieClient, Thread, dataframe_block_id
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+_MANIFEST_FILE = "_manifest.json"
+_ELEMENTS_DIR = "elements"
+_BLOCKS_DIR = "blocks"
+_STAGING_DIR = "_staging"
+_PART_FILE = "part-0.parquet"
+
+ELEMENTS_SCHEMA = pa.schema(
+    [
+        ("index", pa.int32()),
+        ("id", pa.string()),
+        ("type", pa.string()),
+        ("text", pa.string()),
+        ("block_id", pa.string()),
+        ("data", pa.string()),
+    ]
+)
+
+# Element types whose dataframe is exported as a block
+_DATAFRAME_TYPES = ("DfElement", "df")
+
+# Element fields stored in their own columns rather than in "data"
+_COLUMN_FIELDS = ("id", "type")
+
+# Fields an element's text may be in, by preference; the first one set is
+# stored in the "text" column
+_TEXT_FIELDS = ("content", "text", "value")
+
+
+@dataclass
+class ExportReport:
+    """What an export wrote and skipped.
+
+    Attributes:
+        exported: Threads written
+        skipped: Threads unchanged since the last export
+        failed: Error message for each thread that could not be exported
+        elements: Element rows written
+        blocks: Dataframe blocks written
+        rows: Dataframe rows written
+    """
+
+    exported: int = 0
+    skipped: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+    elements: int = 0
+    blocks: int = 0
+    rows: int = 0
+
+
+class ThreadExporter:
+    """Export threads from a client into a Parquet dataset directory.
+
+    Example:
+        >>> exporter = ThreadExporter(client, "archive/", concurrency=8)
+        >>> report = exporter.export()
+        >>> report.exported, report.skipped
+        (12, 488)
+    """
+
+    def __init__(
+        self,
+        client: LouieClient,
+        path: str | os.PathLike[str],
+        concurrency: int = 4,
+        incremental: bool = True,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            client: Client to read threads and dataframes with
+            path: Export directory; created if needed
+            concurrency: Threads exported at the same time
+            incremental: Skip threads unchanged since the last export into
+                path; False rewrites every thread
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.client = client
+        self.root = Path(path)
+        self.concurrency = concurrency
+        self.incremental = incremental
+        self._lock = threading.Lock()
+        self._manifest: dict[str, dict[str, Any]] = {}
+
+    def export(
+        self,
+        threads: Iterable[Thread | str] | None = None,
+        page_size: int = 100,
+    ) -> ExportReport:
+        """Export threads, skipping unchanged ones when incremental.
+
+        Args:
+            threads: Threads or thread ids to export (default: every thread
+                the client can list)
+            page_size: Threads per listing request when listing all
+
+        Returns:
+            Counts of what was written, skipped and failed
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._manifest = self._read_manifest()
+        report = ExportReport()
+        if threads is None:
+            threads = self.client.iter_threads(page_size=page_size)
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="louie-export"
+        ) as pool:
+            # Keep a bounded number of threads queued, so a listing is only
+            # read as fast as threads are exported
+            pending: deque[Future[None]] = deque()
+            for thread in threads:
+                if len(pending) >= 2 * self.concurrency:
+                    pending.popleft().result()
+                pending.append(pool.submit(self._export_one, thread, report))
+            while pending:
+                pending.popleft().result()
+        shutil.rmtree(self.root / _STAGING_DIR, ignore_errors=True)
+        return report
+
+    def _export_one(self, thread: Thread | str, report: ExportReport) -> None:
+        """Export one thread, recording the outcome in report."""
+        thread_id = thread if isinstance(thread, str) else thread.id
+        modified = None if isinstance(thread, str) else thread.last_modified
+        previous = self._manifest.get(thread_id) if self.incremental else None
+        if previous and modified and previous.get("last_modified") == modified:
+            with self._lock:
+                report.skipped += 1
+            return
+
+        try:
+            detail = self.client._get_thread_detail(thread_id)
+            elements = detail.get("elements") or []
+            fingerprint = _fingerprint(elements)
+            if previous and previous.get("fingerprint") == fingerprint:
+                self._record(thread_id, {**previous, "last_modified": modified})
+                with self._lock:
+                    report.skipped += 1
+                return
+            entry = self._write_thread(thread_id, elements)
+        except Exception as e:
+            logger.warning("Failed to export thread %s: %s", thread_id, e)
+            with self._lock:
+                report.failed[thread_id] = f"{type(e).__name__}: {e}"
+            return
+
+        entry.update(
+            last_modified=modified or detail.get("last_modified"),
+            fingerprint=fingerprint,
+        )
+        self._record(thread_id, entry)
+        with self._lock:
+            report.exported += 1
+            report.elements += entry["elements"]
+            report.blocks += entry["blocks"]
+            report.rows += entry["rows"]
+
+    def _write_thread(
+        self, thread_id: str, elements: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Write a thread's partitions through staging; returns its counts."""
+        partition = _partition("thread_id", thread_id)
+        staging = self._within_root(self.root / _STAGING_DIR / partition)
+        shutil.rmtree(staging, ignore_errors=True)
+        (staging / _ELEMENTS_DIR).mkdir(parents=True)
+
+        blocks = rows = 0
+        records = []
+        for index, elem in enumerate(elements):
+            block_id = None
+            if elem.get("type") in _DATAFRAME_TYPES:
+                block_id = dataframe_block_id(elem)
+            records.append(_element_record(index, elem, block_id))
+            if block_id is None:
+                continue
+            written = self._write_block(
+                thread_id,
+                block_id,
+                self._within_root(
+                    staging / _BLOCKS_DIR / _partition("block_id", block_id)
+                ),
+            )
+            if written is not None:
+                blocks += 1
+                rows += written
+        pq.write_table(
+            pa.Table.from_pylist(records, schema=ELEMENTS_SCHEMA),
+            staging / _ELEMENTS_DIR / _PART_FILE,
+        )
+
+        # Swap the complete thread into place
+        for kind in (_ELEMENTS_DIR, _BLOCKS_DIR):
+            target = self._within_root(self.root / kind / partition)
+            shutil.rmtree(target, ignore_errors=True)
+            if (staging / kind).exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(staging / kind, target)
+        shutil.rmtree(staging, ignore_errors=True)
+        return {"elements": len(records), "blocks": blocks, "rows": rows}
+
+    def _write_block(
+        self, thread_id: str, block_id: str, directory: Path
+    ) -> int | None:
+        """Stream a dataframe block into Parquet; returns rows, None if empty."""
+        writer = None
+        rows = 0
+        try:
+            for batch in self.client.iter_dataframe_batches(thread_id, block_id):
+                if writer is None:
+                    directory.mkdir(parents=True, exist_ok=True)
+                    writer = pq.ParquetWriter(directory / _PART_FILE, batch.schema)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows if writer is not None else None
+
+    def _within_root(self, path: Path) -> Path:
+        """Check a path to be written or removed stays inside the export."""
+        if not path.resolve().is_relative_to(self.root.resolve()):
+            raise ValueError(f"Export path {path} is outside {self.root}")
+        return path
+
+    def _record(self, thread_id: str, entry: dict[str, Any]) -> None:
+        """Update a thread's manifest entry and save the manifest."""
+        with self._lock:
+            self._manifest[thread_id] = entry
+            body = json.dumps(
+                {"version": MANIFEST_VERSION, "threads": self._manifest}, indent=2
+            )
+            tmp = self.root / f"{_MANIFEST_FILE}.tmp"
+            tmp.write_text(body, encoding="utf-8")
+            os.replace(tmp, self.root / _MANIFEST_FILE)
+
+    def _read_manifest(self) -> dict[str, dict[str, Any]]:
+        """Load the previous export's manifest, if any."""
+        path = self.root / _MANIFEST_FILE
+        if not path.exists():
+            return {}
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != MANIFEST_VERSION:
+            logger.info("Ignoring export manifest version %s", data.get("version"))
+            return {}
+        threads: dict[str, dict[str, Any]] = data.get("threads", {})
+        return threads
+
+
+def _partition(key: str, value: str) -> str:
+    """Hive partition directory name, with the value URL-escaped."""
+    return f"{key}={quote(value, safe='')}"
+
+
+def _element_record(
+    index: int, elem: dict[str, Any], block_id: str | None
+) -> dict[str, Any]:
+    """Flatten an element into a row of ELEMENTS_SCHEMA."""
+    text_field = next(
+        (f for f in _TEXT_FIELDS if isinstance(elem.get(f), str) and elem[f]), None
+    )
+    skipped = (*_COLUMN_FIELDS, text_field)
+    rest = {k: v for k, v in elem.items() if k not in skipped}
+    return {
+        "index": index,
+        "id": elem.get("id"),
+        "type": elem.get("type"),
+        "text": elem[text_field] if text_field else None,
+        "block_id": block_id,
+        "data": json.dumps(rest, default=str, sort_keys=True),
+    }
+
+
+def _fingerprint(elements: list[dict[str, Any]]) -> str:
+    """Content hash of a thread's elements, to detect changes."""
+    body = json.dumps(elements, default=str, sort_keys=True).encode()
+    return hashlib.sha256(body).hexdigest()
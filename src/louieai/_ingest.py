@@ -0,0 +1,164 @@
+"""Memory-lean conversion of Arrow tables to pandas.
+
+The default ``table.to_pandas()`` keeps every integer and float at 64 bits
+and, before pandas 3, turns strings into Python objects. Agent results are
+often dominated by low-cardinality strings (status, host, user) and narrow
+numbers, so ``to_pandas_optimized`` instead:
+
+- turns string columns with few distinct values into categoricals,
+- keeps the remaining strings in Arrow-backed ``string[pyarrow]`` columns,
+- downcasts integers to the smallest width that holds their range, and
+- downcasts floats to float32 when no value changes.
+
+Columns with nulls keep their integer width, since pandas would otherwise
+turn them into floats.
+"""
+
+from dataclasses import dataclass, field
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Categorize string columns with at most this share of distinct values
+CATEGORY_MAX_RATIO = 0.2
+
+# Signed and unsigned integer types, narrowest first
+_SIGNED = (pa.int8(), pa.int16(), pa.int32())
+_UNSIGNED = (pa.uint8(), pa.uint16(), pa.uint32())
+
+# pandas 3 converts Arrow strings to Arrow-backed columns by default
+_ARROW_STRINGS_DEFAULT = int(pd.__version__.split(".", 1)[0]) >= 3
+
+# Rough size of a Python str object beyond its characters
+_STR_OVERHEAD = 49
+
+
+@dataclass
+class IngestReport:
+    """What optimizing a conversion changed and the memory it saved.
+
+    Attributes:
+        before_bytes: Estimated memory of the default conversion
+        after_bytes: Memory of the optimized DataFrame
+        columns: New type of each column that was changed
+    """
+
+    before_bytes: int
+    after_bytes: int
+    columns: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def saved_bytes(self) -> int:
+        """Memory saved over the default conversion."""
+        return self.before_bytes - self.after_bytes
+
+    @property
+    def ratio(self) -> float | None:
+        """How many times smaller the optimized DataFrame is."""
+        return self.before_bytes / self.after_bytes if self.after_bytes else None
+
+
+def to_pandas_optimized(
+    table: pa.Table, category_max_ratio: float = CATEGORY_MAX_RATIO
+) -> tuple[pd.DataFrame, IngestReport]:
+    """Convert an Arrow table to a pandas DataFrame using as little memory as safe.
+
+    Args:
+        table: Decoded Arrow table
+        category_max_ratio: Categorize string columns whose distinct values
+            are at most this share of rows
+
+    Returns:
+        The DataFrame, and a report of the changes and memory saved
+    """
+    columns = []
+    changed: dict[str, str] = {}
+    before = 0
+    for name, column in zip(table.column_names, table.columns, strict=True):
+        before += _default_bytes(column)
+        optimized, label = _optimize_column(column, category_max_ratio)
+        columns.append(optimized)
+        if label is not None:
+            changed[name] = label
+
+    df = pa.table(columns, names=table.column_names).to_pandas(
+        types_mapper=_arrow_strings
+    )
+    after = int(df.memory_usage(deep=True, index=False).sum())
+    return df, IngestReport(before_bytes=before, after_bytes=after, columns=changed)
+
+
+def _optimize_column(
+    column: pa.ChunkedArray, category_max_ratio: float
+) -> tuple[pa.ChunkedArray, str | None]:
+    """Narrow one column, returning it and a label for what was done."""
+    kind = column.type
+    rows = len(column)
+    if rows == 0:
+        return column, None
+
+    if pa.types.is_string(kind) or pa.types.is_large_string(kind):
+        distinct = pc.count_distinct(column).as_py()
+        if distinct <= category_max_ratio * rows:
+            return pc.dictionary_encode(column), "category"
+        return column, "string[pyarrow]"
+
+    if column.null_count:
+        return column, None
+
+    if pa.types.is_integer(kind):
+        bounds = pc.min_max(column).as_py()
+        low, high = bounds["min"], bounds["max"]
+        ladder = _SIGNED if pa.types.is_signed_integer(kind) else _UNSIGNED
+        for narrow in ladder:
+            if narrow.bit_width >= kind.bit_width:
+                break
+            if _fits(narrow, low, high):
+                return column.cast(narrow), str(narrow)
+        return column, None
+
+    if pa.types.is_float64(kind):
+        narrow = column.cast(pa.float32(), safe=False)
+        if pc.all(pc.equal(narrow.cast(pa.float64()), column)).as_py():
+            return narrow, "float32"
+    return column, None
+
+
+def _fits(kind: pa.DataType, low: int, high: int) -> bool:
+    """Whether integers from low to high fit in an integer type."""
+    bits: int = kind.bit_width
+    if pa.types.is_signed_integer(kind):
+        return -(1 << (bits - 1)) <= low and high < 1 << (bits - 1)
+    return low >= 0 and high < 1 << bits
+
+
+def _arrow_strings(kind: pa.DataType) -> pd.api.extensions.ExtensionDtype | None:
+    """Map Arrow strings to Arrow-backed pandas strings."""
+    if pa.types.is_string(kind) or pa.types.is_large_string(kind):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def _default_bytes(column: pa.ChunkedArray) -> int:
+    """Estimate the memory of a column after a default to_pandas()."""
+    kind = column.type
+    rows = len(column)
+    nulls: int = column.null_count
+    if pa.types.is_string(kind) or pa.types.is_large_string(kind):
+        chars: int = pc.sum(pc.binary_length(column)).as_py() or 0
+        if _ARROW_STRINGS_DEFAULT:
+            # Characters plus 64-bit offsets and a validity bitmap
+            bitmap = (rows + 7) // 8 if nulls else 0
+            return chars + 8 * (rows + 1) + bitmap
+        # One pointer per row, plus a str object per value; pandas counts
+        # each reference separately, as does memory_usage(deep=True)
+        valid = rows - nulls
+        return 8 * rows + _STR_OVERHEAD * valid + chars
+    if pa.types.is_integer(kind) and nulls:
+        # Integers with nulls become float64
+        return 8 * rows
+    if pa.types.is_integer(kind) or pa.types.is_floating(kind):
+        width: int = kind.bit_width // 8
+        return width * rows
+    return int(column.nbytes)
@@ -0,0 +1,314 @@
+"""Instrumentation hooks around Louie client operations.
+
+Pass an ``Instrumentation`` to the client to observe chat requests, stream
+events, Arrow fetches, auth refreshes and retries - for example to trace them
+with ``OpenTelemetryInstrumentation``. Without one, each operation costs a
+single ``None`` check.
+"""
+
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+# Operations
+CHAT = "louie.chat"
+ARROW_FETCH = "louie.arrow_fetch"
+AUTH_REFRESH = "louie.auth_refresh"
+
+# Events within an operation
+FIRST_BYTE = "first_byte"
+THREAD_ID = "thread_id"
+FIRST_ELEMENT = "first_element"
+STREAM_END = "stream_end"
+RETRY = "retry"
+
+
+class Instrumentation:
+    """Receives start and end hooks around client operations.
+
+    Subclass and override the hooks you need; the defaults do nothing.
+    Whatever start() returns is handed back to the other hooks for the same
+    operation, so it can carry a span or a start time.
+    """
+
+    def start(self, operation: str, attributes: dict[str, Any]) -> Any:
+        """Called when an operation starts.
+
+        Args:
+            operation: Operation name, e.g. "louie.chat"
+            attributes: Request details such as thread id and agent
+
+        Returns:
+            Handle passed to the other hooks for this operation
+        """
+        return None
+
+    def event(self, handle: Any, name: str, attributes: dict[str, Any]) -> None:
+        """Called for notable points within an operation.
+
+        Args:
+            handle: Value returned by start()
+            name: Event name, e.g. "first_element" or "retry"
+            attributes: Event details
+        """
+
+    def end(
+        self,
+        handle: Any,
+        attributes: dict[str, Any],
+        error: BaseException | None,
+    ) -> None:
+        """Called when an operation finishes.
+
+        Args:
+            handle: Value returned by start()
+            attributes: Result details such as element counts and bytes
+            error: Exception that ended the operation, if any
+        """
+
+    def inject(self, handle: Any, headers: dict[str, str]) -> None:
+        """Add context propagation headers to the operation's request.
+
+        Args:
+            handle: Value returned by start()
+            headers: Outgoing request headers, modified in place
+        """
+
+
+class MultiInstrumentation(Instrumentation):
+    """Forward every hook to several instrumentations, in order."""
+
+    def __init__(self, *instrumentations: Instrumentation):
+        """Initialize the composite.
+
+        Args:
+            *instrumentations: Hooks to call
+        """
+        self.instrumentations = instrumentations
+
+    def start(self, operation: str, attributes: dict[str, Any]) -> Any:
+        """Start the operation on each instrumentation."""
+        return [i.start(operation, attributes) for i in self.instrumentations]
+
+    def event(self, handle: Any, name: str, attributes: dict[str, Any]) -> None:
+        """Report the event to each instrumentation."""
+        for i, h in zip(self.instrumentations, handle, strict=True):
+            i.event(h, name, attributes)
+
+    def end(
+        self,
+        handle: Any,
+        attributes: dict[str, Any],
+        error: BaseException | None,
+    ) -> None:
+        """End the operation on each instrumentation, innermost first."""
+        pairs = list(zip(self.instrumentations, handle, strict=True))
+        for i, h in reversed(pairs):
+            i.end(h, attributes, error)
+
+    def inject(self, handle: Any, headers: dict[str, str]) -> None:
+        """Let each instrumentation add its headers."""
+        for i, h in zip(self.instrumentations, handle, strict=True):
+            i.inject(h, headers)
+
+
+class Operation:
+    """An operation in progress, forwarding to its instrumentation's hooks."""
+
+    def __init__(
+        self, instrumentation: Instrumentation, name: str, attributes: dict[str, Any]
+    ):
+        """Start the operation.
+
+        Args:
+            instrumentation: Hooks to call
+            name: Operation name
+            attributes: Request details
+        """
+        self.instrumentation = instrumentation
+        self.name = name
+        # Result details reported on end; callers add to this as they go
+        self.attributes: dict[str, Any] = {}
+        self.handle = instrumentation.start(name, attributes)
+
+    def event(self, name: str, **attributes: Any) -> None:
+        """Report an event within the operation."""
+        self.instrumentation.event(self.handle, name, attributes)
+
+    def inject(self, headers: dict[str, str]) -> dict[str, str]:
+        """Add propagation headers to a copy of headers."""
+        headers = dict(headers)
+        self.instrumentation.inject(self.handle, headers)
+        return headers
+
+
+class StreamEvents:
+    """Report the milestones of a chat stream from its raw JSONL lines."""
+
+    def __init__(self, op: Operation):
+        """Initialize for a chat operation.
+
+        Args:
+            op: Running chat operation
+        """
+        self.op = op
+        self.lines = 0
+        self._thread_seen = False
+        self._element_seen = False
+
+    def on_line(self, line: str) -> None:
+        """Note a received line, reporting the first thread id and element."""
+        self.lines += 1
+        if not self._thread_seen and '"dthread_id"' in line:
+            self._thread_seen = True
+            try:
+                thread_id = json.loads(line).get("dthread_id")
+            except json.JSONDecodeError:
+                thread_id = None
+            self.op.event(THREAD_ID, **{"louie.thread_id": thread_id})
+        elif not self._element_seen and '"payload"' in line:
+            self._element_seen = True
+            self.op.event(FIRST_ELEMENT)
+
+    def on_end(self, truncation_reason: str | None) -> None:
+        """Report the end of the stream."""
+        self.op.event(
+            STREAM_END,
+            **{
+                "louie.stream.lines": self.lines,
+                "louie.truncation_reason": truncation_reason,
+            },
+        )
+
+
+def response_attributes(
+    thread_id: str | None, elements: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Summarize a chat result as operation attributes.
+
+    Args:
+        thread_id: Thread the result belongs to
+        elements: Response elements
+
+    Returns:
+        Thread id plus total, text and dataframe element counts
+    """
+    types = [e.get("type") for e in elements]
+    return {
+        "louie.thread_id": thread_id,
+        "louie.elements": len(elements),
+        "louie.elements.text": sum(t in ("TextElement", "text") for t in types),
+        "louie.elements.dataframe": sum(t in ("DfElement", "df") for t in types),
+    }
+
+
+# Innermost operation in this context, so helpers such as retry handling
+# can report events without it being passed down
+_current: ContextVar[Operation | None] = ContextVar("louie_operation", default=None)
+
+
+def current_operation() -> Operation | None:
+    """Get the innermost instrumented operation in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def instrument(
+    instrumentation: Instrumentation | None,
+    name: str,
+    attributes: dict[str, Any],
+) -> Iterator[Operation | None]:
+    """Run a block as an instrumented operation.
+
+    Args:
+        instrumentation: Hooks to call, or None to do nothing
+        name: Operation name
+        attributes: Request details
+
+    Yields:
+        The running Operation, or None when instrumentation is disabled
+    """
+    if instrumentation is None:
+        yield None
+        return
+    op = Operation(instrumentation, name, attributes)
+    token = _current.set(op)
+    try:
+        yield op
+    except BaseException as e:
+        _current.reset(token)
+        instrumentation.end(op.handle, op.attributes, e)
+        raise
+    _current.reset(token)
+    instrumentation.end(op.handle, op.attributes, None)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Report client operations as OpenTelemetry spans.
+
+    Each operation becomes a span, nested under whatever span is current
+    when the call is made; events become span events, and outgoing requests
+    carry the span in W3C ``traceparent`` headers. Requires the
+    ``opentelemetry-api`` package.
+
+    Example:
+        >>> from louieai import OpenTelemetryInstrumentation
+        >>> lui = louie(instrumentation=OpenTelemetryInstrumentation())
+    """
+
+    def __init__(self, tracer: Any | None = None):
+        """Initialize the adapter.
+
+        Args:
+            tracer: Tracer to create spans with (default: the global
+                tracer provider's "louieai" tracer)
+        """
+        try:
+            from opentelemetry import context, propagate, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requires opentelemetry-api. "
+                "Install it with: pip install louieai[otel]"
+            ) from e
+        self._context = context
+        self._propagate = propagate
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("louieai")
+
+    def start(self, operation: str, attributes: dict[str, Any]) -> Any:
+        """Start a span and make it current."""
+        span = self._tracer.start_span(operation, attributes=_clean(attributes))
+        token = self._context.attach(self._trace.set_span_in_context(span))
+        return span, token
+
+    def event(self, handle: Any, name: str, attributes: dict[str, Any]) -> None:
+        """Add a span event."""
+        span, _ = handle
+        span.add_event(name, attributes=_clean(attributes))
+
+    def end(
+        self,
+        handle: Any,
+        attributes: dict[str, Any],
+        error: BaseException | None,
+    ) -> None:
+        """Record results and end the span."""
+        span, token = handle
+        span.set_attributes(_clean(attributes))
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+        self._context.detach(token)
+
+    def inject(self, handle: Any, headers: dict[str, str]) -> None:
+        """Add traceparent (and tracestate) headers for the span."""
+        span, _ = handle
+        self._propagate.inject(headers, context=self._trace.set_span_in_context(span))
+
+
+def _clean(attributes: dict[str, Any]) -> dict[str, Any]:
+    """Drop None values, which OpenTelemetry attributes do not accept."""
+    return {k: v for k, v in attributes.items() if v is not None}
@@ -0,0 +1,382 @@
+"""In-process metrics for services that embed the Louie client.
+
+``MetricsRegistry`` holds counters and histograms that the client updates
+through its instrumentation hooks when created with ``metrics=``. Each thread
+writes to its own shard, so updates take no lock; readers sum the shards.
+Export with ``to_prometheus()`` or read values with ``collect()``.
+"""
+
+import bisect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from ._instrumentation import (
+    ARROW_FETCH,
+    AUTH_REFRESH,
+    CHAT,
+    FIRST_BYTE,
+    FIRST_ELEMENT,
+    RETRY,
+    STREAM_END,
+    Instrumentation,
+)
+from ._watchdog import CANCELLED, TIMEOUT_REASONS
+
+Labels = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+
+def _labels(labels: dict[str, str]) -> Labels:
+    """Normalize labels to a hashable, ordered key."""
+    return tuple(sorted(labels.items()))
+
+
+class _Sharded(ABC):
+    """Per-thread storage shards, summed when read.
+
+    A shard whose thread has exited is folded into a base shard the next
+    time shards are registered or read, so short-lived worker threads do not
+    accumulate.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, dict[Labels, Any]]] = []
+        self._base: dict[Labels, Any] = {}
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict[Labels, Any]:
+        """Get this thread's shard, registering it on first use."""
+        shard: dict[Labels, Any] | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            self._local.shard = shard
+            with self._shards_lock:
+                self._reap()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _snapshots(self) -> list[dict[Labels, Any]]:
+        """Copy every shard; copying a dict is atomic under the GIL."""
+        with self._shards_lock:
+            self._reap()
+            shards = [self._base] + [shard for _, shard in self._shards]
+            return [dict(shard) for shard in shards]
+
+    def _reap(self) -> None:
+        """Fold the shards of exited threads into the base; hold the lock."""
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                for key, value in shard.items():
+                    self._base[key] = (
+                        self._merge(self._base[key], value)
+                        if key in self._base
+                        else value
+                    )
+        self._shards = live
+
+    @abstractmethod
+    def _merge(self, a: Any, b: Any) -> Any:
+        """Combine two shard values for the same label set."""
+
+
+class Counter(_Sharded):
+    """Monotonically increasing count, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        """Initialize the counter.
+
+        Args:
+            name: Metric name
+            help: One-line description
+        """
+        super().__init__()
+        self.name = name
+        self.help = help
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add to the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values for this observation
+        """
+        shard = self._shard()
+        key = _labels(labels)
+        shard[key] = shard.get(key, 0.0) + amount
+
+    def _merge(self, a: float, b: float) -> float:
+        """Add two partial totals."""
+        return a + b
+
+    def values(self) -> dict[Labels, float]:
+        """Current totals by label set."""
+        totals: dict[Labels, float] = {}
+        for shard in self._snapshots():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+    def value(self, **labels: str) -> float:
+        """Current total for one label set."""
+        return self.values().get(_labels(labels), 0.0)
+
+
+class Histogram(_Sharded):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            help: One-line description
+            buckets: Sorted upper bounds; +Inf is implied
+        """
+        super().__init__()
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value
+            **labels: Label values for this observation
+        """
+        shard = self._shard()
+        key = _labels(labels)
+        state = shard.get(key)
+        if state is None:
+            # Per-bucket (non-cumulative) counts with +Inf last, then sum
+            state = shard[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect.bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def _merge(self, a: list[Any], b: list[Any]) -> list[Any]:
+        """Add two partial bucket counts and sums."""
+        return [[x + y for x, y in zip(a[0], b[0], strict=True)], a[1] + b[1]]
+
+    def values(self) -> dict[Labels, tuple[list[int], float, int]]:
+        """Cumulative bucket counts, sum and count by label set."""
+        merged: dict[Labels, tuple[list[int], float]] = {}
+        for shard in self._snapshots():
+            for key, (counts, total) in shard.items():
+                if key in merged:
+                    prev_counts, prev_total = merged[key]
+                    counts = [a + b for a, b in zip(prev_counts, counts, strict=True)]
+                    total += prev_total
+                merged[key] = (list(counts), total)
+        result = {}
+        for key, (counts, total) in merged.items():
+            cumulative = []
+            running = 0
+            for c in counts:
+                running += c
+                cumulative.append(running)
+            result[key] = (cumulative, total, running)
+        return result
+
+
+class MetricsRegistry:
+    """Counters and histograms describing a client's requests.
+
+    Example:
+        >>> metrics = MetricsRegistry()
+        >>> client = LouieClient(metrics=metrics)
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, prefix: str = "louie"):
+        """Create the client metrics.
+
+        Args:
+            prefix: Prefix for every metric name
+        """
+        self.requests = Counter(
+            f"{prefix}_requests_total",
+            "Requests by operation, agent and status",
+        )
+        self.stream_duration = Histogram(
+            f"{prefix}_stream_duration_seconds",
+            "Time spent reading chat response streams",
+        )
+        self.time_to_first_element = Histogram(
+            f"{prefix}_time_to_first_element_seconds",
+            "Time from sending a query to its first response element",
+        )
+        self.arrow_bytes = Counter(
+            f"{prefix}_arrow_bytes_total",
+            "Arrow payload bytes fetched",
+        )
+        self.arrow_fetch_duration = Histogram(
+            f"{prefix}_arrow_fetch_duration_seconds",
+            "Time to fetch and convert one dataframe",
+        )
+        self.auth_refreshes = Counter(
+            f"{prefix}_auth_refreshes_total",
+            "Auth token refreshes by result",
+        )
+        self.retries = Counter(
+            f"{prefix}_retries_total",
+            "Requests retried after throttling, by operation",
+        )
+        self.timeouts = Counter(
+            f"{prefix}_timeouts_total",
+            "Chat streams cut short by a deadline, by reason",
+        )
+
+    @property
+    def metrics(self) -> list[Counter | Histogram]:
+        """All metrics in this registry."""
+        return [m for m in vars(self).values() if isinstance(m, Counter | Histogram)]
+
+    def collect(self) -> dict[str, dict[Labels, Any]]:
+        """Read every metric.
+
+        Returns:
+            Metric name to values by label set; counters map to totals and
+            histograms to (cumulative bucket counts, sum, count)
+        """
+        return {m.name: m.values() for m in self.metrics}
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if isinstance(metric, Counter):
+                for key, value in sorted(metric.values().items()):
+                    lines.append(f"{metric.name}{_format_labels(key)} {_num(value)}")
+                continue
+            for key, (cumulative, total, count) in sorted(metric.values().items()):
+                bounds = [*metric.buckets, math.inf]
+                for bound, n in zip(bounds, cumulative, strict=True):
+                    le = (("le", "+Inf" if bound == math.inf else _num(bound)),)
+                    lines.append(f"{metric.name}_bucket{_format_labels(key + le)} {n}")
+                lines.append(f"{metric.name}_sum{_format_labels(key)} {_num(total)}")
+                lines.append(f"{metric.name}_count{_format_labels(key)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _num(value: float) -> str:
+    """Format a sample value, dropping a trailing .0."""
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def _format_labels(labels: Labels) -> str:
+    """Render a label set as {a="1",b="2"}."""
+    if not labels:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+class _OperationState:
+    """What the metrics hooks remember about one running operation."""
+
+    __slots__ = ("agent", "first_byte", "operation", "start")
+
+    def __init__(self, operation: str, agent: str):
+        self.operation = operation
+        self.agent = agent
+        self.start = time.perf_counter()
+        self.first_byte: float | None = None
+
+
+class MetricsInstrumentation(Instrumentation):
+    """Instrumentation hooks that update a MetricsRegistry."""
+
+    def __init__(self, registry: MetricsRegistry):
+        """Initialize the hooks.
+
+        Args:
+            registry: Registry to update
+        """
+        self.registry = registry
+
+    def start(self, operation: str, attributes: dict[str, Any]) -> Any:
+        """Note the operation's start time and agent."""
+        return _OperationState(operation, str(attributes.get("louie.agent", "")))
+
+    def event(self, handle: Any, name: str, attributes: dict[str, Any]) -> None:
+        """Observe time to first element, stream duration and retries."""
+        now = time.perf_counter()
+        if name == FIRST_BYTE:
+            handle.first_byte = now
+        elif name == FIRST_ELEMENT:
+            self.registry.time_to_first_element.observe(
+                now - handle.start, agent=handle.agent
+            )
+        elif name == STREAM_END:
+            self.registry.stream_duration.observe(
+                now - (handle.first_byte or handle.start), agent=handle.agent
+            )
+        elif name == RETRY:
+            self.registry.retries.inc(operation=handle.operation)
+
+    def end(
+        self,
+        handle: Any,
+        attributes: dict[str, Any],
+        error: BaseException | None,
+    ) -> None:
+        """Count the request and record its result."""
+        registry = self.registry
+        if handle.operation == AUTH_REFRESH:
+            refreshed = error is None and attributes.get("louie.auth.refreshed")
+            registry.auth_refreshes.inc(result="refreshed" if refreshed else "failed")
+            return
+
+        status = "error" if error is not None or "error.type" in attributes else "ok"
+        if handle.operation == CHAT:
+            reason = attributes.get("louie.truncation_reason") or getattr(
+                error, "reason", None
+            )
+            if reason in TIMEOUT_REASONS:
+                status = "timeout"
+                registry.timeouts.inc(reason=str(reason))
+            elif reason == CANCELLED:
+                status = "cancelled"
+        elif handle.operation == ARROW_FETCH and status == "ok":
+            registry.arrow_bytes.inc(attributes.get("louie.arrow.bytes", 0))
+            registry.arrow_fetch_duration.observe(time.perf_counter() - handle.start)
+
+        labels = {"operation": handle.operation, "status": status}
+        if handle.agent:
+            labels["agent"] = handle.agent
+        registry.requests.inc(**labels)
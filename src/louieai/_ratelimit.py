@@ -0,0 +1,199 @@
+"""Client-side rate limiting for Louie API requests."""
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Registry of limiters shared by key across clients in this process
+_shared_limiters: dict[str, "RateLimiter"] = {}
+_shared_lock = threading.Lock()
+
+
+class RateLimiter:
+    """Token-bucket rate limiter with a cap on in-flight requests.
+
+    A single instance can be passed to several ``LouieClient`` objects so they
+    draw from the same budget. When the server answers ``429 Too Many
+    Requests`` the effective rate is halved (down to ``min_rate``) and new
+    requests are held until any ``Retry-After`` delay has elapsed; successful
+    requests then grow the rate back towards the configured value.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        max_in_flight: int | None = None,
+        min_rate: float = 0.1,
+        max_retries: int = 3,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second (None for no rate cap)
+            burst: Bucket size, i.e. requests allowed back-to-back
+                (default: ``ceil(rate)``)
+            max_in_flight: Maximum concurrent requests (None for no cap)
+            min_rate: Floor for the rate when backing off after 429 responses
+            max_retries: Times a throttled request is retried before raising
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+
+        self._configured_rate = rate
+        self._rate = rate
+        self._min_rate = min_rate
+        self._capacity = float(burst or math.ceil(rate or 1))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+        self._max_in_flight = max_in_flight
+        self._slots = (
+            threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        )
+        self._in_flight = 0
+
+        self.max_retries = max_retries
+
+    @classmethod
+    def shared(cls, key: str, **kwargs: Any) -> "RateLimiter":
+        """Get or create a process-wide limiter registered under ``key``.
+
+        The first call for a key creates the limiter from ``kwargs``; later
+        calls return the same instance and ignore ``kwargs``.
+
+        Args:
+            key: Registry key, e.g. the server URL or organization name
+            **kwargs: Arguments for ``RateLimiter`` on first creation
+
+        Returns:
+            The shared limiter
+        """
+        with _shared_lock:
+            limiter = _shared_limiters.get(key)
+            if limiter is None:
+                limiter = cls(**kwargs)
+                _shared_limiters[key] = limiter
+            return limiter
+
+    @property
+    def rate(self) -> float | None:
+        """Current effective rate in requests per second."""
+        return self._rate
+
+    @property
+    def max_in_flight(self) -> int | None:
+        """Configured in-flight request cap."""
+        return self._max_in_flight
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last refill. Caller holds the lock."""
+        if self._rate is not None:
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def _wait_for_token(self) -> None:
+        """Block until the bucket has a token and no backoff is active."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._rate is None:
+                        return
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, then take an in-flight slot."""
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            self._wait_for_token()
+        except BaseException:
+            if self._slots is not None:
+                self._slots.release()
+            raise
+        with self._lock:
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """Return the in-flight slot taken by ``acquire``."""
+        with self._lock:
+            self._in_flight -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a request slot for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """Back off after the server responded with 429.
+
+        Args:
+            retry_after: Seconds from the ``Retry-After`` header, if any
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._rate is not None:
+                self._rate = max(self._min_rate, self._rate / 2)
+                self._tokens = min(self._tokens, 0.0)
+            delay = retry_after if retry_after is not None else 1.0
+            self._blocked_until = max(self._blocked_until, now + delay)
+            logger.info(
+                f"Louie API throttled (429); backing off {delay:.1f}s, "
+                f"rate now {self._rate} req/s"
+            )
+
+    def on_success(self) -> None:
+        """Recover the rate additively after a successful request."""
+        if self._configured_rate is None:
+            return
+        with self._lock:
+            if self._rate is None or self._rate == self._configured_rate:
+                return
+            step = self._configured_rate * 0.1
+            self._rate = min(self._configured_rate, self._rate + step)
+
+
+def parse_retry_after(value: Any) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds.
+
+    Args:
+        value: Header value (HTTP-date forms are not supported)
+
+    Returns:
+        Delay in seconds, or None if missing or unparseable
+    """
+    if not isinstance(value, str | int | float):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
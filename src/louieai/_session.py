@@ -0,0 +1,185 @@
+"""Save a notebook session to disk and reopen it without the network.
+
+A saved session is a directory holding:
+
+- ``session.json``: thread id and cursor settings
+- ``history.jsonl``: one line per response, with its elements
+- ``dataframes/*.arrow``: one Arrow IPC file per dataframe element
+
+On load, dataframe files are memory-mapped and only converted to the
+result backend when an element's ``"table"`` is first read, so reopening a
+session takes milliseconds however much data it holds.
+"""
+
+import json
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from ._backends import is_result_frame, to_arrow
+from ._client import Response
+
+SESSION_VERSION = 1
+
+_SESSION_FILE = "session.json"
+_HISTORY_FILE = "history.jsonl"
+_DATAFRAME_DIR = "dataframes"
+
+# Element key pointing at a saved dataframe file, relative to the session
+_TABLE_FILE = "table_file"
+
+
+class LazyTableElement(dict[str, Any]):
+    """Element dict whose ``"table"`` is loaded on first access."""
+
+    def __init__(self, elem: dict[str, Any], load: Callable[[], Any]):
+        """Initialize the element.
+
+        Args:
+            elem: Element fields, without "table"
+            load: Returns the dataframe
+        """
+        super().__init__(elem)
+        self._load = load
+
+    def __missing__(self, key: str) -> Any:
+        if key != "table":
+            raise KeyError(key)
+        table = self._load()
+        self["table"] = table
+        return table
+
+    def __contains__(self, key: object) -> bool:
+        return key == "table" or super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field, loading the table if it is requested."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def save_session(
+    path: str | os.PathLike[str],
+    responses: Iterable[Response],
+    metadata: dict[str, Any],
+) -> Path:
+    """Write responses and their dataframes to a session directory.
+
+    Args:
+        path: Directory to write; created if needed, and an existing
+            session in it is replaced
+        responses: Responses to save, oldest first
+        metadata: Cursor settings to restore
+
+    Returns:
+        The session directory
+    """
+    root = Path(path)
+    frames = root / _DATAFRAME_DIR
+    frames.mkdir(parents=True, exist_ok=True)
+
+    # Read every table before touching the directory, since a session
+    # loaded from this same path still reads its dataframes from it
+    lines = []
+    tables: dict[str, pa.Table] = {}
+    for i, response in enumerate(responses):
+        elements = []
+        for j, elem in enumerate(response.elements):
+            saved = {k: v for k, v in elem.items() if k != "table"}
+            table = elem.get("table")
+            if table is not None and is_result_frame(table):
+                name = f"{_DATAFRAME_DIR}/{i:04d}-{j:03d}.arrow"
+                tables[name] = to_arrow(table)
+                saved[_TABLE_FILE] = name
+            elements.append(saved)
+        record = {
+            "thread_id": response.thread_id,
+            "truncated": response.truncated,
+            "truncation_reason": response.truncation_reason,
+            "elements": elements,
+        }
+        lines.append(json.dumps(record, default=str))
+
+    # Mapped files stay readable after unlinking, so replacing them is safe
+    for stale in frames.glob("*.arrow"):
+        stale.unlink()
+    for name, table in tables.items():
+        _write_arrow(root / name, table)
+    (root / _HISTORY_FILE).write_text(
+        "".join(line + "\n" for line in lines), encoding="utf-8"
+    )
+    (root / _SESSION_FILE).write_text(
+        json.dumps({"version": SESSION_VERSION, **metadata}, indent=2),
+        encoding="utf-8",
+    )
+    return root
+
+
+def load_session(
+    path: str | os.PathLike[str], convert: Callable[[pa.Table], Any]
+) -> tuple[list[Response], dict[str, Any]]:
+    """Read a session directory written by save_session.
+
+    Args:
+        path: Session directory
+        convert: Turns a mapped Arrow table into the wanted dataframe type
+
+    Returns:
+        The responses, oldest first, and the saved cursor settings
+
+    Raises:
+        FileNotFoundError: If path holds no saved session
+        ValueError: If the session was written by a newer version
+    """
+    root = Path(path)
+    metadata = json.loads((root / _SESSION_FILE).read_text(encoding="utf-8"))
+    version = metadata.pop("version", None)
+    if version != SESSION_VERSION:
+        raise ValueError(f"Unsupported session version: {version}")
+
+    responses = []
+    with open(root / _HISTORY_FILE, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            elements = [_restore(root, elem, convert) for elem in record["elements"]]
+            responses.append(
+                Response(
+                    thread_id=record["thread_id"],
+                    elements=elements,
+                    truncated=record.get("truncated", False),
+                    truncation_reason=record.get("truncation_reason"),
+                )
+            )
+    return responses, metadata
+
+
+def _restore(
+    root: Path, elem: dict[str, Any], convert: Callable[[pa.Table], Any]
+) -> dict[str, Any]:
+    """Rebuild an element, deferring its dataframe if it had one."""
+    name = elem.pop(_TABLE_FILE, None)
+    if name is None:
+        return elem
+    file = root / name
+    return LazyTableElement(elem, lambda: convert(read_mapped(file)))
+
+
+def read_mapped(file: Path) -> pa.Table:
+    """Read an Arrow IPC file as a table mapped from disk, without copying."""
+    return pa.ipc.open_file(pa.memory_map(str(file))).read_all()
+
+
+def _write_arrow(file: Path, table: pa.Table) -> None:
+    """Write a table as an uncompressed Arrow IPC file, so it can be mapped."""
+    with (
+        pa.OSFile(str(file), "wb") as sink,
+        pa.ipc.new_file(sink, table.schema) as writer,
+    ):
+        writer.write_table(table)
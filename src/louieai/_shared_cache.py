@@ -0,0 +1,197 @@
+"""Cross-process dataframe cache backed by memory-mapped Arrow IPC files.
+
+Notebook kernels and worker processes on one host often fetch the same
+blocks. With a ``SharedTableCache``, the first process to fetch a block
+writes it as an Arrow IPC file in a shared directory (``/dev/shm`` by
+default, so the files live in memory); the others memory-map that file and
+decode it without copying, so every process reads the same physical pages.
+
+Cleanup is least-recently-used by file modification time, which each read
+refreshes. Removing a file another process has mapped is safe on POSIX: the
+mapping stays valid until that process drops it, so no reference counting is
+needed.
+
+The directory must be private to the user: a symlink, or a directory owned
+by or open to other users, is refused. Clients add the server and the user
+they act as to each key, so tables are never shared across accounts.
+"""
+
+import contextlib
+import getpass
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+import threading
+from collections.abc import Hashable
+from pathlib import Path
+
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Default bound on the total size of cached files
+DEFAULT_SHARED_CACHE_BYTES = 1024 * 1024 * 1024
+
+_SUFFIX = ".arrow"
+
+
+def default_directory() -> Path:
+    """Per-user cache directory in /dev/shm, or the temp dir without it."""
+    base = Path("/dev/shm")
+    if not base.is_dir():
+        base = Path(tempfile.gettempdir())
+    user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    return base / f"louieai-{user}"
+
+
+def _check_private(directory: Path) -> None:
+    """Refuse a cache directory another user could have planted or can write.
+
+    /dev/shm is world-writable, so the default directory may already exist,
+    created by someone else to feed this process tables or read its own.
+    """
+    st = os.lstat(directory)
+    if stat.S_ISLNK(st.st_mode) or not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f"Shared cache path {directory} is not a directory")
+    if not hasattr(os, "getuid"):
+        return
+    if st.st_uid != os.getuid():
+        raise PermissionError(
+            f"Shared cache directory {directory} is owned by uid {st.st_uid}, "
+            f"not the current user"
+        )
+    if st.st_mode & 0o077:
+        raise PermissionError(
+            f"Shared cache directory {directory} is accessible to other users "
+            f"(mode {stat.S_IMODE(st.st_mode):o}); it must be 700"
+        )
+
+
+class SharedTableCache:
+    """Arrow tables shared between processes through memory-mapped files.
+
+    Example:
+        >>> from louieai import SharedTableCache
+        >>> lui = louie(shared_cache=SharedTableCache(max_bytes=4 * 1024**3))
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        max_bytes: int = DEFAULT_SHARED_CACHE_BYTES,
+    ):
+        """Initialize the cache, creating its directory if needed.
+
+        Args:
+            directory: Where to keep the files; every process sharing the
+                cache must use the same one (default: a per-user directory
+                in /dev/shm)
+            max_bytes: Remove least recently used files beyond this total
+
+        Raises:
+            PermissionError: If the directory is a symlink, or (on POSIX) is
+                not owned by the current user or is open to group or others
+        """
+        self.directory = Path(directory) if directory else default_directory()
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_private(self.directory)
+        self.max_bytes = max_bytes
+
+    def path(self, key: Hashable) -> Path:
+        """File a key is stored in."""
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+        return self.directory / f"{digest}{_SUFFIX}"
+
+    def load(self, key: Hashable) -> pa.Table | None:
+        """Attach to a cached table without copying it.
+
+        Args:
+            key: Identifies the table
+
+        Returns:
+            Table whose buffers are mapped from the cache file, or None
+        """
+        path = self.path(key)
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+        except FileNotFoundError:
+            return None
+        except (OSError, pa.ArrowInvalid):
+            # Truncated or foreign file; drop it and fetch again
+            logger.debug("Discarding unreadable cache file %s", path, exc_info=True)
+            self._remove(path)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return table
+
+    def store(self, key: Hashable, table: pa.Table) -> pa.Table:
+        """Cache a table for other processes.
+
+        The file is written under a temporary name and renamed into place,
+        so readers never see a partial file.
+
+        Args:
+            key: Identifies the table
+            table: Table to share
+
+        Returns:
+            The table mapped from the cache file, so this process holds the
+            shared copy too, or table itself if it could not be cached
+        """
+        if table.nbytes > self.max_bytes:
+            return table
+        path = self.path(key)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with (
+                pa.OSFile(str(tmp), "wb") as sink,
+                pa.ipc.new_file(sink, table.schema) as writer,
+            ):
+                writer.write_table(table)
+            os.replace(tmp, path)
+        except OSError:
+            logger.debug("Could not write cache file %s", path, exc_info=True)
+            self._remove(tmp)
+            return table
+        self._evict()
+        mapped = self.load(key)
+        return table if mapped is None else mapped
+
+    def clear(self) -> None:
+        """Remove every cached file."""
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            self._remove(path)
+
+    def _evict(self) -> None:
+        """Remove least recently used files until under max_bytes."""
+        entries = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        """Delete a file if possible, returning whether it is gone.
+
+        Files still mapped by another process cannot be removed on Windows.
+        """
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return True
+        except OSError:
+            logger.debug("Could not remove cache file %s", path, exc_info=True)
+            return False
+        return True
@@ -0,0 +1,131 @@
+"""Shared Arrow tables for concurrent and repeated dataframe fetches.
+
+The first caller to ask for a block downloads and decodes it; callers asking
+for the same block while that is in flight wait for it instead of starting
+downloads of their own (single-flight). Finished tables are kept in a
+least-recently-used cache bounded by Arrow memory, so fetching a block again
+in the same session skips the network. Arrow tables are immutable, so they
+are safe to share; each caller still converts its own dataframe.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+import pyarrow as pa
+
+# How a fetch was served
+MISS = "miss"
+SHARED = "shared"
+HIT = "hit"
+# Mapped from another process's download through a SharedTableCache
+ATTACHED = "attached"
+
+# Default bound on the Arrow memory of cached tables
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class _Flight:
+    """A fetch in progress that other callers can wait for."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.table: pa.Table | None = None
+        self.error: BaseException | None = None
+
+
+class TableCache:
+    """Single-flight fetches with a size-bounded LRU of decoded tables.
+
+    Example:
+        >>> cache = TableCache(max_bytes=64 * 1024 * 1024)
+        >>> table, how = cache.get(("D_1", "B_1"), lambda: download("B_1"))
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Keep tables up to this much Arrow memory in total;
+                0 shares concurrent fetches but keeps nothing
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._tables: OrderedDict[Hashable, pa.Table] = OrderedDict()
+        self._bytes = 0
+        self._flights: dict[Hashable, _Flight] = {}
+
+    @property
+    def nbytes(self) -> int:
+        """Arrow memory held by cached tables."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def get(self, key: Hashable, fetch: Callable[[], pa.Table]) -> tuple[pa.Table, str]:
+        """Get a table, fetching it at most once across concurrent callers.
+
+        Args:
+            key: Identifies the table, e.g. thread, block and window
+            fetch: Downloads and decodes the table on a miss
+
+        Returns:
+            The table, and MISS, SHARED or HIT for how it was served
+
+        Raises:
+            Exception: Whatever fetch raised, in every caller that waited on it
+        """
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                return table, HIT
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.table is not None
+            return flight.table, SHARED
+
+        try:
+            flight.table = fetch()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                if flight.table is not None:
+                    self._store(key, flight.table)
+            flight.done.set()
+        return flight.table, MISS
+
+    def clear(self) -> None:
+        """Drop all cached tables."""
+        with self._lock:
+            self._tables.clear()
+            self._bytes = 0
+
+    def _store(self, key: Hashable, table: pa.Table) -> None:
+        """Cache a table, evicting the least recently used; lock held."""
+        size = _retained_bytes(table)
+        if size > self.max_bytes:
+            return
+        self._tables[key] = table
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._tables.popitem(last=False)
+            self._bytes -= _retained_bytes(evicted)
+
+
+def _retained_bytes(table: pa.Table) -> int:
+    """Memory a table keeps alive: whole buffers, not just its slices of them."""
+    return int(table.get_total_buffer_size())
@@ -0,0 +1,117 @@
+"""Short-lived cache of thread metadata with HTTP revalidation.
+
+Sync jobs look up the same threads over and over. Entries younger than the
+TTL are served from memory; older ones are revalidated with a conditional
+request (``If-None-Match`` with the ETag, ``If-Modified-Since`` with the
+Last-Modified time), which the server answers with an empty 304 when the
+thread has not changed. Threads are copied in and out, so callers that
+modify one do not change what later lookups return.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._client import Thread
+
+# Default seconds an entry is served without asking the server
+DEFAULT_THREAD_TTL = 60.0
+
+# Entries kept before the least recently used are dropped
+MAX_THREAD_ENTRIES = 10_000
+
+
+@dataclass
+class _Entry:
+    """A cached thread and the validators it was served with."""
+
+    thread: "Thread"
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+
+class ThreadCache:
+    """Thread metadata by id, fresh for a TTL and then revalidated.
+
+    Example:
+        >>> cache = ThreadCache(ttl=30)
+        >>> cache.fresh("D_1") or fetch("D_1", cache.validators("D_1"))
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_THREAD_TTL, max_entries: int = MAX_THREAD_ENTRIES
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds to serve an entry without revalidating; 0
+                revalidates every lookup
+            max_entries: Drop the least recently used entries beyond this
+        """
+        if ttl < 0:
+            raise ValueError(f"ttl must not be negative, got {ttl}")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fresh(self, thread_id: str) -> "Thread | None":
+        """Get a thread if it was fetched or revalidated within the TTL."""
+        with self._lock:
+            entry = self._entries.get(thread_id)
+            if entry is None or time.monotonic() - entry.fetched_at >= self.ttl:
+                return None
+            self._entries.move_to_end(thread_id)
+            return replace(entry.thread)
+
+    def validators(self, thread_id: str) -> dict[str, str]:
+        """Conditional request headers for a cached thread, if any."""
+        with self._lock:
+            entry = self._entries.get(thread_id)
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(
+        self,
+        thread_id: str,
+        thread: "Thread",
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Cache a thread fetched from the server."""
+        with self._lock:
+            self._entries[thread_id] = _Entry(
+                replace(thread), etag, last_modified, time.monotonic()
+            )
+            self._entries.move_to_end(thread_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, thread_id: str) -> "Thread | None":
+        """Restart an entry's TTL after a 304, returning its thread."""
+        with self._lock:
+            entry = self._entries.get(thread_id)
+            if entry is None:
+                return None
+            entry.fetched_at = time.monotonic()
+            self._entries.move_to_end(thread_id)
+            return replace(entry.thread)
+
+    def invalidate(self, thread_id: str | None = None) -> None:
+        """Drop one thread, or every thread when no id is given."""
+        with self._lock:
+            if thread_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(thread_id, None)
@@ -0,0 +1,405 @@
+"""Per-query timing breakdown for Louie requests.
+
+Every query records where its time went - header and auth preparation,
+connection setup, time to first byte, thread id and element arrivals, stream
+duration and each Arrow fetch - in a ``QueryTimings`` attached to the
+response. All offsets are seconds since the query started. A query's
+timeline can be exported in the Chrome Trace Event format, which Perfetto
+and chrome://tracing open directly.
+"""
+
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+# Timings of the query running in this thread, if any; lets nested calls
+# such as Arrow fetches report without threading the record through
+_current: ContextVar["QueryTimings | None"] = ContextVar(
+    "louie_query_timings", default=None
+)
+
+
+@dataclass
+class ArrowFetchTiming:
+    """Timing of one dataframe fetched via Arrow.
+
+    Attributes:
+        block_id: Dataframe block fetched
+        fetch_s: HTTP request time including the body download
+        bytes: Size of the Arrow payload
+        decode_s: Arrow IPC parsing time
+        pandas_s: Conversion to the result backend (pandas by default) time
+        start_s: Offset in the query when the request was sent, if known
+        wire_bytes: Bytes received before HTTP content decoding, if known
+        table_bytes: Size of the decoded, uncompressed Arrow table
+        cache: "miss" when downloaded, "shared" when another caller's
+            download in flight was joined, "hit" when served from the
+            client's table cache, "attached" when mapped from the
+            cross-process shared cache
+        pandas_bytes_saved: Memory saved by optimize_dataframes, if enabled
+    """
+
+    block_id: str
+    fetch_s: float
+    bytes: int
+    decode_s: float
+    pandas_s: float
+    start_s: float | None = None
+    wire_bytes: int | None = None
+    table_bytes: int | None = None
+    cache: str = "miss"
+    pandas_bytes_saved: int | None = None
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """Uncompressed table size over bytes transferred, if known."""
+        if not self.wire_bytes or self.table_bytes is None:
+            return None
+        return self.table_bytes / self.wire_bytes
+
+
+@dataclass
+class QueryTimings:
+    """Where the time of one query went.
+
+    Offsets (``*_s`` ending in an event) are seconds since the query started;
+    None means the event did not happen, e.g. ``connect_s`` on a reused
+    connection or ``first_element_s`` for an empty response.
+
+    Attributes:
+        headers_s: Header and auth token preparation
+        connect_s: TCP and TLS connection setup
+        ttfb_s: Offset when the response headers arrived
+        thread_id_s: Offset when the thread id arrived
+        first_element_s: Offset when the first element arrived
+        stream_s: Time spent reading the streamed body
+        total_s: Offset when the response was complete, dataframes included
+        element_arrivals: Offset each element was first seen, by element id
+        element_updates: Offsets of every update to each element, by id
+        element_types: Type of each element, by id
+        arrow_fetches: One entry per dataframe fetched
+        renders: (offset, duration) of each notebook display refresh
+        auth_refreshes: (offset, duration) of each auth token refresh
+    """
+
+    headers_s: float | None = None
+    connect_s: float | None = None
+    ttfb_s: float | None = None
+    thread_id_s: float | None = None
+    first_element_s: float | None = None
+    stream_s: float | None = None
+    total_s: float | None = None
+    element_arrivals: dict[str, float] = field(default_factory=dict)
+    element_updates: dict[str, list[float]] = field(default_factory=dict)
+    element_types: dict[str, str] = field(default_factory=dict)
+    arrow_fetches: list[ArrowFetchTiming] = field(default_factory=list)
+    renders: list[tuple[float, float]] = field(default_factory=list)
+    auth_refreshes: list[tuple[float, float]] = field(default_factory=list)
+    _start: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+    _connect_start: float | None = field(default=None, repr=False, compare=False)
+
+    def elapsed(self, now: float | None = None) -> float:
+        """Seconds since the query started.
+
+        Args:
+            now: perf_counter() reading to convert (default: now)
+        """
+        return (time.perf_counter() if now is None else now) - self._start
+
+    def on_line(self, data: dict[str, Any], now: float | None = None) -> None:
+        """Record the arrival of a parsed stream line.
+
+        Args:
+            data: Decoded JSONL message
+            now: perf_counter() reading when the line arrived
+        """
+        if "dthread_id" in data:
+            if self.thread_id_s is None:
+                self.thread_id_s = self.elapsed(now)
+        elif "payload" in data:
+            elem = data["payload"]
+            elem_id = elem.get("id")
+            if not elem_id:
+                return
+            offset = self.elapsed(now)
+            updates = self.element_updates.get(elem_id)
+            if updates is not None:
+                updates.append(offset)
+                return
+            self.element_updates[elem_id] = [offset]
+            self.element_arrivals[elem_id] = offset
+            self.element_types[elem_id] = str(elem.get("type", ""))
+            if self.first_element_s is None:
+                self.first_element_s = offset
+
+    def on_headers(self) -> None:
+        """Record that the response headers arrived."""
+        self.ttfb_s = self.elapsed()
+
+    def on_stream_end(self) -> None:
+        """Record that the streamed body was fully read."""
+        self.stream_s = self.elapsed() - (self.ttfb_s or 0.0)
+
+    def on_render(self, start: float) -> None:
+        """Record a display refresh that began at perf_counter() start."""
+        self.renders.append((self.elapsed(start), time.perf_counter() - start))
+
+    def on_auth_refresh(self, start: float) -> None:
+        """Record an auth refresh that began at perf_counter() start."""
+        self.auth_refreshes.append((self.elapsed(start), time.perf_counter() - start))
+
+    def http_trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Collect connection timing; pass as httpx's ``trace`` extension."""
+        if event_name == "connection.connect_tcp.started":
+            self._connect_start = time.perf_counter()
+        elif (
+            event_name
+            in ("connection.connect_tcp.complete", "connection.start_tls.complete")
+            and self._connect_start is not None
+        ):
+            self.connect_s = time.perf_counter() - self._connect_start
+
+    @property
+    def arrow_bytes(self) -> int:
+        """Total Arrow payload bytes fetched."""
+        return sum(f.bytes for f in self.arrow_fetches)
+
+    @property
+    def arrow_compression_ratio(self) -> float | None:
+        """Uncompressed size over bytes transferred, across Arrow fetches."""
+        known = [f for f in self.arrow_fetches if f.compression_ratio is not None]
+        if not known:
+            return None
+        return sum(f.table_bytes or 0 for f in known) / sum(
+            f.wire_bytes or 0 for f in known
+        )
+
+    def as_dict(self) -> dict[str, float | None]:
+        """Flatten to one value per phase, summing the Arrow fetches."""
+        fetches = self.arrow_fetches
+        return {
+            "headers_s": self.headers_s,
+            "connect_s": self.connect_s,
+            "ttfb_s": self.ttfb_s,
+            "thread_id_s": self.thread_id_s,
+            "first_element_s": self.first_element_s,
+            "stream_s": self.stream_s,
+            "arrow_fetch_s": sum(f.fetch_s for f in fetches) if fetches else None,
+            "arrow_decode_s": sum(f.decode_s for f in fetches) if fetches else None,
+            "pandas_s": sum(f.pandas_s for f in fetches) if fetches else None,
+            "arrow_bytes": self.arrow_bytes if fetches else None,
+            "arrow_compression_ratio": self.arrow_compression_ratio,
+            "total_s": self.total_s,
+        }
+
+    def to_chrome_trace(self, name: str = "louie query") -> dict[str, Any]:
+        """Export the query's timeline as Chrome Trace Event JSON.
+
+        The request phases, each element (from first arrival to last update,
+        with a mark per update), Arrow fetches, display refreshes and auth
+        refreshes get their own tracks.
+
+        Args:
+            name: Label for the query's process track
+
+        Returns:
+            Trace object; serialize with json.dump or use save_trace()
+        """
+        trace = _ChromeTrace(name)
+        request = trace.track("request")
+        end = self.total_s
+        if end is not None:
+            trace.slice(request, name, 0.0, end)
+        if self.headers_s is not None:
+            trace.slice(request, "auth + headers", 0.0, self.headers_s)
+            if self.connect_s is not None:
+                trace.slice(request, "connect", self.headers_s, self.connect_s)
+        if self.ttfb_s is not None:
+            start = self.headers_s or 0.0
+            trace.slice(request, "wait for response", start, self.ttfb_s - start)
+            if self.stream_s is not None:
+                trace.slice(request, "stream", self.ttfb_s, self.stream_s)
+        for label, offset in (
+            ("thread_id", self.thread_id_s),
+            ("first_element", self.first_element_s),
+        ):
+            if offset is not None:
+                trace.mark(request, label, offset)
+
+        for elem_id, updates in self.element_updates.items():
+            elem_type = self.element_types.get(elem_id, "")
+            track = trace.track(f"{elem_type} {elem_id}".strip())
+            trace.slice(
+                track,
+                elem_type or elem_id,
+                updates[0],
+                updates[-1] - updates[0],
+                {"id": elem_id, "updates": len(updates)},
+            )
+            for offset in updates:
+                trace.mark(track, "update", offset)
+
+        if self.arrow_fetches:
+            arrow = trace.track("arrow")
+            for f in self.arrow_fetches:
+                if f.start_s is None:
+                    continue
+                args = {"block_id": f.block_id, "bytes": f.bytes}
+                offset = f.start_s
+                for phase, duration in (
+                    ("arrow fetch", f.fetch_s),
+                    ("arrow decode", f.decode_s),
+                    ("to pandas", f.pandas_s),
+                ):
+                    trace.slice(arrow, phase, offset, duration, args)
+                    offset += duration
+        for label, spans in (("display", self.renders), ("auth", self.auth_refreshes)):
+            if spans:
+                track = trace.track(label)
+                for offset, duration in spans:
+                    trace.slice(track, f"{label} refresh", offset, duration)
+        return trace.data
+
+    def save_trace(
+        self, path: str | os.PathLike[str], name: str = "louie query"
+    ) -> None:
+        """Write the timeline to a JSON file for Perfetto or chrome://tracing.
+
+        Args:
+            path: File to write
+            name: Label for the query's process track
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(name), f)
+
+    @classmethod
+    def aggregate(
+        cls, timings: Iterable["QueryTimings | None"]
+    ) -> dict[str, dict[str, float]]:
+        """Summarize timings across a batch of queries.
+
+        Args:
+            timings: Timings to combine; None entries are skipped
+
+        Returns:
+            Per phase (as in as_dict()), the count, mean, p50, p95 and max
+            over the queries where that phase occurred
+        """
+        samples: dict[str, list[float]] = {}
+        for t in timings:
+            if t is None:
+                continue
+            for phase, value in t.as_dict().items():
+                if value is not None:
+                    samples.setdefault(phase, []).append(float(value))
+        summary = {}
+        for phase, values in samples.items():
+            values.sort()
+            summary[phase] = {
+                "count": len(values),
+                "mean": sum(values) / len(values),
+                "p50": _percentile(values, 50),
+                "p95": _percentile(values, 95),
+                "max": values[-1],
+            }
+        return summary
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Percentile of sorted values, interpolating between closest ranks."""
+    if not ordered:
+        raise ValueError("percentile of empty sample")
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class _ChromeTrace:
+    """Builds a Chrome Trace Event document with one process per query."""
+
+    def __init__(self, name: str):
+        self.events: list[dict[str, Any]] = [
+            {"ph": "M", "pid": 1, "name": "process_name", "args": {"name": name}}
+        ]
+        self._tracks: dict[str, int] = {}
+
+    def track(self, label: str) -> int:
+        """Get the thread id of a named track, creating it on first use."""
+        tid = self._tracks.get(label)
+        if tid is None:
+            tid = self._tracks[label] = len(self._tracks) + 1
+            self.events.append(
+                {
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "name": "thread_name",
+                    "args": {"name": label},
+                }
+            )
+        return tid
+
+    def slice(
+        self,
+        tid: int,
+        name: str,
+        start: float,
+        duration: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a complete event; times are in seconds."""
+        event = {
+            "ph": "X",
+            "pid": 1,
+            "tid": tid,
+            "name": name,
+            "ts": _micros(start),
+            "dur": _micros(duration),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def mark(self, tid: int, name: str, offset: float) -> None:
+        """Add an instant event on a track."""
+        self.events.append(
+            {
+                "ph": "i",
+                "s": "t",
+                "pid": 1,
+                "tid": tid,
+                "name": name,
+                "ts": _micros(offset),
+            }
+        )
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The document, ready for json.dump."""
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+
+def _micros(seconds: float) -> float:
+    """Convert seconds to the trace format's microseconds."""
+    return round(seconds * 1e6, 3)
+
+
+def current_timings() -> QueryTimings | None:
+    """Get the timings of the query running in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def record_timings(timings: QueryTimings) -> Iterator[QueryTimings]:
+    """Make timings the current record for calls made within the block."""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
@@ -0,0 +1,281 @@
+"""Deadline enforcement for streaming chat responses."""
+
+import contextlib
+import logging
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Truncation reasons reported on Response.truncation_reason
+TOTAL_TIMEOUT = "total_timeout"
+IDLE_TIMEOUT = "idle_timeout"
+FIRST_ELEMENT_TIMEOUT = "first_element_timeout"
+TIMEOUT_REASONS = frozenset({TOTAL_TIMEOUT, IDLE_TIMEOUT, FIRST_ELEMENT_TIMEOUT})
+CANCELLED = "cancelled"
+
+
+@dataclass(frozen=True)
+class StreamDeadlines:
+    """Deadlines for a streaming response, in seconds (None disables).
+
+    Attributes:
+        total: Maximum duration of the whole stream
+        idle: Maximum gap between received lines
+        first_element: Maximum wait for the first element payload
+    """
+
+    total: float | None = None
+    idle: float | None = None
+    first_element: float | None = None
+
+
+class StreamTimeoutError(RuntimeError):
+    """Raised when a stream times out before anything usable was received."""
+
+    def __init__(self, message: str, reason: str):
+        """Initialize with the deadline that expired.
+
+        Args:
+            message: Error message
+            reason: Which deadline expired (e.g. "idle_timeout")
+        """
+        self.reason = reason
+        super().__init__(message)
+
+
+def _shutdown(network_stream: object) -> None:
+    """Shut down the socket under an httpcore network stream, if it has one."""
+    get_extra_info = getattr(network_stream, "get_extra_info", None)
+    sock = get_extra_info("socket") if get_extra_info is not None else None
+    if isinstance(sock, socket.socket):
+        with contextlib.suppress(OSError):  # Already closed
+            sock.shutdown(socket.SHUT_RDWR)
+
+
+def abort_response(response: httpx.Response) -> None:
+    """Abort a streaming response from another thread.
+
+    ``response.close()`` alone does not wake a reader blocked in a socket
+    read, so the underlying socket is shut down first.
+
+    Args:
+        response: Open streaming response
+    """
+    extensions = getattr(response, "extensions", None)
+    if isinstance(extensions, dict):
+        _shutdown(extensions.get("network_stream"))
+    response.close()
+
+
+class RequestAborter:
+    """Abort a streaming request from another thread, answered or not.
+
+    Until the response headers arrive there is no response to close, so the
+    connections the request opens are captured through httpcore's ``trace``
+    extension and shut down instead; that wakes a request still waiting for
+    the server to answer.
+
+    Example:
+        >>> aborter = RequestAborter()
+        >>> watchdog = StreamWatchdog(deadlines, on_expire=aborter.abort)
+        >>> client.stream("POST", url, extensions={"trace": aborter.trace})
+    """
+
+    def __init__(self, trace: Callable[[str, dict[str, Any]], None] | None = None):
+        """Initialize the aborter.
+
+        Args:
+            trace: Another ``trace`` callback to pass events on to
+        """
+        self._next_trace = trace
+        self._lock = threading.Lock()
+        self._streams: list[object] = []
+        self._response: httpx.Response | None = None
+        self._aborted = False
+
+    def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Capture new connections; pass as httpx's ``trace`` extension."""
+        if self._next_trace is not None:
+            self._next_trace(event_name, info)
+        if event_name != "connection.connect_tcp.complete":
+            return
+        stream = info.get("return_value")
+        with self._lock:
+            self._streams.append(stream)
+            aborted = self._aborted
+        if aborted:
+            _shutdown(stream)
+
+    def set_response(self, response: httpx.Response) -> None:
+        """Record the response once its headers have arrived."""
+        with self._lock:
+            self._response = response
+            aborted = self._aborted
+        if aborted:
+            abort_response(response)
+
+    def abort(self) -> None:
+        """Abort the request, and any connection it opens from now on."""
+        with self._lock:
+            self._aborted = True
+            streams = list(self._streams)
+            response = self._response
+        for stream in streams:
+            _shutdown(stream)
+        if response is not None:
+            abort_response(response)
+
+
+class StreamWatchdog:
+    """Background timer that enforces StreamDeadlines on an open stream.
+
+    Reading a stream blocks inside httpx, so deadlines cannot be checked from
+    the reading loop alone. The watchdog runs on its own thread and calls
+    ``on_expire`` (typically ``RequestAborter.abort``) when a deadline passes,
+    which unblocks the reader. ``iter_lines`` then ends the iteration and
+    ``reason`` records which deadline expired.
+    """
+
+    def __init__(
+        self, deadlines: StreamDeadlines, on_expire: Callable[[], object] | None = None
+    ):
+        """Initialize the watchdog.
+
+        Args:
+            deadlines: Deadlines to enforce
+            on_expire: Called once from the watchdog thread when a deadline
+                passes or ``expire`` is called
+        """
+        self.deadlines = deadlines
+        self._on_expire = on_expire
+        self.start_time = time.monotonic()
+        self.last_activity = self.start_time
+        self.first_element_time: float | None = None
+        self.reason: str | None = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def expired(self) -> bool:
+        """Whether the stream was cut short."""
+        return self.reason is not None
+
+    def start(self) -> "StreamWatchdog":
+        """Start the watchdog thread (no-op if no deadline is set)."""
+        d = self.deadlines
+        if d.total is None and d.idle is None and d.first_element is None:
+            return self
+        self._thread = threading.Thread(
+            target=self._run, name="louie-stream-watchdog", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the watchdog thread."""
+        self._stopped.set()
+
+    def __enter__(self):
+        """Start the watchdog on entering a with block."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the watchdog on leaving a with block."""
+        self.stop()
+
+    def touch(self) -> None:
+        """Record stream activity, pushing back the idle deadline."""
+        self.last_activity = time.monotonic()
+
+    def expire(self, reason: str) -> None:
+        """Cut the stream short with the given reason.
+
+        Safe to call from any thread; only the first reason is kept.
+
+        Args:
+            reason: Why the stream is being stopped
+        """
+        if self.reason is not None:
+            return
+        self.reason = reason
+        self._stopped.set()
+        if self._on_expire is not None:
+            try:
+                self._on_expire()
+            except Exception:
+                logger.debug("Error closing expired stream", exc_info=True)
+
+    def _next_deadline(self) -> tuple[float, str] | None:
+        """Get the earliest pending deadline and its reason."""
+        d = self.deadlines
+        candidates: list[tuple[float, str]] = []
+        if d.total is not None:
+            candidates.append((self.start_time + d.total, TOTAL_TIMEOUT))
+        if d.idle is not None:
+            candidates.append((self.last_activity + d.idle, IDLE_TIMEOUT))
+        if d.first_element is not None and self.first_element_time is None:
+            candidates.append(
+                (self.start_time + d.first_element, FIRST_ELEMENT_TIMEOUT)
+            )
+        return min(candidates) if candidates else None
+
+    def _run(self) -> None:
+        """Sleep until the next deadline, re-checking as activity moves it."""
+        while not self._stopped.is_set():
+            deadline = self._next_deadline()
+            if deadline is None:
+                self._stopped.wait()
+                return
+            when, reason = deadline
+            remaining = when - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"Louie stream {reason.replace('_', ' ')} after "
+                    f"{time.monotonic() - self.start_time:.1f}s; "
+                    f"returning truncated response"
+                )
+                self.expire(reason)
+                return
+            self._stopped.wait(remaining)
+
+    def iter_lines(self, response: httpx.Response | None) -> Iterator[str]:
+        """Iterate a streaming response's lines under the watchdog.
+
+        Ends early (without raising) when a deadline expires, including
+        httpx's own read timeout, which acts as a backstop for the idle
+        deadline.
+
+        Args:
+            response: Open streaming response, or None when the watchdog
+                stopped the request before the server answered
+
+        Yields:
+            Non-empty lines
+        """
+        if response is None:
+            return
+        try:
+            for line in response.iter_lines():
+                if self.reason is not None:
+                    return
+                self.touch()
+                if not line:
+                    continue
+                if self.first_element_time is None and '"payload"' in line:
+                    self.first_element_time = self.last_activity
+                yield line
+        except httpx.ReadTimeout:
+            if self.reason is None:
+                self.reason = IDLE_TIMEOUT
+        except (httpx.TransportError, httpx.StreamError):
+            # Closing the response from the watchdog thread surfaces as a
+            # read/stream error in the reader; anything else is a real failure
+            if self.reason is None:
+                raise
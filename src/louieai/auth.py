@@ -8,6 +8,9 @@ from typing import Any, TypeVar, cast
 import httpx
 from graphistry.pygraphistry import GraphistryClient
 
+from ._instrumentation import AUTH_REFRESH, instrument
+from ._timings import QueryTimings, current_timings, record_timings
+
 # TypeVar for decorator type preservation
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -200,20 +203,50 @@ def auto_retry_auth(func: F) -> F:
     """Decorator to automatically retry on auth failures.
 
     This decorator will catch auth errors and attempt to refresh
-    the token once before retrying the operation.
+    the token once before retrying the operation. Both attempts share one
+    QueryTimings, so a query's timings include the refresh.
     """
 
     @wraps(func)
     def wrapper(self, *args: Any, **kwargs: Any) -> Any:
-        try:
-            return func(self, *args, **kwargs)
-        except (httpx.HTTPStatusError, RuntimeError) as e:
-            # Check if this might be an auth error
-            if hasattr(self, "auth_manager") and self.auth_manager.handle_auth_error(e):
-                # Auth refreshed, try once more
+        with record_timings(current_timings() or QueryTimings()):
+            try:
                 return func(self, *args, **kwargs)
-            else:
-                # Not an auth error or refresh failed
-                raise
+            except (httpx.HTTPStatusError, RuntimeError) as e:
+                # Check if this might be an auth error
+                if hasattr(self, "auth_manager") and _handle_auth_error(self, e):
+                    # Auth refreshed, try once more
+                    return func(self, *args, **kwargs)
+                else:
+                    # Not an auth error or refresh failed
+                    raise
 
     return cast(F, wrapper)
+
+
+def _handle_auth_error(client: Any, error: Exception) -> bool:
+    """Let the client's auth manager handle an error, recording refreshes.
+
+    Args:
+        client: Client whose call failed
+        error: The failure
+
+    Returns:
+        True if the token was refreshed and the call should be retried
+    """
+    is_401 = (
+        isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 401
+    )
+    timings = current_timings()
+    start = time.perf_counter()
+    instrumentation = getattr(client, "_instrumentation", None)
+    if instrumentation is None or not is_401:
+        refreshed = bool(client.auth_manager.handle_auth_error(error))
+    else:
+        with instrument(instrumentation, AUTH_REFRESH, {"http.status_code": 401}) as op:
+            refreshed = bool(client.auth_manager.handle_auth_error(error))
+            if op is not None:
+                op.attributes["louie.auth.refreshed"] = refreshed
+    if timings is not None and (refreshed or is_401):
+        timings.on_auth_refresh(start)
+    return refreshed
@@ -1,12 +1,21 @@
 """Global cursor implementation for notebook-friendly API."""
 
 import logging
+import os
+import uuid
 from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
-from louieai._client import LouieClient, Response
+from louieai._backends import convert_table, is_result_frame
+from louieai._cancel import QueryFuture, run_in_background
+from louieai._client import LouieClient, Response, dataframe_block_id
+from louieai._session import load_session, save_session
+from louieai._timings import QueryTimings
 
 logger = logging.getLogger(__name__)
 
@@ -379,8 +388,15 @@ class ResponseProxy:
         """Check if response contains errors."""
         return len(self.errors) > 0
 
+    @property
+    def timings(self) -> QueryTimings | None:
+        """Timing breakdown of this query, or None."""
+        if not self._response:
+            return None
+        return getattr(self._response, "timings", None)
+
     def _extract_dataframes(self, response: Response) -> list[pd.DataFrame]:
-        """Extract pandas DataFrames from response."""
+        """Extract dataframes, in the client's result backend, from response."""
         if (
             not hasattr(response, "dataframe_elements")
             or not response.dataframe_elements
@@ -391,7 +407,7 @@ class ResponseProxy:
             if (
                 isinstance(elem, dict)
                 and "table" in elem
-                and isinstance(elem["table"], pd.DataFrame)
+                and is_result_frame(elem["table"])
             ):
                 dfs.append(elem["table"])
         return dfs
@@ -462,6 +478,10 @@ class Cursor:
         >>> lui.traces = True  # Enable reasoning traces
         >>> lui("Complex query", traces=False)  # Override per query
 
+    Background Queries:
+        >>> future = lui.submit("Slow analysis")  # Returns immediately
+        >>> future.result()  # Wait; lui.df etc. then reflect the result
+
     Data Access:
         - lui.df: Latest dataframe (or None)
         - lui.dfs: All dataframes from latest response
@@ -583,6 +603,87 @@ class Cursor:
         Returns:
             Self for chaining and property access
         """
+        self._run_query(prompt, traces=traces, share_mode=share_mode, **kwargs)
+
+        # Return self for chaining and property access
+        return self
+
+    def submit(
+        self,
+        prompt: str,
+        *,
+        traces: bool | None = None,
+        share_mode: str | None = None,
+        **kwargs: Any,
+    ) -> QueryFuture:
+        """Execute a query in the background without blocking.
+
+        The query runs on a worker thread; in Jupyter its streaming display
+        still updates in the cell that submitted it. Once the future is done
+        the response is in the history, so ``lui[-1]`` and ``lui.df``
+        reflect it.
+
+        ```python
+        future = lui.submit("Summarize last week's alerts")
+        # ... keep working in other cells
+        future.result()  # Wait for the Response
+        lui.df
+        ```
+
+        Queries on the same cursor share its thread; use ``lui.new()`` to
+        run independent queries concurrently on separate threads.
+
+        Args:
+            prompt: Natural language query
+            traces: Override session trace setting for this query
+            share_mode: Override default visibility mode for this query (optional)
+            **kwargs: Additional arguments passed to client.query()
+
+        Returns:
+            QueryFuture resolving to the Response; ``cancel()`` stops a
+            running query and keeps its partial result
+        """
+        display_id = None
+        if self._in_jupyter():
+            from .streaming import StreamingDisplay
+
+            # Anchor the display in the submitting cell; the worker thread
+            # updates it in place
+            display_id = f"louie_stream_{uuid.uuid4().hex}"
+            StreamingDisplay(display_id=display_id).show()
+
+        return run_in_background(
+            lambda token: self._run_query(
+                prompt,
+                traces=traces,
+                share_mode=share_mode,
+                cancel_token=token,
+                stream_display_id=display_id,
+                **kwargs,
+            )
+        )
+
+    def _run_query(
+        self,
+        prompt: str,
+        *,
+        traces: bool | None = None,
+        share_mode: str | None = None,
+        stream_display_id: str | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Run a query, record it in history and display it.
+
+        Args:
+            prompt: Natural language query
+            traces: Override session trace setting for this query
+            share_mode: Override default visibility mode for this query
+            stream_display_id: Existing display to stream into (from submit)
+            **kwargs: Additional arguments passed to client.query()
+
+        Returns:
+            Response for the query
+        """
         # Get or create thread
         if self._current_thread is None:
             self._current_thread = self._get_or_create_thread()
@@ -605,11 +706,16 @@ class Cursor:
         # Extract add_cell specific params
         thread_id = params.pop("thread_id")
         agent = params.pop("agent", "LouieAgent")
+        cancel_token = params.pop("cancel_token", None)
+        fetch_dataframes = params.pop("fetch_dataframes", True)
 
         # Execute query
         try:
             # Check if we're in Jupyter and should stream
-            if self._in_jupyter() and self._last_display_id is None:
+            stream = self._in_jupyter() and (
+                self._last_display_id is None or stream_display_id is not None
+            )
+            if stream:
                 # Use streaming display for better UX
                 from .streaming import stream_response
 
@@ -620,13 +726,20 @@ class Cursor:
                     agent=agent,
                     traces=use_traces,
                     share_mode=use_share_mode,
+                    cancel_token=cancel_token,
+                    display_id=stream_display_id,
+                    fetch_dataframes=fetch_dataframes,
                 )
 
                 # Create Response object from streaming result
                 from .._client import Response
 
                 response = Response(
-                    thread_id=result["dthread_id"], elements=result["elements"]
+                    thread_id=result["dthread_id"],
+                    elements=result["elements"],
+                    truncated=result.get("truncation_reason") is not None,
+                    truncation_reason=result.get("truncation_reason"),
+                    timings=result.get("timings"),
                 )
             else:
                 # Non-Jupyter or updating existing display
@@ -636,6 +749,8 @@ class Cursor:
                     agent=agent,
                     traces=use_traces,
                     share_mode=use_share_mode,
+                    cancel_token=cancel_token,
+                    fetch_dataframes=fetch_dataframes,
                 )
 
             # Update thread ID in case it was created
@@ -647,15 +762,10 @@ class Cursor:
 
             # Auto-display in Jupyter if available (only if not streaming)
             # Streaming handles its own display
-            if (
-                not (self._in_jupyter() and self._last_display_id is None)
-                and self._in_jupyter()
-                and kwargs.get("display", True)
-            ):
+            if not stream and self._in_jupyter() and kwargs.get("display", True):
                 self._display(response)
 
-            # Return self for chaining and property access
-            return self
+            return response
 
         except Exception as e:
             logger.error(f"Query failed: {e}")
@@ -708,6 +818,16 @@ class Cursor:
         """Set trace setting for this session."""
         self._traces = value
 
+    @property
+    def result_backend(self) -> str:
+        """Get the type dataframes are returned as."""
+        return self._client.result_backend
+
+    @result_backend.setter
+    def result_backend(self, value: str) -> None:
+        """Set the type dataframes are returned as, e.g. "polars"."""
+        self._client.result_backend = value
+
     @property
     def thread_id(self) -> str | None:
         """Get the current thread ID."""
@@ -818,6 +938,99 @@ class Cursor:
         """Check if latest response contains errors."""
         return len(self.errors) > 0
 
+    @property
+    def timings(self) -> QueryTimings | None:
+        """Timing breakdown of the latest query, or None."""
+        return self[-1].timings
+
+    def fetch_df(
+        self,
+        columns: list[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        block_id: str | None = None,
+    ) -> Any:
+        """Fetch part of a dataframe from the latest response.
+
+        Only the requested columns and rows are transferred when the server
+        supports it, and only they are converted either way. Pair with
+        ``lui(prompt, fetch_dataframes=False)`` to skip the full download.
+
+        Args:
+            columns: Only fetch these columns, in this order
+            limit: Fetch at most this many rows
+            offset: Skip this many rows first
+            block_id: Dataframe block to fetch (default: the latest
+                dataframe element)
+
+        Returns:
+            Dataframe in the client's result backend, or None if the block
+            could not be downloaded or decoded
+
+        Raises:
+            ValueError: If there is no thread yet, or block_id is not given
+                and the latest response has no dataframe element
+            KeyError: If a requested column is not in the dataframe
+
+        Example:
+            >>> lui("Show all hosts with failed logins", fetch_dataframes=False)
+            >>> preview = lui.fetch_df(columns=["host", "failures"], limit=1000)
+        """
+        thread_id, block_id = self._latest_block(block_id)
+        return self._client._fetch_dataframe_arrow(
+            thread_id, block_id, columns=columns, limit=limit, offset=offset
+        )
+
+    def iter_batches(
+        self, block_id: str | None = None, batch_rows: int | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream a dataframe from the latest response as Arrow record batches.
+
+        Pair with ``lui(prompt, fetch_dataframes=False)`` so large results
+        are never loaded whole.
+
+        Args:
+            block_id: Dataframe block to stream (default: the latest
+                dataframe element)
+            batch_rows: Split batches larger than this many rows
+
+        Yields:
+            Arrow record batches, in order
+
+        Raises:
+            ValueError: If there is no thread yet, or block_id is not given
+                and the latest response has no dataframe element
+
+        Example:
+            >>> lui("Export all auth events from last week", fetch_dataframes=False)
+            >>> for batch in lui.iter_batches(batch_rows=100_000):
+            ...     writer.write_batch(batch)
+        """
+        thread_id, block_id = self._latest_block(block_id)
+        yield from self._client.iter_dataframe_batches(
+            thread_id, block_id, batch_rows=batch_rows
+        )
+
+    def _latest_block(self, block_id: str | None) -> tuple[str, str]:
+        """Resolve the thread and dataframe block to fetch from.
+
+        Args:
+            block_id: Explicit block, or None for the latest dataframe element
+
+        Returns:
+            Thread ID and block ID
+        """
+        latest = self._history[-1] if self._history else None
+        if block_id is None:
+            elements = latest.dataframe_elements if latest is not None else []
+            block_id = dataframe_block_id(elements[-1]) if elements else None
+            if block_id is None:
+                raise ValueError("The latest response has no dataframe element")
+        thread_id = (latest.thread_id if latest else None) or self._current_thread
+        if not thread_id:
+            raise ValueError("No thread to fetch from; run a query first")
+        return thread_id, block_id
+
     def __repr__(self) -> str:
         """String representation for interactive help."""
         status_parts = []
@@ -1018,6 +1231,74 @@ class Cursor:
         except IndexError:
             return ResponseProxy(None)
 
+    def save(self, path: str | os.PathLike[str]) -> Path:
+        """Save the thread, history and dataframes to a local directory.
+
+        Elements go to a JSONL file and each dataframe to its own Arrow IPC
+        file, so the session can be reopened later with Cursor.load().
+
+        Args:
+            path: Directory to write; an existing session in it is replaced
+
+        Returns:
+            The session directory
+
+        Example:
+            >>> lui("Show failed logins by host")
+            >>> lui.save("investigations/logins")
+        """
+        return save_session(
+            path,
+            self._history,
+            {
+                "thread_id": self._current_thread,
+                "share_mode": self._share_mode,
+                "name": self._name,
+                "traces": self._traces,
+            },
+        )
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike[str], client: LouieClient | None = None
+    ) -> "Cursor":
+        """Reopen a session saved with save(), without contacting the server.
+
+        Dataframe files are memory-mapped and converted to the client's
+        result backend only when first accessed. Follow-up queries continue
+        the saved thread.
+
+        Args:
+            path: Session directory
+            client: Client for follow-up queries (default: from environment)
+
+        Returns:
+            Cursor with the saved thread and history
+
+        Raises:
+            FileNotFoundError: If path holds no saved session
+
+        Example:
+            >>> lui = Cursor.load("investigations/logins")
+            >>> lui.df  # Latest dataframe, read from disk
+        """
+        cursor = cls(client=client)
+        backend_client = cursor._client
+        responses, metadata = load_session(
+            path,
+            lambda table: convert_table(
+                table,
+                backend_client.result_backend,
+                backend_client._spark_staging_dir,
+            ),
+        )
+        cursor._history.extend(responses)
+        cursor._current_thread = metadata.get("thread_id")
+        cursor._share_mode = metadata.get("share_mode", cursor._share_mode)
+        cursor._name = metadata.get("name")
+        cursor._traces = metadata.get("traces", False)
+        return cursor
+
     def new(self, share_mode: str | None = None, name: str | None = None) -> "Cursor":
         """Create a new Cursor instance with a fresh thread while preserving config.
 
@@ -1069,7 +1350,7 @@ class Cursor:
         )
 
     def _extract_dataframes(self, response: Response) -> list[pd.DataFrame]:
-        """Extract pandas DataFrames from response."""
+        """Extract dataframes, in the client's result backend, from response."""
         if (
             not hasattr(response, "dataframe_elements")
             or not response.dataframe_elements
@@ -1080,7 +1361,7 @@ class Cursor:
             if (
                 isinstance(elem, dict)
                 and "table" in elem
-                and isinstance(elem["table"], pd.DataFrame)
+                and is_result_frame(elem["table"])
             ):
                 dfs.append(elem["table"])
         return dfs
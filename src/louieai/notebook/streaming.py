@@ -2,6 +2,8 @@
 
 import json
 import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
 from typing import Any
 
 try:
@@ -13,6 +15,20 @@ except ImportError:
 
 import httpx
 
+from .._cancel import CancelToken
+from .._client import LouieClient, _raise_for_status, read_chat_stream
+from .._instrumentation import (
+    CHAT,
+    Operation,
+    instrument,
+    response_attributes,
+)
+from .._timings import QueryTimings, current_timings, record_timings
+from .._watchdog import RequestAborter, StreamDeadlines, StreamWatchdog
+
+# Deadlines used when streaming through a client that is not a LouieClient
+_DEFAULT_DEADLINES = StreamDeadlines(idle=120.0)
+
 
 class StreamingDisplay:
     """Handle streaming display of Louie responses in Jupyter."""
@@ -252,25 +268,91 @@ class StreamingDisplay:
             # Throttle updates to avoid flicker (max 10 updates per second)
             current_time = time.time()
             if current_time - self.last_update_time > 0.1:
-                html = self._render_html()
-
-                if self.display_id:
-                    update_display(HTML(html), display_id=self.display_id)
-                else:
-                    clear_output(wait=True)
-                    display(HTML(html))
-
+                self._refresh()
                 self.last_update_time = current_time
 
+    def show(self) -> None:
+        """Show the initial placeholder display."""
+        if HAS_IPYTHON:
+            display(HTML(self._render_html()), display_id=self.display_id)
+
     def finalize(self) -> None:
         """Final display update when streaming is complete."""
         if HAS_IPYTHON:
-            html = self._render_html()
-            if self.display_id:
-                update_display(HTML(html), display_id=self.display_id)
-            else:
-                clear_output(wait=True)
-                display(HTML(html))
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """Redraw the display, timing it into the running query's timings."""
+        start = time.perf_counter()
+        html = self._render_html()
+        if self.display_id:
+            update_display(HTML(html), display_id=self.display_id)
+        else:
+            clear_output(wait=True)
+            display(HTML(html))
+        timings = current_timings()
+        if timings is not None:
+            timings.on_render(start)
+
+
+def _stream_client(client) -> httpx.Client:
+    """Create an HTTP client with timeouts matching the stream deadlines."""
+    if isinstance(client, LouieClient):
+        return client._http_client(
+            httpx.Timeout(client._timeout, read=client._streaming_timeout)
+        )
+    return httpx.Client(timeout=httpx.Timeout(300.0, read=_DEFAULT_DEADLINES.idle))
+
+
+def _timeout_settings(client) -> str:
+    """Describe the stream timeout options, for timeout messages."""
+    if isinstance(client, LouieClient):
+        return client._timeout_settings()
+    return f"streaming_timeout={_DEFAULT_DEADLINES.idle}"
+
+
+@contextmanager
+def _open_chat_stream(
+    client,
+    stream_client: httpx.Client,
+    headers: dict[str, str],
+    params: dict[str, str],
+    cancel_token: CancelToken | None = None,
+) -> Iterator[tuple[httpx.Response | None, StreamWatchdog]]:
+    """Open the chat stream through the client's rate limiter and circuit breaker."""
+    if isinstance(client, LouieClient):
+        with client._open_chat_stream(
+            stream_client, headers, params, cancel_token
+        ) as opened:
+            yield opened
+        return
+    aborter = RequestAborter()
+    with StreamWatchdog(_DEFAULT_DEADLINES, on_expire=aborter.abort) as watchdog:
+        if cancel_token is not None:
+            cancel_token.attach(watchdog)
+        try:
+            with ExitStack() as stack:
+                response = None
+                try:
+                    response = stack.enter_context(
+                        stream_client.stream(
+                            "POST",
+                            f"{client.server_url}/api/chat/",
+                            headers=headers,
+                            params=params,
+                            extensions={"trace": aborter.trace},
+                        )
+                    )
+                except httpx.TransportError:
+                    if not watchdog.expired:
+                        raise
+                if response is not None:
+                    _raise_for_status(response)
+                    aborter.set_response(response)
+                yield response, watchdog
+        finally:
+            if cancel_token is not None:
+                cancel_token.detach()
 
 
 def stream_response(client, thread_id: str, prompt: str, **kwargs) -> dict[str, Any]:
@@ -280,18 +362,63 @@ def stream_response(client, thread_id: str, prompt: str, **kwargs) -> dict[str,
         client: LouieClient instance
         thread_id: Thread ID (empty string for new thread)
         prompt: Query prompt
-        **kwargs: Additional parameters (agent, traces, share_mode, etc.)
+        **kwargs: Additional parameters (agent, traces, share_mode,
+            cancel_token, display_id, fetch_dataframes, etc.)
 
     Returns:
-        Dict with thread_id and elements
+        Dict with dthread_id, elements, truncation_reason (None unless
+        a deadline or cancellation cut the stream short) and timings
     """
+    instrumentation = (
+        getattr(client, "_instrumentation", None)
+        if isinstance(client, LouieClient)
+        else None
+    )
+    with instrument(
+        instrumentation,
+        CHAT,
+        {
+            "louie.thread_id": thread_id or None,
+            "louie.agent": kwargs.get("agent", "LouieAgent"),
+            "louie.share_mode": kwargs.get("share_mode", "Private"),
+        },
+    ) as op:
+        try:
+            result = _stream_response(client, thread_id, prompt, op, **kwargs)
+        finally:
+            # The thread changes even when the stream fails partway
+            _invalidate_thread(client, thread_id)
+        _invalidate_thread(client, result["dthread_id"])
+        if op is not None:
+            op.attributes.update(
+                response_attributes(result["dthread_id"], result["elements"])
+            )
+            op.attributes["louie.truncation_reason"] = result["truncation_reason"]
+        return result
+
+
+def _invalidate_thread(client, thread_id: str | None) -> None:
+    """Drop a thread's cached metadata, as LouieClient does after a query."""
+    if thread_id and isinstance(client, LouieClient):
+        client._thread_cache.invalidate(thread_id)
+
+
+def _stream_response(
+    client, thread_id: str, prompt: str, op: Operation | None, **kwargs
+) -> dict[str, Any]:
+    """Stream and display a response; see stream_response."""
     # Extract parameters
     agent = kwargs.get("agent", "LouieAgent")
     traces = kwargs.get("traces", False)
     share_mode = kwargs.get("share_mode", "Private")
+    cancel_token = kwargs.get("cancel_token")
 
     # Get headers
+    timings = QueryTimings()
     headers = client._get_headers()
+    timings.headers_s = timings.elapsed()
+    if op is not None:
+        headers = op.inject(headers)
 
     # Build parameters
     params = {
@@ -304,50 +431,53 @@ def stream_response(client, thread_id: str, prompt: str, **kwargs) -> dict[str,
     if thread_id:
         params["dthread_id"] = thread_id
 
-    # Create display handler with client for Graphistry URL
-    display_handler = StreamingDisplay(client=client)
+    # Create display handler with client for Graphistry URL; with a
+    # display_id, updates go to that existing display instead of the
+    # current cell output
+    display_handler = StreamingDisplay(
+        display_id=kwargs.get("display_id"), client=client
+    )
 
     # Result to return
-    result: dict[str, Any] = {"dthread_id": None, "elements": []}
+    result: dict[str, Any] = {
+        "dthread_id": None,
+        "elements": [],
+        "truncation_reason": None,
+        "timings": timings,
+    }
     elements_by_id = {}
 
-    # Make streaming request
-    try:
-        with (
-            httpx.Client(timeout=httpx.Timeout(300.0, read=120.0)) as stream_client,
-            stream_client.stream(
-                "POST", f"{client.server_url}/api/chat/", headers=headers, params=params
-            ) as response,
-        ):
-            response.raise_for_status()
-
-            # Process streaming lines
-            for line in response.iter_lines():
-                if not line:
-                    continue
+    def on_line(line: str) -> None:
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        timings.on_line(data)
 
-                try:
-                    data = json.loads(line)
+        # Update display
+        display_handler.update(data)
 
-                    # Update display
-                    display_handler.update(data)
-
-                    # Track data for result
-                    if "dthread_id" in data:
-                        result["dthread_id"] = data["dthread_id"]
-
-                    elif "payload" in data:
-                        elem = data["payload"]
-                        elem_id = elem.get("id")
-                        if elem_id:
-                            elements_by_id[elem_id] = elem
+        # Track data for result
+        if "dthread_id" in data:
+            result["dthread_id"] = data["dthread_id"]
+        elif "payload" in data:
+            elem = data["payload"]
+            elem_id = elem.get("id")
+            if elem_id:
+                elements_by_id[elem_id] = elem
 
-                except json.JSONDecodeError:
-                    continue
+    # Make streaming request; lines are processed until the stream ends, a
+    # deadline passes, or the query is cancelled
+    try:
+        with _stream_client(client) as stream_client, record_timings(timings):
+            result["truncation_reason"] = read_chat_stream(
+                _open_chat_stream(client, stream_client, headers, params, cancel_token),
+                on_line,
+                timings,
+                op,
+                _timeout_settings(client),
+            )
 
-    except httpx.ReadTimeout:
-        # This is expected - server keeps connection open
-        pass
     except Exception as e:
         # Show error in display
         error_elem = {"id": "error", "type": "ExceptionElement", "message": str(e)}
@@ -356,14 +486,15 @@ def stream_response(client, thread_id: str, prompt: str, **kwargs) -> dict[str,
         raise
 
     # Final update
-    display_handler.finalize()
+    with record_timings(timings):
+        display_handler.finalize()
 
     # Convert to list for result
     result["elements"] = list(elements_by_id.values())
 
     # Fetch dataframes if needed
     actual_thread_id = result["dthread_id"]
-    if actual_thread_id and result["elements"]:
+    if actual_thread_id and kwargs.get("fetch_dataframes", True):
         for elem in result["elements"]:
             if elem.get("type") in ["DfElement", "df"]:
                 # Try multiple possible field names for the dataframe ID
@@ -371,8 +502,10 @@ def stream_response(client, thread_id: str, prompt: str, **kwargs) -> dict[str,
 
                 if df_id:
                     # Fetch the actual dataframe via Arrow
-                    df = client._fetch_dataframe_arrow(actual_thread_id, df_id)
+                    with record_timings(timings):
+                        df = client._fetch_dataframe_arrow(actual_thread_id, df_id)
                     if df is not None:
                         elem["table"] = df
 
+    timings.total_s = timings.elapsed()
     return result
@@ -121,6 +121,27 @@ def real_client(test_credentials):
     return LouieClient(server_url=louie_server)
 
 
+@pytest.fixture
+def mock_louie_server():
+    """Local stand-in Louie server; adjust ``server.config`` per test."""
+    from tests.mock_server import MockLouieServer
+
+    with MockLouieServer() as server:
+        yield server
+
+
+@pytest.fixture
+def mock_louie_client(mock_louie_server, mock_graphistry):
+    """LouieClient talking to the local stand-in server over real HTTP."""
+    from louieai._client import LouieClient
+
+    client = LouieClient(
+        server_url=mock_louie_server.url, graphistry_client=mock_graphistry
+    )
+    yield client
+    client._client.close()
+
+
 # Test data fixtures
 @pytest.fixture
 def sample_dataframe_data():
@@ -5,7 +5,20 @@ These fixtures are based on real API responses validated in Step 30.
 
 from unittest.mock import Mock
 
-from louieai import Response, Thread
+from louieai import QueryTimings, Response, Thread
+
+
+def create_mock_timings():
+    """Create realistic query timings for documentation testing."""
+    return QueryTimings(
+        headers_s=0.001,
+        connect_s=0.02,
+        ttfb_s=0.1,
+        thread_id_s=0.1,
+        first_element_s=0.5,
+        stream_s=1.0,
+        total_s=1.1,
+    )
 
 
 def create_mock_responses():
@@ -20,7 +33,9 @@ def create_mock_responses():
             "language": "Markdown",
         }
     ]
-    hello_response = Response("D_mockThread123", hello_elements)
+    hello_response = Response(
+        "D_mockThread123", hello_elements, timings=create_mock_timings()
+    )
 
     # Text response with analysis
     analysis_elements = [
@@ -40,7 +55,9 @@ Key insights:
             "language": "Markdown",
         }
     ]
-    analysis_response = Response("D_mockThread456", analysis_elements)
+    analysis_response = Response(
+        "D_mockThread456", analysis_elements, timings=create_mock_timings()
+    )
 
     # DataFrame response
     df_elements = [
@@ -60,7 +77,9 @@ Key insights:
             },
         }
     ]
-    df_response = Response("D_mockThread789", df_elements)
+    df_response = Response(
+        "D_mockThread789", df_elements, timings=create_mock_timings()
+    )
 
     # Mock DataFrame
     import pandas as pd
@@ -98,7 +117,9 @@ Key insights:
             },
         },
     ]
-    mixed_response = Response("D_mockMixed", mixed_elements)
+    mixed_response = Response(
+        "D_mockMixed", mixed_elements, timings=create_mock_timings()
+    )
 
     return {
         "hello": hello_response,
@@ -148,9 +169,54 @@ def create_mock_client():
         Thread(id="D_thread2", name="Data Exploration"),
     ]
 
+    # Mock iter_threads, walking the same listing
+    mock_client.iter_threads.side_effect = lambda *args, **kwargs: iter(
+        mock_client.list_threads.return_value
+    )
+
     # Mock get_thread
     mock_client.get_thread.return_value = Thread(
         id="D_thread1", name="Analysis Session"
     )
 
+    # Mock get_threads, in the order asked for
+    mock_client.get_threads.side_effect = lambda thread_ids, **kwargs: [
+        Thread(id=thread_id, name="Analysis Session") for thread_id in thread_ids
+    ]
+
     return mock_client
+
+
+def create_mock_cursor(client):
+    """Create a mock notebook cursor (what louie() returns) over a client."""
+    import pyarrow as pa
+
+    from louieai.notebook.cursor import Cursor
+
+    responses = create_mock_responses()
+    table = pa.Table.from_pandas(responses["mock_df"], preserve_index=False)
+
+    mock_cursor = Mock(spec=Cursor)
+    mock_cursor._client = client
+    mock_cursor.return_value = mock_cursor
+
+    # Stream the latest dataframe as record batches
+    def mock_iter_batches(block_id=None, batch_rows=None):
+        return iter(table.to_batches(max_chunksize=batch_rows))
+
+    mock_cursor.iter_batches.side_effect = mock_iter_batches
+
+    # Fetch part of the latest dataframe
+    hosts = responses["mock_df"].rename(
+        columns={"name": "host", "total_purchases": "failures"}
+    )
+
+    def mock_fetch_df(columns=None, limit=None, offset=None, block_id=None):
+        start = offset or 0
+        end = None if limit is None else start + limit
+        df = hosts.iloc[start:end].reset_index(drop=True)
+        return df if columns is None else df[columns]
+
+    mock_cursor.fetch_df.side_effect = mock_fetch_df
+
+    return mock_cursor
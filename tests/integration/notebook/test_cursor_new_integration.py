@@ -135,6 +135,9 @@ class TestCursorNewIntegration:
                 agent="LouieAgent",
                 traces=False,
                 share_mode="Private",
+                cancel_token=None,
+                display_id=None,
+                fetch_dataframes=True,
             )
 
         # Create new cursor with different share_mode
@@ -160,6 +163,9 @@ class TestCursorNewIntegration:
                 agent="LouieAgent",
                 traces=False,
                 share_mode="Organization",  # Inherited from new()
+                cancel_token=None,
+                display_id=None,
+                fetch_dataframes=True,
             )
 
     def test_error_handling_preserved_in_new(self):
@@ -3,6 +3,7 @@
 from io import BytesIO
 from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import pandas as pd
 import pyarrow as pa
 import pyarrow.ipc as ipc
@@ -186,7 +187,7 @@ class TestArrowDataFrameIntegration:
             mock_httpx_instance = Mock()
             mock_httpx_instance.stream.return_value = mock_stream_cm
             # Make Arrow fetch fail
-            mock_httpx_instance.get.side_effect = Exception("Network error")
+            mock_httpx_instance.get.side_effect = httpx.ConnectError("Network error")
             mock_httpx.return_value.__enter__.return_value = mock_httpx_instance
 
             # Patch the client's _client attribute
@@ -0,0 +1,537 @@
+"""Local stand-in Louie server for load, latency and end-to-end tests.
+
+Serves the endpoints the client uses over real HTTP, so JSONL streaming and
+Arrow transfer are exercised without network access:
+
+- ``POST /api/chat/``: chunked JSONL stream of generated elements
+- ``GET /api/dthread/{thread_id}/df/block/{block_id}/arrow``: Arrow IPC
+  table, optionally narrowed by ``columns``, ``limit`` and ``offset`` and
+  IPC-compressed with ``compression``; byte ``Range`` requests are honoured
+- ``GET /api/dthreads`` and ``GET /api/dthreads/{thread_id}``: thread listing,
+  and each thread's elements from the chats sent to it; lookups send an
+  ETag and Last-Modified and answer conditional requests with 304
+
+Use from pytest through the ``mock_louie_server`` fixture, or run standalone:
+
+    python -m tests.mock_server --port 8765 --elements 20 --line-delay 0.05
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import io
+import json
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pyarrow as pa
+
+
+@dataclass
+class MockServerConfig:
+    """Shape and timing of generated responses.
+
+    Attributes:
+        text_elements: Text elements per chat response
+        updates_per_element: Streaming updates sent for each text element
+        df_elements: Dataframe elements per chat response
+        chars_per_update: Characters appended by each text update
+        first_element_delay: Seconds before the first element is sent
+        line_delay: Seconds between streamed lines
+        df_rows: Rows in each generated Arrow table
+        df_cols: Columns in each generated Arrow table
+        arrow_delay: Seconds before an Arrow response is sent
+        arrow_slicing: Honour the columns, limit and offset query
+            parameters on Arrow blocks
+        content_encoding: Compress Arrow responses with this HTTP content
+            encoding ("gzip") when the client accepts it
+        arrow_ranges: Advertise and honour byte Range requests on Arrow blocks
+        arrow_drops: Arrow responses to cut off partway, to exercise resumes
+        arrow_drop_bytes: Body bytes sent before a response is cut off
+        threads: Threads reported by /api/dthreads before any chat
+        max_page_size: Largest thread listing page served, whatever page
+            size is asked for (None serves the size asked for)
+        expired_tokens: Chat requests to reject with an expired-JWT 401,
+            to exercise token refreshes
+        arrow_expired_tokens: Arrow requests to reject the same way
+    """
+
+    text_elements: int = 1
+    updates_per_element: int = 3
+    df_elements: int = 0
+    chars_per_update: int = 40
+    first_element_delay: float = 0.0
+    line_delay: float = 0.0
+    df_rows: int = 100
+    df_cols: int = 5
+    arrow_delay: float = 0.0
+    arrow_slicing: bool = True
+    content_encoding: str | None = None
+    arrow_ranges: bool = True
+    arrow_drops: int = 0
+    arrow_drop_bytes: int = 0
+    threads: int = 5
+    max_page_size: int | None = None
+    expired_tokens: int = 0
+    arrow_expired_tokens: int = 0
+
+
+@dataclass
+class MockServerStats:
+    """Requests served and the latest request headers, by endpoint.
+
+    Endpoints are "chat", "arrow", "threads" (listing) and "thread" (lookup).
+    """
+
+    requests: dict[str, int] = field(default_factory=dict)
+    last_headers: dict[str, dict[str, str]] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, endpoint: str, headers: dict[str, str] | None = None) -> None:
+        """Count a request and keep its headers."""
+        with self.lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            if headers is not None:
+                self.last_headers[endpoint] = headers
+
+
+def make_arrow_table(rows: int, cols: int) -> pa.Table:
+    """Generate a deterministic table mixing numeric and string columns.
+
+    Args:
+        rows: Number of rows
+        cols: Number of columns
+
+    Returns:
+        Arrow table
+    """
+    rng = np.random.default_rng(rows * 1000 + cols)
+    columns: dict[str, Any] = {}
+    for i in range(cols):
+        kind = i % 3
+        if kind == 0:
+            columns[f"int_{i}"] = np.arange(rows, dtype=np.int64)
+        elif kind == 1:
+            columns[f"float_{i}"] = rng.random(rows)
+        else:
+            columns[f"str_{i}"] = [f"value_{j % 50}" for j in range(rows)]
+    return pa.table(columns)
+
+
+def arrow_ipc_bytes(table: pa.Table, compression: str | None = None) -> bytes:
+    """Serialize a table in the Arrow IPC file format.
+
+    Args:
+        table: Table to write
+        compression: IPC buffer codec, "lz4" or "zstd" (default: none)
+    """
+    sink = io.BytesIO()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+class MockLouieServer:
+    """Threaded HTTP server emulating the Louie API.
+
+    Example:
+        >>> with MockLouieServer(MockServerConfig(text_elements=10)) as server:
+        ...     client = LouieClient(server_url=server.url, ...)
+    """
+
+    def __init__(
+        self,
+        config: MockServerConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the server (not yet listening).
+
+        Args:
+            config: Response shape and timing; may be changed while running
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.config = config or MockServerConfig()
+        self.stats = MockServerStats()
+        self.threads: dict[str, str] = {
+            f"D_mock_{i:04d}": f"Mock thread {i}" for i in range(self.config.threads)
+        }
+        self.thread_elements: dict[str, list[dict[str, Any]]] = {
+            tid: [] for tid in self.threads
+        }
+        self.thread_modified: dict[str, str] = dict.fromkeys(
+            self.threads, "2025-01-01T00:00:00+00:00"
+        )
+        self._arrow_cache: dict[tuple[int, int], bytes] = {}
+        self._arrow_dropped = 0
+        self._expired_sent = {"chat": 0, "arrow": 0}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass as the client's server_url."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "MockLouieServer":
+        """Start serving on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="mock-louie-server",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        """Start on entering a with block."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop on leaving a with block."""
+        self.stop()
+
+    def arrow_payload(self) -> bytes:
+        """Get the Arrow IPC bytes for the configured table size."""
+        key = (self.config.df_rows, self.config.df_cols)
+        with self._lock:
+            payload = self._arrow_cache.get(key)
+            if payload is None:
+                payload = arrow_ipc_bytes(make_arrow_table(*key))
+                self._arrow_cache[key] = payload
+        return payload
+
+    def arrow_slice(self, params: dict[str, list[str]]) -> bytes:
+        """Get Arrow IPC bytes narrowed by columns, limit and offset params.
+
+        Only the parameters enabled in the config are honoured; the
+        compression parameter always is.
+        """
+        table = make_arrow_table(self.config.df_rows, self.config.df_cols)
+        if self.config.arrow_slicing:
+            if "columns" in params:
+                table = table.select(params["columns"])
+            offset = int(params.get("offset", ["0"])[0])
+            limit = params.get("limit")
+            table = table.slice(offset, int(limit[0]) if limit else None)
+        codec = params.get("compression", [None])[0]
+        return arrow_ipc_bytes(table, compression=codec)
+
+    def take_expired(self, route: str) -> bool:
+        """Whether to reject the next ``route`` request as expired."""
+        limit = (
+            self.config.expired_tokens
+            if route == "chat"
+            else self.config.arrow_expired_tokens
+        )
+        with self._lock:
+            if self._expired_sent[route] >= limit:
+                return False
+            self._expired_sent[route] += 1
+            return True
+
+    def take_drop(self) -> bool:
+        """Whether to cut off the next Arrow response, counting it if so."""
+        with self._lock:
+            if self._arrow_dropped >= self.config.arrow_drops:
+                return False
+            self._arrow_dropped += 1
+            return True
+
+    def add_elements(self, thread_id: str, elements: list[dict[str, Any]]) -> None:
+        """Append final elements to a thread and mark it modified."""
+        with self._lock:
+            self.thread_elements.setdefault(thread_id, []).extend(elements)
+            self.thread_modified[thread_id] = datetime.now(timezone.utc).isoformat()
+
+    def chat_lines(self, thread_id: str) -> list[tuple[float, dict[str, Any]]]:
+        """Build the (delay, message) sequence for one chat response.
+
+        Args:
+            thread_id: Thread the response belongs to
+
+        Returns:
+            Messages with the delay to wait before sending each
+        """
+        cfg = self.config
+        lines: list[tuple[float, dict[str, Any]]] = [(0.0, {"dthread_id": thread_id})]
+        first_delay = cfg.first_element_delay
+        for i in range(cfg.text_elements):
+            text = ""
+            for _ in range(max(1, cfg.updates_per_element)):
+                text += ("lorem ipsum " * cfg.chars_per_update)[: cfg.chars_per_update]
+                payload = {"id": f"B_text_{i:04d}", "type": "TextElement", "text": text}
+                lines.append((first_delay or cfg.line_delay, {"payload": payload}))
+                first_delay = 0.0
+        for i in range(cfg.df_elements):
+            payload = {
+                "id": f"B_df_{i:04d}",
+                "type": "DfElement",
+                "df_id": f"B_df_{i:04d}",
+                "metadata": {"shape": [cfg.df_rows, cfg.df_cols]},
+            }
+            lines.append((first_delay or cfg.line_delay, {"payload": payload}))
+            first_delay = 0.0
+        return lines
+
+
+# Thread listing parameters that are not field filters
+_LISTING_PARAMS = {"page", "page_size", "sort_by", "sort_order"}
+
+
+def _make_handler(server: MockLouieServer) -> type[BaseHTTPRequestHandler]:
+    """Create a request handler class bound to a server instance."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without TCP_NODELAY,
+        # Nagle plus delayed ACKs add ~40ms to every small response
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:
+            """Silence per-request logging."""
+
+        def _send_json(
+            self, status: int, body: Any, headers: dict[str, str] | None = None
+        ) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_thread(self, item: dict[str, Any]) -> None:
+            """Send a thread with validators, or 304 if the client's is current."""
+            body = {**item, "elements": server.thread_elements.get(item["id"], [])}
+            digest = hashlib.sha256(json.dumps(body, sort_keys=True).encode())
+            etag = f'"{digest.hexdigest()[:16]}"'
+            validators = {"ETag": etag}
+            modified = None
+            if item["last_modified"]:
+                modified = datetime.fromisoformat(item["last_modified"])
+                validators["Last-Modified"] = format_datetime(modified, usegmt=True)
+            if_none_match = self.headers.get("If-None-Match")
+            if_modified_since = self.headers.get("If-Modified-Since")
+            if if_none_match is not None:
+                not_modified = if_none_match == etag
+            elif if_modified_since is not None and modified is not None:
+                since = parsedate_to_datetime(if_modified_since)
+                not_modified = modified.replace(microsecond=0) <= since
+            else:
+                not_modified = False
+            if not_modified:
+                self.send_response(304)
+                for name, value in validators.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+            self._send_json(200, body, validators)
+
+        def _write_chunk(self, data: bytes) -> None:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+
+        def do_POST(self) -> None:
+            """Stream a chat response."""
+            url = urlparse(self.path)
+            if url.path.rstrip("/") != "/api/chat":
+                self._send_json(404, {"detail": "Not found"})
+                return
+            server.stats.record("chat", dict(self.headers))
+            if server.take_expired("chat"):
+                self._send_json(401, {"detail": "JWT token has expired"})
+                return
+            params = parse_qs(url.query)
+            thread_id = params.get("dthread_id", [""])[0]
+            if not thread_id:
+                thread_id = f"D_mock_{uuid.uuid4().hex[:12]}"
+                query = params.get("query", [""])[0]
+                server.threads[thread_id] = query[:50]
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            final: dict[str, dict[str, Any]] = {}
+            try:
+                for delay, message in server.chat_lines(thread_id):
+                    if delay:
+                        time.sleep(delay)
+                    self._write_chunk(json.dumps(message).encode() + b"\n")
+                    if "payload" in message:
+                        final[message["payload"]["id"]] = message["payload"]
+                self.wfile.write(b"0\r\n\r\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                # Client cancelled or timed out mid-stream
+                self.close_connection = True
+            server.add_elements(thread_id, list(final.values()))
+
+        def do_GET(self) -> None:
+            """Serve Arrow blocks and thread listings."""
+            url = urlparse(self.path)
+            parts = url.path.strip("/").split("/")
+
+            # /api/dthread/{thread_id}/df/block/{block_id}/arrow
+            if len(parts) == 7 and parts[:2] == ["api", "dthread"]:
+                server.stats.record("arrow", dict(self.headers))
+                if server.take_expired("arrow"):
+                    self._send_json(401, {"detail": "JWT token has expired"})
+                    return
+                if server.config.arrow_delay:
+                    time.sleep(server.config.arrow_delay)
+                params = parse_qs(url.query)
+                data = server.arrow_slice(params) if params else server.arrow_payload()
+                sha256 = hashlib.sha256(data)
+                etag = f'"{sha256.hexdigest()[:16]}"'
+                digest = base64.b64encode(sha256.digest()).decode()
+                status, content_range = 200, None
+                byte_range = self.headers.get("Range", "")
+                if (
+                    server.config.arrow_ranges
+                    and byte_range.startswith("bytes=")
+                    and self.headers.get("If-Range", etag) == etag
+                ):
+                    first, _, last = byte_range[len("bytes=") :].partition("-")
+                    end = int(last) + 1 if last else len(data)
+                    status = 206
+                    content_range = f"bytes {first}-{end - 1}/{len(data)}"
+                    data = data[int(first) : end]
+                encoding = server.config.content_encoding
+                accepted = self.headers.get("Accept-Encoding", "")
+                if status == 200 and encoding == "gzip" and "gzip" in accepted:
+                    data = gzip.compress(data, compresslevel=1)
+                else:
+                    encoding = None
+                self.send_response(status)
+                self.send_header("Content-Type", "application/vnd.apache.arrow.file")
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
+                if server.config.arrow_ranges:
+                    self.send_header("Accept-Ranges", "bytes")
+                    self.send_header("ETag", etag)
+                    self.send_header("Repr-Digest", f"sha-256=:{digest}:")
+                if content_range:
+                    self.send_header("Content-Range", content_range)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if server.take_drop():
+                    # Send part of the body, then drop the connection
+                    self.wfile.write(data[: server.config.arrow_drop_bytes])
+                    self.wfile.flush()
+                    self.connection.shutdown(socket.SHUT_RDWR)
+                    self.close_connection = True
+                    return
+                self.wfile.write(data)
+                return
+
+            if parts[:2] == ["api", "dthreads"]:
+                endpoint = "thread" if len(parts) == 3 else "threads"
+                server.stats.record(endpoint, dict(self.headers))
+                items = [
+                    {
+                        "id": tid,
+                        "name": name,
+                        "last_modified": server.thread_modified.get(tid),
+                    }
+                    for tid, name in list(server.threads.items())
+                ]
+                if len(parts) == 3:
+                    match = [item for item in items if item["id"] == parts[2]]
+                    if match:
+                        self._send_thread(match[0])
+                    else:
+                        self._send_json(404, {"detail": "Thread not found"})
+                    return
+                params = parse_qs(url.query)
+                page = int(params.get("page", ["1"])[0])
+                page_size = int(params.get("page_size", ["20"])[0])
+                if server.config.max_page_size:
+                    page_size = min(page_size, server.config.max_page_size)
+                sort_by = params.get("sort_by", [""])[0]
+                if sort_by:
+                    items.sort(
+                        key=lambda item: item.get(sort_by) or "",
+                        reverse=params.get("sort_order", ["asc"])[0] == "desc",
+                    )
+                # Any other parameter naming a thread field filters on it
+                for key, values in params.items():
+                    if key not in _LISTING_PARAMS:
+                        items = [item for item in items if item.get(key) in values]
+                start = (page - 1) * page_size
+                self._send_json(
+                    200,
+                    {
+                        "items": items[start : start + page_size],
+                        "total": len(items),
+                        "page": page,
+                        "page_size": page_size,
+                    },
+                )
+                return
+
+            self._send_json(404, {"detail": "Not found"})
+
+    return Handler
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the mock server from the command line."""
+    defaults = MockServerConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--elements", type=int, default=defaults.text_elements)
+    parser.add_argument("--updates", type=int, default=defaults.updates_per_element)
+    parser.add_argument("--dfs", type=int, default=defaults.df_elements)
+    parser.add_argument("--first-delay", type=float, default=0.0)
+    parser.add_argument("--line-delay", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=defaults.df_rows)
+    parser.add_argument("--cols", type=int, default=defaults.df_cols)
+    args = parser.parse_args(argv)
+
+    config = MockServerConfig(
+        text_elements=args.elements,
+        updates_per_element=args.updates,
+        df_elements=args.dfs,
+        first_element_delay=args.first_delay,
+        line_delay=args.line_delay,
+        df_rows=args.rows,
+        df_cols=args.cols,
+    )
+    server = MockLouieServer(config, host=args.host, port=args.port)
+    print(f"Mock Louie server listening on {server.url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
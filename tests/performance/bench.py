@@ -0,0 +1,364 @@
+"""End-to-end client benchmarks against the local mock Louie server.
+
+Measures the full ``add_cell``, ``stream_response`` and Arrow fetch paths over
+real HTTP across stream and dataframe sizes, reporting latency percentiles,
+throughput, peak RSS and allocations. Results are written as JSON so runs can
+be compared between versions:
+
+    python -m tests.performance.bench --output bench.json
+    python -m tests.performance.bench --baseline bench.json --threshold 0.15
+
+The second form exits non-zero if any scenario regressed by more than the
+threshold relative to the baseline.
+"""
+
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from unittest.mock import Mock, patch
+
+from louieai._client import LouieClient
+from louieai._timings import _percentile
+from louieai.notebook.streaming import stream_response
+from tests.mock_server import MockLouieServer, MockServerConfig
+
+# (name, server config overrides) for each scenario size
+STREAM_SIZES: dict[str, dict[str, int]] = {
+    "small": {"text_elements": 5, "updates_per_element": 4},
+    "medium": {"text_elements": 50, "updates_per_element": 10},
+    "large": {"text_elements": 200, "updates_per_element": 25},
+}
+DF_SIZES: dict[str, dict[str, int]] = {
+    "1k": {"df_rows": 1_000, "df_cols": 6},
+    "100k": {"df_rows": 100_000, "df_cols": 6},
+    "1m": {"df_rows": 1_000_000, "df_cols": 6},
+}
+QUICK_STREAM_SIZES = ("small", "medium")
+QUICK_DF_SIZES = ("1k", "100k")
+
+# Lower-is-better and higher-is-better metrics checked for regressions
+LATENCY_METRICS = ("p50_ms", "p95_ms")
+THROUGHPUT_METRICS = ("ops_per_sec",)
+
+
+@dataclass
+class BenchResult:
+    """Measurements for one scenario.
+
+    Attributes:
+        name: Scenario name, e.g. "add_cell[medium]"
+        params: Server configuration used
+        iterations: Timed iterations
+        p50_ms: Median latency
+        p95_ms: 95th percentile latency
+        p99_ms: 99th percentile latency
+        mean_ms: Mean latency
+        ops_per_sec: Completed operations per second
+        peak_rss_mb: Process peak resident set size after the scenario
+        alloc_peak_kb: Peak traced Python allocation during one operation
+        alloc_blocks: Python memory blocks allocated during one operation
+    """
+
+    name: str
+    params: dict[str, Any]
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    ops_per_sec: float
+    peak_rss_mb: float
+    alloc_peak_kb: float
+    alloc_blocks: int
+
+
+@dataclass
+class BenchReport:
+    """All scenario results plus environment details."""
+
+    results: list[BenchResult]
+    environment: dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        """Serialize to JSON."""
+        return json.dumps(
+            {
+                "environment": self.environment,
+                "results": [asdict(r) for r in self.results],
+            },
+            indent=2,
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "BenchReport":
+        """Load a report saved with to_json."""
+        data = json.loads(text)
+        return cls(
+            results=[BenchResult(**r) for r in data["results"]],
+            environment=data.get("environment", {}),
+        )
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure_allocations(operation: Callable[[], object]) -> tuple[float, int]:
+    """Run an operation once under tracemalloc.
+
+    Kept separate from the timed runs since tracing slows allocation down.
+
+    Args:
+        operation: Operation to measure
+
+    Returns:
+        Peak traced KB and number of blocks allocated
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(max(0, stat.count_diff) for stat in after.compare_to(before, "lineno"))
+    return peak / 1024, blocks
+
+
+def run_benchmark(
+    name: str,
+    operation: Callable[[], object],
+    params: dict[str, Any],
+    iterations: int = 20,
+    warmup: int = 2,
+) -> BenchResult:
+    """Time an operation and collect its statistics.
+
+    Args:
+        name: Scenario name
+        operation: Operation to run once per iteration
+        params: Parameters recorded with the result
+        iterations: Timed iterations
+        warmup: Untimed iterations run first
+
+    Returns:
+        BenchResult for the scenario
+    """
+    for _ in range(warmup):
+        operation()
+
+    samples: list[float] = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - start
+
+    alloc_peak_kb, alloc_blocks = measure_allocations(operation)
+    samples.sort()
+    return BenchResult(
+        name=name,
+        params=params,
+        iterations=iterations,
+        p50_ms=_percentile(samples, 50),
+        p95_ms=_percentile(samples, 95),
+        p99_ms=_percentile(samples, 99),
+        mean_ms=sum(samples) / len(samples),
+        ops_per_sec=iterations / elapsed if elapsed > 0 else float("inf"),
+        peak_rss_mb=peak_rss_mb(),
+        alloc_peak_kb=alloc_peak_kb,
+        alloc_blocks=alloc_blocks,
+    )
+
+
+@contextmanager
+def benchmark_client(
+    server: MockLouieServer, **overrides: int
+) -> Iterator[LouieClient]:
+    """Configure the server and yield a client connected to it."""
+    server.config = MockServerConfig(**overrides)
+    graphistry_client = Mock()
+    graphistry_client.api_token = Mock(return_value="bench-token")
+    client = LouieClient(server_url=server.url, graphistry_client=graphistry_client)
+    try:
+        yield client
+    finally:
+        client._client.close()
+
+
+def run_suite(
+    stream_sizes: tuple[str, ...] = QUICK_STREAM_SIZES,
+    df_sizes: tuple[str, ...] = QUICK_DF_SIZES,
+    iterations: int = 20,
+) -> BenchReport:
+    """Run all scenarios against a fresh mock server.
+
+    Args:
+        stream_sizes: Keys of STREAM_SIZES to run
+        df_sizes: Keys of DF_SIZES to run
+        iterations: Timed iterations per scenario
+
+    Returns:
+        BenchReport with one result per scenario
+    """
+    from louieai import __version__
+
+    results: list[BenchResult] = []
+    with MockLouieServer() as server:
+        for size in stream_sizes:
+            params = STREAM_SIZES[size]
+            with benchmark_client(server, **params) as client:
+                results.append(
+                    run_benchmark(
+                        f"add_cell[{size}]",
+                        lambda c=client: c.add_cell("", "bench"),
+                        params,
+                        iterations,
+                    )
+                )
+                # Display output is disabled; this times parsing and merging
+                with patch("louieai.notebook.streaming.HAS_IPYTHON", False):
+                    results.append(
+                        run_benchmark(
+                            f"stream_response[{size}]",
+                            lambda c=client: stream_response(c, "", "bench"),
+                            params,
+                            iterations,
+                        )
+                    )
+
+        for size in df_sizes:
+            params = DF_SIZES[size]
+            with benchmark_client(server, **params) as client:
+                # Large tables get fewer iterations to keep runs reasonable
+                n = max(3, iterations // (1 + params["df_rows"] // 100_000))
+                results.append(
+                    run_benchmark(
+                        f"arrow_fetch[{size}]",
+                        lambda c=client: c._fetch_dataframe_arrow("D_bench", "B_df"),
+                        params,
+                        n,
+                        warmup=1,
+                    )
+                )
+
+    return BenchReport(
+        results=results,
+        environment={
+            "louieai": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+    )
+
+
+def find_regressions(
+    current: BenchReport, baseline: BenchReport, threshold: float = 0.10
+) -> list[str]:
+    """Compare two reports scenario by scenario.
+
+    Args:
+        current: Report from this run
+        baseline: Report to compare against
+        threshold: Allowed relative slowdown (0.10 = 10%)
+
+    Returns:
+        Human-readable descriptions of each regression (empty if none)
+    """
+    base_by_name = {r.name: r for r in baseline.results}
+    regressions = []
+    for result in current.results:
+        base = base_by_name.get(result.name)
+        if base is None:
+            continue
+        for metric in LATENCY_METRICS:
+            now, then = getattr(result, metric), getattr(base, metric)
+            if then > 0 and now > then * (1 + threshold):
+                regressions.append(
+                    f"{result.name} {metric}: {then:.2f} -> {now:.2f} "
+                    f"(+{(now / then - 1) * 100:.0f}%)"
+                )
+        for metric in THROUGHPUT_METRICS:
+            now, then = getattr(result, metric), getattr(base, metric)
+            if then > 0 and now < then * (1 - threshold):
+                regressions.append(
+                    f"{result.name} {metric}: {then:.1f} -> {now:.1f} "
+                    f"({(now / then - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def format_report(report: BenchReport) -> str:
+    """Render results as a fixed-width table."""
+    header = (
+        f"{'scenario':<24}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'ops/s':>9}{'rss MB':>9}{'alloc KB':>10}{'blocks':>9}"
+    )
+    rows = [header, "-" * len(header)]
+    for r in report.results:
+        rows.append(
+            f"{r.name:<24}{r.p50_ms:>9.2f}{r.p95_ms:>9.2f}{r.p99_ms:>9.2f}"
+            f"{r.ops_per_sec:>9.1f}{r.peak_rss_mb:>9.1f}{r.alloc_peak_kb:>10.0f}"
+            f"{r.alloc_blocks:>9}"
+        )
+    return "\n".join(rows)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Allowed relative regression (default: 0.10)",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--full", action="store_true", help="Include the largest stream and df sizes"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        stream_sizes=tuple(STREAM_SIZES) if args.full else QUICK_STREAM_SIZES,
+        df_sizes=tuple(DF_SIZES) if args.full else QUICK_DF_SIZES,
+        iterations=args.iterations,
+    )
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report.to_json())
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = BenchReport.from_json(f.read())
+        regressions = find_regressions(report, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
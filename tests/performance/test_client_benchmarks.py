@@ -0,0 +1,119 @@
+"""End-to-end client benchmarks with optional regression gating.
+
+Set ``LOUIE_BENCH_OUTPUT`` to save results as JSON, and
+``LOUIE_BENCH_BASELINE`` (plus optionally ``LOUIE_BENCH_THRESHOLD``, default
+0.10) to fail when a scenario regresses against a saved baseline.
+"""
+
+import dataclasses
+import os
+
+import pytest
+
+from louieai._timings import _percentile
+from tests.performance.bench import (
+    BenchReport,
+    BenchResult,
+    find_regressions,
+    run_suite,
+)
+
+
+def make_result(name="add_cell[small]", **overrides):
+    """Create a BenchResult with plausible defaults."""
+    values = {
+        "name": name,
+        "params": {},
+        "iterations": 10,
+        "p50_ms": 10.0,
+        "p95_ms": 20.0,
+        "p99_ms": 25.0,
+        "mean_ms": 12.0,
+        "ops_per_sec": 80.0,
+        "peak_rss_mb": 100.0,
+        "alloc_peak_kb": 50.0,
+        "alloc_blocks": 100,
+    }
+    values.update(overrides)
+    return BenchResult(**values)
+
+
+class TestBenchStatistics:
+    """Test the statistics and comparison helpers."""
+
+    def test_percentile_interpolates(self):
+        """Test percentiles interpolate between ranks."""
+        samples = [float(v) for v in range(1, 101)]
+        assert _percentile(samples, 50) == pytest.approx(50.5)
+        assert _percentile(samples, 99) == pytest.approx(99.01)
+        assert _percentile([3.0], 95) == 3.0
+
+    def test_percentile_rejects_empty(self):
+        """Test an empty sample is an error."""
+        with pytest.raises(ValueError):
+            _percentile([], 50)
+
+    def test_find_regressions_flags_slowdowns(self):
+        """Test latency increases and throughput drops beyond threshold."""
+        baseline = BenchReport([make_result()])
+        slower = BenchReport([make_result(p95_ms=25.0, ops_per_sec=60.0)])
+
+        regressions = find_regressions(slower, baseline, threshold=0.10)
+
+        assert len(regressions) == 2
+        assert "p95_ms" in regressions[0]
+        assert "ops_per_sec" in regressions[1]
+
+    def test_find_regressions_within_threshold(self):
+        """Test small changes and new scenarios are not regressions."""
+        baseline = BenchReport([make_result()])
+        current = BenchReport(
+            [make_result(p50_ms=10.5), make_result("arrow_fetch[1m]", p50_ms=999.0)]
+        )
+
+        assert find_regressions(current, baseline, threshold=0.10) == []
+
+    def test_report_json_round_trip(self):
+        """Test reports survive saving and loading."""
+        report = BenchReport([make_result()], environment={"python": "3.12"})
+
+        loaded = BenchReport.from_json(report.to_json())
+
+        assert loaded.environment == {"python": "3.12"}
+        assert dataclasses.asdict(loaded.results[0]) == dataclasses.asdict(
+            report.results[0]
+        )
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    os.environ.get("CI") == "true",
+    reason="Performance tests are unreliable in CI due to variable system load",
+)
+class TestClientBenchmarks:
+    """Run the quick benchmark suite against the local mock server."""
+
+    def test_quick_suite(self):
+        """Test every scenario produces sane measurements."""
+        report = run_suite(iterations=5)
+
+        names = {r.name for r in report.results}
+        assert {"add_cell[small]", "stream_response[small]", "arrow_fetch[1k]"} <= names
+        for result in report.results:
+            assert 0 < result.p50_ms <= result.p95_ms <= result.p99_ms
+            assert result.ops_per_sec > 0
+            assert result.peak_rss_mb > 0
+            assert result.alloc_blocks > 0
+
+        output = os.environ.get("LOUIE_BENCH_OUTPUT")
+        if output:
+            with open(output, "w") as f:
+                f.write(report.to_json())
+
+        baseline_path = os.environ.get("LOUIE_BENCH_BASELINE")
+        if baseline_path:
+            with open(baseline_path) as f:
+                baseline = BenchReport.from_json(f.read())
+            threshold = float(os.environ.get("LOUIE_BENCH_THRESHOLD", "0.10"))
+            regressions = find_regressions(report, baseline, threshold)
+            assert not regressions, "\n".join(regressions)
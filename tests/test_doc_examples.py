@@ -80,7 +80,7 @@ def is_executable_code(code: str) -> bool:
 
 def create_test_environment() -> dict[str, Any]:
     """Create a test environment with mocked dependencies."""
-    from tests.doc_fixtures import create_mock_client
+    from tests.doc_fixtures import create_mock_client, create_mock_cursor
 
     # Mock graphistry module
     mock_graphistry = Mock()
@@ -96,9 +96,13 @@ def create_test_environment() -> dict[str, Any]:
     mock_df = Mock()
     mock_df.describe = Mock(return_value="DataFrame description")
 
+    # Mock notebook cursor returned by louie()
+    mock_louie = Mock(return_value=create_mock_cursor(mock_client))
+
     # Mock louieai module
     mock_louieai = Mock()
     mock_louieai.LouieClient = Mock(return_value=mock_client)
+    mock_louieai.louie = mock_louie
 
     # Create namespace
     namespace = {
@@ -108,6 +112,7 @@ def create_test_environment() -> dict[str, Any]:
         "df": mock_df,
         "df2": mock_df,
         "client": mock_client,
+        "louie": mock_louie,
         "g": mock_graphistry,  # For graphistry client examples
         "print": print,  # Allow print statements
         "__builtins__": __builtins__,
@@ -124,9 +129,12 @@ class TestDocumentationExamples:
     """Test all documentation code examples."""
 
     @pytest.fixture
-    def mock_env(self):
+    def mock_env(self, monkeypatch):
         """Provide mocked test environment."""
-        return create_test_environment()
+        env = create_test_environment()
+        # Examples import louie from the real package
+        monkeypatch.setattr("louieai.louie", env["louie"])
+        return env
 
     def test_index_examples(self, mock_env):
         """Test examples from index.md."""
@@ -150,7 +158,7 @@ class TestDocumentationExamples:
             except Exception as e:
                 pytest.fail(f"Example at line {line_num} failed: {e}\nCode:\n{code}")
 
-    def test_client_api_examples(self, mock_env):
+    def test_client_api_examples(self, mock_env, tmp_path, monkeypatch):
         """Test examples from api/client.md."""
         doc_file = Path("docs/api/client.md")
         if not doc_file.exists():
@@ -160,6 +168,8 @@ class TestDocumentationExamples:
         executable_blocks = [
             (code, line, ctx) for code, line, ctx in blocks if is_executable_code(code)
         ]
+        # Some examples write files
+        monkeypatch.chdir(tmp_path)
 
         print(f"\nTesting {len(executable_blocks)} examples from {doc_file}")
 
@@ -1,9 +1,14 @@
 """Mock objects and utilities for unit testing."""
 
 import json
+import threading
 from typing import Any
 from unittest.mock import Mock
 
+import httpx
+
+from louieai._timings import QueryTimings
+
 
 class MockDataFrame:
     """Mock pandas DataFrame that behaves like real one for tests."""
@@ -72,6 +77,15 @@ class MockResponse:
         self.thread_id = thread_id
         self.type = self._get_type_name(response_type)
         self.id = f"B_{response_type}_{id(self)}"
+        self.timings = QueryTimings(
+            headers_s=0.001,
+            connect_s=0.02,
+            ttfb_s=0.1,
+            thread_id_s=0.1,
+            first_element_s=0.5,
+            stream_s=1.0,
+            total_s=1.1,
+        )
         self._setup_response_data(response_type)
 
     def _get_type_name(self, response_type: str) -> str:
@@ -209,6 +223,7 @@ class MockThread:
         self.name = name or f"Thread {thread_id}"
         self.created_at = "2024-01-01T00:00:00Z"
         self.updated_at = "2024-01-01T00:00:00Z"
+        self.last_modified = self.updated_at
         self.cells = []
 
 
@@ -281,9 +296,12 @@ def create_mock_client():
         response_type = determine_response_type(prompt)
         return create_mock_response(response_type, thread_id)
 
-    def list_threads(page=1, page_size=20):
+    def list_threads(page=1, page_size=20, **kwargs):
         return list(threads.values())[:page_size]
 
+    def iter_threads(page_size=100, prefetch=2, **kwargs):
+        return iter(list(threads.values()))
+
     def get_thread(thread_id):
         # If the thread doesn't exist, create a mock one for testing
         if thread_id not in threads:
@@ -291,11 +309,16 @@ def create_mock_client():
             threads[thread_id] = thread
         return threads.get(thread_id)
 
+    def get_threads(thread_ids, concurrency=8):
+        return [get_thread(thread_id) for thread_id in thread_ids]
+
     # Set up client methods
     client.create_thread = Mock(side_effect=create_thread)
     client.add_cell = Mock(side_effect=add_cell)
     client.list_threads = Mock(side_effect=list_threads)
+    client.iter_threads = Mock(side_effect=iter_threads)
     client.get_thread = Mock(side_effect=get_thread)
+    client.get_threads = Mock(side_effect=get_threads)
     client.register = Mock(return_value=client)
 
     # Make client callable (for v0.2.0+ interface)
@@ -366,6 +389,35 @@ class MockJSONLResponse:
         return "\n".join(self._lines)
 
 
+class BlockingResponse:
+    """Fake streaming response that yields lines then blocks until closed."""
+
+    def __init__(self, lines, interval=0.0, hang=True):
+        self._lines = lines
+        self._interval = interval
+        self._hang = hang
+        self._closed = threading.Event()
+        self.status_code = 200
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        for line in self._lines:
+            if self._closed.is_set():
+                raise httpx.StreamClosed()
+            yield line
+            if self._interval:
+                self._closed.wait(self._interval)
+        if self._hang:
+            self._closed.wait(10)
+            raise httpx.ReadError("connection closed")
+
+    def close(self):
+        self._closed.set()
+
+
 def create_mock_jsonl_response(thread_id: str, prompt: str) -> MockJSONLResponse:
     """Create a mock JSONL response for API testing."""
     elements = [
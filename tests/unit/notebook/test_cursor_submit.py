@@ -0,0 +1,137 @@
+"""Unit tests for non-blocking Cursor.submit()."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from louieai import Response
+from louieai._cancel import QueryFuture
+from louieai.notebook.cursor import Cursor
+
+
+def df_response(thread_id="D_001"):
+    """Create a Response with a single dataframe element."""
+    df = pd.DataFrame({"a": [1, 2]})
+    return Response(
+        thread_id=thread_id,
+        elements=[{"type": "DfElement", "id": "B_001", "table": df}],
+    )
+
+
+class TestCursorSubmit:
+    """Test Cursor.submit background execution."""
+
+    def test_submit_returns_future(self):
+        """Test submit returns immediately with a QueryFuture."""
+        release = threading.Event()
+        mock_client = Mock()
+
+        def slow_add_cell(**kwargs):
+            release.wait(5)
+            return df_response()
+
+        mock_client.add_cell.side_effect = slow_add_cell
+        cursor = Cursor(client=mock_client)
+
+        with patch.object(cursor, "_in_jupyter", return_value=False):
+            future = cursor.submit("Slow query")
+            assert isinstance(future, QueryFuture)
+            assert not future.done()
+            assert cursor.df is None
+
+            release.set()
+            response = future.result(timeout=5)
+
+        assert response.thread_id == "D_001"
+        assert cursor._current_thread == "D_001"
+
+    def test_history_updated_when_done(self):
+        """Test lui[-1] and lui.df resolve once the future completes."""
+        mock_client = Mock()
+        mock_client.add_cell.return_value = df_response()
+        cursor = Cursor(client=mock_client)
+
+        with patch.object(cursor, "_in_jupyter", return_value=False):
+            future = cursor.submit("Query")
+            future.result(timeout=5)
+
+        assert cursor[-1].df is not None
+        assert list(cursor.df["a"]) == [1, 2]
+
+    def test_submit_passes_cancel_token(self):
+        """Test the query receives the future's cancel token."""
+        mock_client = Mock()
+        mock_client.add_cell.return_value = df_response()
+        cursor = Cursor(client=mock_client)
+
+        with patch.object(cursor, "_in_jupyter", return_value=False):
+            future = cursor.submit("Query", traces=True)
+            future.result(timeout=5)
+
+        call_kwargs = mock_client.add_cell.call_args[1]
+        assert call_kwargs["cancel_token"] is future.token
+        assert call_kwargs["traces"] is True
+
+    def test_submits_on_separate_cursors_run_concurrently(self):
+        """Test queries on separate threads overlap rather than serialize."""
+        mock_client = Mock()
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def add_cell(**kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.1)
+            with lock:
+                running -= 1
+            return df_response(f"D_{kwargs['prompt']}")
+
+        mock_client.add_cell.side_effect = add_cell
+        cursors = [Cursor(client=mock_client) for _ in range(3)]
+
+        with patch.object(Cursor, "_in_jupyter", return_value=False):
+            futures = [c.submit(str(i)) for i, c in enumerate(cursors)]
+            responses = [f.result(timeout=5) for f in futures]
+
+        assert peak == 3
+        assert [r.thread_id for r in responses] == ["D_0", "D_1", "D_2"]
+
+    def test_submit_error_surfaces_from_result(self):
+        """Test query errors are raised from future.result()."""
+        mock_client = Mock()
+        mock_client.add_cell.side_effect = RuntimeError("API down")
+        cursor = Cursor(client=mock_client)
+
+        with patch.object(cursor, "_in_jupyter", return_value=False):
+            future = cursor.submit("Query")
+            with pytest.raises(RuntimeError, match="API down"):
+                future.result(timeout=5)
+
+        assert len(cursor._history) == 0
+
+    def test_jupyter_streams_into_anchored_display(self):
+        """Test notebook submits stream into a display created up front."""
+        mock_client = Mock()
+        cursor = Cursor(client=mock_client)
+        result = {"dthread_id": "D_001", "elements": [], "truncation_reason": None}
+
+        with (
+            patch.object(cursor, "_in_jupyter", return_value=True),
+            patch("louieai.notebook.streaming.StreamingDisplay.show") as mock_show,
+            patch(
+                "louieai.notebook.streaming.stream_response", return_value=result
+            ) as mock_stream,
+        ):
+            future = cursor.submit("Query")
+            response = future.result(timeout=5)
+
+        mock_show.assert_called_once()
+        display_id = mock_stream.call_args[1]["display_id"]
+        assert display_id.startswith("louie_stream_")
+        assert response.thread_id == "D_001"
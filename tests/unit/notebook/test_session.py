@@ -0,0 +1,105 @@
+"""Tests for saving and reopening notebook sessions."""
+
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from louieai._session import SESSION_VERSION, LazyTableElement, load_session
+from louieai.notebook import Cursor
+
+
+@pytest.fixture
+def saved(mock_louie_server, mock_louie_client, tmp_path):
+    """Cursor with one text and one dataframe answer, saved to disk."""
+    mock_louie_server.config.df_elements = 1
+    lui = Cursor(client=mock_louie_client, name="Logins")
+    lui._in_jupyter = lambda: False
+    lui.traces = True
+    lui("show data")
+    lui.save(tmp_path / "session")
+    return lui, tmp_path / "session"
+
+
+@pytest.mark.unit
+class TestSessionSaveLoad:
+    """Test Cursor.save() and Cursor.load()."""
+
+    def test_layout(self, saved):
+        """Test the session holds JSON, JSONL and one Arrow file."""
+        _, path = saved
+
+        meta = json.loads((path / "session.json").read_text())
+        assert meta["version"] == SESSION_VERSION
+        assert meta["name"] == "Logins"
+        assert len((path / "history.jsonl").read_text().splitlines()) == 1
+        assert len(list((path / "dataframes").glob("*.arrow"))) == 1
+
+    def test_roundtrip(self, saved, mock_louie_client):
+        """Test a loaded cursor has the same thread, settings and data."""
+        lui, path = saved
+
+        restored = Cursor.load(path, client=mock_louie_client)
+
+        assert restored.thread_id == lui.thread_id
+        assert restored._name == "Logins"
+        assert restored.traces is True
+        assert len(restored._history) == len(lui._history)
+        pd.testing.assert_frame_equal(restored.df, lui.df)
+        assert restored.text == lui.text
+
+    def test_load_without_network(self, saved, mock_louie_server, mock_louie_client):
+        """Test reopening and reading dataframes makes no requests."""
+        _, path = saved
+        before = dict(mock_louie_server.stats.requests)
+
+        restored = Cursor.load(path, client=mock_louie_client)
+        assert restored.df is not None
+
+        assert mock_louie_server.stats.requests == before
+
+    def test_dataframes_load_lazily(self, saved, mock_louie_client):
+        """Test tables are converted on first access, with the current backend."""
+        _, path = saved
+        mock_louie_client.result_backend = "pyarrow"
+        converted = []
+
+        def convert(table):
+            converted.append(table)
+            return table
+
+        responses, _ = load_session(path, convert)
+        elem = next(e for e in responses[0].elements if isinstance(e, LazyTableElement))
+
+        assert converted == []
+        assert "table" in elem
+        assert isinstance(elem["table"], pa.Table)
+        assert elem.get("table") is elem["table"]
+        assert len(converted) == 1
+
+    def test_save_replaces_stale_frames(self, saved, mock_louie_client):
+        """Test saving again over a session drops its old dataframe files."""
+        _, path = saved
+        stale = path / "dataframes" / "9999-000.arrow"
+        stale.write_bytes(b"")
+
+        Cursor.load(path, client=mock_louie_client).save(path)
+
+        assert not stale.exists()
+        assert len(list((path / "dataframes").glob("*.arrow"))) == 1
+
+    def test_unknown_version(self, saved, mock_louie_client):
+        """Test sessions from a newer version are refused."""
+        _, path = saved
+        meta = json.loads((path / "session.json").read_text())
+        meta["version"] = SESSION_VERSION + 1
+        (path / "session.json").write_text(json.dumps(meta))
+
+        with pytest.raises(ValueError, match="session version"):
+            Cursor.load(path, client=mock_louie_client)
+
+    def test_missing_session(self, tmp_path, mock_louie_client):
+        """Test loading a directory without a session fails clearly."""
+        with pytest.raises(FileNotFoundError):
+            Cursor.load(tmp_path, client=mock_louie_client)
@@ -218,6 +218,33 @@ class TestStreamResponse:
         assert len(result["elements"]) == 2
         assert result["elements"][1]["type"] == "DfElement"
 
+    def test_streaming_interrupt_keeps_partial(self, mock_client):
+        """Test Ctrl-C mid-stream returns the elements already shown."""
+
+        def interrupted_lines():
+            yield '{"dthread_id": "D_test123"}'
+            yield '{"payload": {"id": "B_001", "type": "TextElement", "text": "Hi"}}'
+            raise KeyboardInterrupt
+
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.iter_lines.return_value = interrupted_lines()
+
+        mock_stream_cm = Mock()
+        mock_stream_cm.__enter__ = Mock(return_value=mock_response)
+        mock_stream_cm.__exit__ = Mock(return_value=None)
+
+        with patch("httpx.Client") as mock_httpx:
+            mock_httpx_instance = Mock()
+            mock_httpx_instance.stream.return_value = mock_stream_cm
+            mock_httpx.return_value.__enter__.return_value = mock_httpx_instance
+
+            result = stream_response(mock_client, thread_id="", prompt="Slow query")
+
+        assert result["dthread_id"] == "D_test123"
+        assert len(result["elements"]) == 1
+        assert result["truncation_reason"] == "cancelled"
+
     def test_streaming_error_handling(self, mock_client):
         """Test error handling during streaming."""
         # Mock httpx to raise error
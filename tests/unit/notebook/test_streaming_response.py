@@ -41,7 +41,7 @@ class TestStreamingResponse:
             client._auth_manager = MagicMock()
             client._auth_manager.get_token.return_value = "test-token"
 
-            response = client.add_cell("", "Create a dataframe")
+            response = client.add_cell("", "Create a dataframe", fetch_dataframes=False)
 
             # Should have both text and dataframe elements
             assert len(response.elements) == 2
@@ -86,7 +86,7 @@ class TestStreamingResponse:
             client._auth_manager = MagicMock()
             client._auth_manager.get_token.return_value = "test-token"
 
-            response = client.add_cell("", "Create a dataframe")
+            response = client.add_cell("", "Create a dataframe", fetch_dataframes=False)
 
             # Should have both elements
             assert len(response.elements) == 2
@@ -0,0 +1,259 @@
+"""Tests for dataframe result backends."""
+
+import importlib.util
+import sys
+from unittest.mock import DEFAULT, Mock, patch
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from louieai._backends import (
+    _remove_all_staged,
+    convert_table,
+    is_result_frame,
+    read_arrow_ipc,
+    to_arrow,
+    to_spark,
+    validate_backend,
+)
+from louieai._client import LouieClient
+from louieai.notebook.cursor import Cursor
+from tests.mock_server import arrow_ipc_bytes, make_arrow_table
+
+HAS_POLARS = importlib.util.find_spec("polars") is not None
+HAS_DUCKDB = importlib.util.find_spec("duckdb") is not None
+HAS_PYSPARK = importlib.util.find_spec("pyspark") is not None
+
+
+@pytest.mark.unit
+class TestConversion:
+    """Test decoding and conversion helpers."""
+
+    def test_read_is_zero_copy(self):
+        """Test decoded columns point into the payload buffer."""
+        payload = arrow_ipc_bytes(make_arrow_table(1000, 1))
+        source = pa.py_buffer(payload)
+
+        table = read_arrow_ipc(payload)
+
+        data = table.column(0).chunks[0].buffers()[1]
+        assert source.address <= data.address < source.address + source.size
+
+    def test_pandas_and_pyarrow(self):
+        """Test the built-in backends."""
+        table = make_arrow_table(5, 2)
+
+        assert isinstance(convert_table(table, "pandas"), pd.DataFrame)
+        assert convert_table(table, "pyarrow") is table
+
+    def test_to_arrow(self):
+        """Test result frames convert back to Arrow tables."""
+        table = make_arrow_table(5, 3)
+
+        assert to_arrow(table) is table
+        back = to_arrow(convert_table(table, "pandas"))
+        assert back.to_pydict() == table.to_pydict()
+        with pytest.raises(TypeError, match="result frame"):
+            to_arrow([1, 2, 3])
+
+    def test_invalid_backend(self):
+        """Test unknown backends are rejected up front."""
+        with pytest.raises(ValueError, match="result_backend"):
+            validate_backend("spreadsheet")
+        with pytest.raises(ValueError, match="result_backend"):
+            LouieClient(result_backend="spreadsheet")
+
+    @pytest.mark.skipif(HAS_POLARS, reason="polars is installed")
+    def test_polars_missing(self):
+        """Test a clear error when polars is not installed."""
+        with pytest.raises(ImportError, match=r"louieai\[polars\]"):
+            convert_table(make_arrow_table(1, 1), "polars")
+
+    @pytest.mark.parametrize(
+        ("backend", "package", "extra"),
+        [
+            ("polars", "polars", "polars"),
+            ("duckdb", "duckdb", "duckdb"),
+            ("spark", "pyspark", "spark"),
+        ],
+    )
+    def test_missing_package_rejected_when_set(
+        self, backend, package, extra, mock_louie_client
+    ):
+        """Test a backend whose package is missing fails when it is chosen."""
+        hint = rf"louieai\[{extra}\]"
+        with patch.dict(sys.modules, {package: None}):
+            with pytest.raises(ImportError, match=hint):
+                validate_backend(backend)
+            with pytest.raises(ImportError, match=hint):
+                LouieClient(result_backend=backend)
+            with pytest.raises(ImportError, match=hint):
+                mock_louie_client.result_backend = backend
+        assert mock_louie_client.result_backend == "pandas"
+
+    @pytest.mark.skipif(not HAS_POLARS, reason="polars not installed")
+    def test_polars(self):
+        """Test tables become polars DataFrames."""
+        df = convert_table(make_arrow_table(5, 2), "polars")
+
+        assert df.shape == (5, 2)
+        assert is_result_frame(df)
+
+    @pytest.mark.skipif(not HAS_DUCKDB, reason="duckdb not installed")
+    def test_duckdb(self):
+        """Test tables become DuckDB relations."""
+        rel = convert_table(make_arrow_table(5, 2), "duckdb")
+
+        assert rel.aggregate("count(*)").fetchone()[0] == 5
+        assert is_result_frame(rel)
+
+
+@pytest.mark.unit
+class TestBackendAdapters:
+    """Test the polars and DuckDB adapters against stand-in packages."""
+
+    @pytest.fixture
+    def package(self, monkeypatch):
+        """Install a stand-in module under a backend's package name."""
+
+        def install(name):
+            module = Mock(__name__=name)
+            monkeypatch.setitem(sys.modules, name, module)
+            return module
+
+        return install
+
+    def _frame(self, module, table):
+        """A result frame whose type lives in module, converting back to table."""
+        frame_type = type("Frame", (), {"__module__": f"{module}.frame"})
+        frame = frame_type()
+        frame.to_arrow = lambda: table
+        frame.to_arrow_table = lambda: table
+        return frame
+
+    def test_polars(self, package):
+        """Test tables are wrapped by polars without rechunking, and back."""
+        pl = package("polars")
+        table = make_arrow_table(5, 2)
+
+        df = convert_table(table, "polars")
+
+        pl.from_arrow.assert_called_once_with(table, rechunk=False)
+        assert df is pl.from_arrow.return_value
+        frame = self._frame("polars", table)
+        assert is_result_frame(frame)
+        assert to_arrow(frame) is table
+
+    def test_duckdb(self, package):
+        """Test tables become DuckDB relations, and back."""
+        duckdb = package("duckdb")
+        table = make_arrow_table(5, 2)
+
+        rel = convert_table(table, "duckdb")
+
+        duckdb.from_arrow.assert_called_once_with(table)
+        assert rel is duckdb.from_arrow.return_value
+        frame = self._frame("duckdb", table)
+        assert is_result_frame(frame)
+        assert to_arrow(frame) is table
+
+
+@pytest.mark.unit
+class TestClientBackend:
+    """Test the backend applies to fetched dataframes."""
+
+    def test_pyarrow_backend_end_to_end(self, mock_louie_server, mock_louie_client):
+        """Test add_cell and lui.df return Arrow tables."""
+        mock_louie_server.config.df_elements = 1
+        mock_louie_client.result_backend = "pyarrow"
+        lui = Cursor(client=mock_louie_client)
+        lui._in_jupyter = lambda: False
+
+        lui("show data")
+
+        assert isinstance(lui.df, pa.Table)
+        assert lui.df.num_rows == 100
+        assert len(lui.dfs) == 1
+
+    def test_conversion_errors_propagate(self, mock_louie_server, mock_louie_client):
+        """Test a failing conversion raises instead of returning no dataframe."""
+        with (
+            patch("louieai._client.convert_table", side_effect=TypeError("bad table")),
+            pytest.raises(TypeError, match="bad table"),
+        ):
+            mock_louie_client.result_backend = "pyarrow"
+            mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+
+    def test_cursor_setting_validates(self, mock_louie_client):
+        """Test lui.result_backend updates the client."""
+        lui = Cursor(client=mock_louie_client)
+
+        lui.result_backend = "pyarrow"
+        assert mock_louie_client.result_backend == "pyarrow"
+        with pytest.raises(ValueError):
+            lui.result_backend = "excel"
+        assert lui.result_backend == "pyarrow"
+
+
+@pytest.mark.unit
+class TestSparkBackend:
+    """Test loading tables into Spark."""
+
+    @pytest.fixture
+    def spark(self):
+        """Fake active Spark session installed as pyspark."""
+        session = Mock()
+        sql = Mock()
+        sql.SparkSession.getActiveSession.return_value = session
+        pyspark = Mock(__version__="3.5.1", sql=sql)
+        with patch.dict(sys.modules, {"pyspark": pyspark, "pyspark.sql": sql}):
+            yield session
+
+    @pytest.mark.skipif(HAS_PYSPARK, reason="pyspark is installed")
+    def test_pyspark_missing(self):
+        """Test a clear error when pyspark is not installed."""
+        with pytest.raises(ImportError, match=r"louieai\[spark\]"):
+            convert_table(make_arrow_table(1, 1), "spark")
+
+    def test_small_tables_load_from_memory(self, spark, tmp_path):
+        """Test small tables skip staging even with a staging directory."""
+        convert_table(make_arrow_table(10, 2), "spark", str(tmp_path))
+
+        (pdf,) = spark.createDataFrame.call_args[0]
+        assert isinstance(pdf, pd.DataFrame) and pdf.shape == (10, 2)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_large_tables_are_staged(self, spark, tmp_path):
+        """Test large tables go through Parquet that is removed once loaded."""
+        staged_rows = []
+        frame = spark.read.parquet.return_value
+
+        def checkpoint(eager):
+            (path,) = spark.read.parquet.call_args[0]
+            staged_rows.append(pq.read_table(path).num_rows)
+            return DEFAULT
+
+        frame.localCheckpoint.side_effect = checkpoint
+        with patch("louieai._backends.SPARK_STAGING_ROWS", 5):
+            result = to_spark(make_arrow_table(10, 2), str(tmp_path))
+
+        assert staged_rows == [10]
+        frame.localCheckpoint.assert_called_once_with(eager=True)
+        assert result is frame.localCheckpoint.return_value
+        assert list(tmp_path.iterdir()) == []
+
+    def test_staged_file_kept_until_exit_without_checkpoints(self, spark, tmp_path):
+        """Test a lazily read staging file is only removed at exit."""
+        frame = spark.read.parquet.return_value
+        frame.localCheckpoint.side_effect = RuntimeError("not supported")
+        with patch("louieai._backends.SPARK_STAGING_ROWS", 5):
+            result = to_spark(make_arrow_table(10, 2), str(tmp_path))
+
+        assert result is frame
+        (staged,) = tmp_path.iterdir()
+        spark.read.parquet.assert_called_once_with(str(staged))
+
+        _remove_all_staged()
+        assert list(tmp_path.iterdir()) == []
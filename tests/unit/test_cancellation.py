@@ -0,0 +1,269 @@
+"""Unit tests for cancelling in-flight queries."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from louieai._cancel import CancelToken, QueryFuture
+from louieai._client import LouieClient
+from louieai._watchdog import CANCELLED, StreamDeadlines, StreamWatchdog
+
+from .mocks import BlockingResponse
+
+THREAD_LINE = '{"dthread_id": "D_001"}'
+TEXT_LINE = '{"payload": {"id": "B_001", "type": "TextElement", "text": "Hi"}}'
+
+
+@pytest.fixture
+def mock_graphistry_client():
+    """Mock GraphistryClient instance."""
+    mock = Mock()
+    mock.api_token = Mock(return_value="fake-token-123")
+    return mock
+
+
+@pytest.fixture
+def patch_stream():
+    """Route chat streams to the given fake responses."""
+    patcher = patch("louieai._client.httpx.Client")
+    mock_client_class = patcher.start()
+
+    def route(*responses):
+        stream_cms = []
+        for response in responses:
+            cm = Mock()
+            cm.__enter__ = Mock(return_value=response)
+            cm.__exit__ = Mock(return_value=None)
+            stream_cms.append(cm)
+        mock_client_instance = Mock()
+        mock_client_instance.stream.side_effect = stream_cms
+        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
+        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_class.return_value = mock_client_instance
+
+    yield route
+    patcher.stop()
+
+
+@pytest.mark.unit
+class TestCancelToken:
+    """Test CancelToken stream abort behavior."""
+
+    def test_cancel_expires_attached_watchdog(self):
+        """Test cancelling aborts the running stream."""
+        on_expire = Mock()
+        watchdog = StreamWatchdog(StreamDeadlines(), on_expire=on_expire)
+        token = CancelToken()
+        token.attach(watchdog)
+
+        token.cancel()
+
+        assert token.cancelled
+        assert watchdog.reason == CANCELLED
+        on_expire.assert_called_once()
+
+    def test_attach_after_cancel_aborts_immediately(self):
+        """Test a stream opened after cancellation is aborted at once."""
+        token = CancelToken()
+        token.cancel()
+        watchdog = StreamWatchdog(StreamDeadlines())
+
+        token.attach(watchdog)
+
+        assert watchdog.reason == CANCELLED
+
+    def test_detached_watchdog_not_expired(self):
+        """Test cancelling after the stream finished has no effect on it."""
+        watchdog = StreamWatchdog(StreamDeadlines())
+        token = CancelToken()
+        token.attach(watchdog)
+        token.detach()
+
+        token.cancel()
+
+        assert watchdog.reason is None
+
+
+@pytest.mark.unit
+class TestQueryFuture:
+    """Test QueryFuture cancel semantics."""
+
+    def test_cancel_before_start(self):
+        """Test a pending future is cancelled like a plain Future."""
+        future = QueryFuture()
+        assert future.cancel()
+        assert future.cancelled()
+        assert not future.cancel_requested
+
+    def test_cancel_while_running_requests_stop(self):
+        """Test a running future signals its token instead of cancelling."""
+        future = QueryFuture()
+        future.set_running_or_notify_cancel()
+
+        assert future.cancel()
+        assert future.cancel_requested
+        assert not future.cancelled()
+
+    def test_cancel_after_done(self):
+        """Test a finished future cannot be cancelled."""
+        future = QueryFuture()
+        future.set_running_or_notify_cancel()
+        future.set_result("done")
+
+        assert not future.cancel()
+        assert not future.cancel_requested
+
+
+@pytest.mark.unit
+class TestClientCancellation:
+    """Test LouieClient returns partial results when cancelled."""
+
+    def test_cancel_token_returns_partial_response(
+        self, mock_graphistry_client, patch_stream
+    ):
+        """Test cancelling mid-stream keeps the elements received."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        patch_stream(BlockingResponse([THREAD_LINE, TEXT_LINE]))
+        token = CancelToken()
+        threading.Timer(0.1, token.cancel).start()
+
+        start = time.monotonic()
+        response = client.add_cell("", "hello", cancel_token=token)
+
+        assert time.monotonic() - start < 2
+        assert response.thread_id == "D_001"
+        assert len(response.elements) == 1
+        assert response.truncated is True
+        assert response.truncation_reason == CANCELLED
+
+    def test_cancel_before_output_returns_empty_response(
+        self, mock_graphistry_client, patch_stream
+    ):
+        """Test cancelling before any output keeps the requested thread."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        patch_stream(BlockingResponse([]))
+        token = CancelToken()
+        token.cancel()
+
+        response = client.add_cell("D_existing", "hello", cancel_token=token)
+
+        assert response.thread_id == "D_existing"
+        assert response.elements == []
+        assert response.truncation_reason == CANCELLED
+
+    def test_keyboard_interrupt_returns_partial_response(
+        self, mock_graphistry_client, patch_stream
+    ):
+        """Test Ctrl-C after output started returns what arrived."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        response = Mock()
+        response.status_code = 200
+        response.headers = {}
+
+        def interrupted_lines():
+            yield THREAD_LINE
+            yield TEXT_LINE
+            raise KeyboardInterrupt
+
+        response.iter_lines.return_value = interrupted_lines()
+        patch_stream(response)
+
+        result = client.add_cell("", "hello")
+
+        assert result.thread_id == "D_001"
+        assert len(result.elements) == 1
+        assert result.truncation_reason == CANCELLED
+
+    def test_keyboard_interrupt_without_output_propagates(
+        self, mock_graphistry_client, patch_stream
+    ):
+        """Test Ctrl-C before any output is not swallowed."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        response = Mock()
+        response.status_code = 200
+        response.headers = {}
+        response.iter_lines.side_effect = KeyboardInterrupt
+        patch_stream(response)
+
+        with pytest.raises(KeyboardInterrupt):
+            client.add_cell("", "hello")
+
+    def test_cancel_does_not_open_circuit(self, mock_graphistry_client, patch_stream):
+        """Test cancelled queries are not counted as endpoint failures."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client, failure_threshold=1
+        )
+        patch_stream(BlockingResponse([THREAD_LINE]))
+        token = CancelToken()
+        token.cancel()
+
+        client.add_cell("", "hello", cancel_token=token)
+
+        assert client.circuit_breakers["chat"].state == "closed"
+
+
+@pytest.mark.unit
+class TestClientSubmit:
+    """Test LouieClient.submit background queries."""
+
+    def test_submit_resolves_to_response(self, mock_graphistry_client, patch_stream):
+        """Test a submitted query completes in the background."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        patch_stream(BlockingResponse([THREAD_LINE, TEXT_LINE], hang=False))
+
+        future = client.submit("hello")
+        response = future.result(timeout=5)
+
+        assert response.thread_id == "D_001"
+        assert response.truncated is False
+        assert client._current_thread_id == "D_001"
+
+    def test_submit_cancel_returns_partial(self, mock_graphistry_client, patch_stream):
+        """Test cancelling a running submit resolves with partial results."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        patch_stream(BlockingResponse([THREAD_LINE, TEXT_LINE]))
+
+        future = client.submit("hello")
+        time.sleep(0.1)
+        assert future.cancel()
+        response = future.result(timeout=5)
+
+        assert len(response.elements) == 1
+        assert response.truncation_reason == CANCELLED
+
+    def test_submit_propagates_errors(self, mock_graphistry_client, patch_stream):
+        """Test query errors surface from result()."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        response = Mock()
+        response.status_code = 500
+        response.headers = {}
+        response.raise_for_status.side_effect = RuntimeError("boom")
+        patch_stream(response)
+
+        future = client.submit("hello")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            future.result(timeout=5)
+
+    def test_asyncio_cancellation_stops_query(
+        self, mock_graphistry_client, patch_stream
+    ):
+        """Test cancelling the awaiting task cancels the query."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        patch_stream(BlockingResponse([THREAD_LINE, TEXT_LINE]))
+        future = client.submit("hello")
+
+        async def main():
+            task = asyncio.ensure_future(future)
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+
+        assert future.cancel_requested
+        assert future.result(timeout=5).truncation_reason == CANCELLED
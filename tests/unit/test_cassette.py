@@ -0,0 +1,186 @@
+"""Tests for recording and replaying Louie traffic with cassettes."""
+
+import time
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from louieai._cassette import Cassette, CassetteMissError, Interaction
+from louieai._client import LouieClient
+from louieai.notebook.streaming import stream_response
+
+
+@pytest.fixture
+def recorded(tmp_path, mock_louie_server, mock_graphistry):
+    """Record one paced chat session with a dataframe, then stop the server."""
+    path = tmp_path / "session.cassette"
+    mock_louie_server.config.text_elements = 2
+    mock_louie_server.config.updates_per_element = 3
+    mock_louie_server.config.df_elements = 1
+    mock_louie_server.config.line_delay = 0.03
+
+    client = LouieClient(
+        server_url=mock_louie_server.url,
+        graphistry_client=mock_graphistry,
+        record_to=path,
+    )
+    response = client.add_cell("", "show data")
+    client.close()
+    mock_louie_server.stop()
+    return path, response
+
+
+@pytest.mark.unit
+class TestCassetteRecordReplay:
+    """Record against the mock server and replay with it stopped."""
+
+    def test_replay_reproduces_response_offline(
+        self, recorded, mock_louie_server, mock_graphistry
+    ):
+        """Test replay yields the same elements and dataframe."""
+        path, original = recorded
+        mock_graphistry.api_token.reset_mock()
+
+        client = LouieClient(
+            server_url=mock_louie_server.url,
+            graphistry_client=mock_graphistry,
+            replay_from=path,
+            replay_speed=None,
+        )
+        replayed = client.add_cell("", "show data")
+
+        assert replayed.thread_id == original.thread_id
+        assert replayed.text_elements == original.text_elements
+        assert replayed.dataframe_elements[0]["table"].equals(
+            original.dataframe_elements[0]["table"]
+        )
+        mock_graphistry.api_token.assert_not_called()
+
+    def test_replay_preserves_pacing(self, recorded, mock_graphistry):
+        """Test replay reproduces recorded timing, scaled by speed."""
+        path, _ = recorded
+
+        def replay_seconds(speed):
+            client = LouieClient(
+                graphistry_client=mock_graphistry,
+                replay_from=path,
+                replay_speed=speed,
+            )
+            start = time.monotonic()
+            client.add_cell("", "show data")
+            return time.monotonic() - start
+
+        # 7 element lines recorded ~30ms apart
+        assert replay_seconds(1.0) >= 0.15
+        assert replay_seconds(10.0) < 0.1
+
+    def test_replay_through_notebook_streaming(self, recorded, mock_graphistry):
+        """Test the notebook streaming path replays too."""
+        path, original = recorded
+        client = LouieClient(
+            graphistry_client=mock_graphistry, replay_from=path, replay_speed=None
+        )
+
+        result = stream_response(client, thread_id="", prompt="show data")
+
+        assert result["dthread_id"] == original.thread_id
+        assert len(result["elements"]) == 3
+
+    def test_cassette_contents(self, recorded):
+        """Test the file holds timed chat lines and raw Arrow bytes only."""
+        path, _ = recorded
+
+        cassette = Cassette.load(path)
+
+        chat, arrow = cassette.interactions
+        assert chat.path == "/api/chat/"
+        assert chat.lines is not None and len(chat.lines) == 8
+        offsets = [t for t, _ in chat.lines]
+        assert offsets == sorted(offsets)
+        assert arrow.path.endswith("/arrow")
+        assert arrow.body.startswith(b"ARROW1")
+        with zipfile.ZipFile(path) as zf:
+            assert b"fake-token-123" not in b"".join(
+                zf.read(name) for name in zf.namelist()
+            )
+
+    def test_cassette_written_once_on_close(
+        self, tmp_path, mock_louie_server, mock_graphistry
+    ):
+        """Test responses are buffered and saved when the client closes."""
+        path = tmp_path / "session.cassette"
+        client = LouieClient(
+            server_url=mock_louie_server.url,
+            graphistry_client=mock_graphistry,
+            record_to=path,
+        )
+        recorder = client._transport
+        inner = recorder._inner
+
+        with (
+            patch.object(Cassette, "save", wraps=recorder.cassette.save) as save,
+            patch.object(inner, "close", wraps=inner.close) as inner_close,
+        ):
+            for prompt in ("one", "two", "three"):
+                client.add_cell("", prompt)
+            assert not path.exists()
+
+            client.close()
+            client.close()
+
+        save.assert_called_once_with(path)
+        inner_close.assert_called_once_with()
+        assert len(Cassette.load(path).interactions) == 3
+
+    def test_record_and_replay_are_exclusive(self, tmp_path, mock_graphistry):
+        """Test asking for both modes is rejected."""
+        with pytest.raises(ValueError):
+            LouieClient(
+                graphistry_client=mock_graphistry,
+                record_to=tmp_path / "a",
+                replay_from=tmp_path / "b",
+            )
+
+
+@pytest.mark.unit
+class TestCassetteMatching:
+    """Test request matching during replay."""
+
+    def make_cassette(self):
+        """Create a cassette with two thread listings."""
+        return Cassette(
+            [
+                Interaction("GET", "/api/dthreads", "page=1", 200, body=b"one"),
+                Interaction("GET", "/api/dthreads", "page=2", 200, body=b"two"),
+            ]
+        )
+
+    def test_prefers_exact_query(self):
+        """Test an identical query string wins over path-only matches."""
+        cassette = self.make_cassette()
+        assert cassette.find("GET", "/api/dthreads", "page=2").body == b"two"
+
+    def test_cycles_through_path_matches(self):
+        """Test unmatched queries cycle through recordings for the path."""
+        cassette = self.make_cassette()
+        bodies = [cassette.find("GET", "/api/dthreads", "page=9").body for _ in "abc"]
+        assert bodies == [b"one", b"two", b"one"]
+
+    def test_miss_raises(self):
+        """Test an unrecorded path is an error."""
+        with pytest.raises(CassetteMissError):
+            self.make_cassette().find("GET", "/api/other", "")
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Test interactions survive saving and loading."""
+        cassette = self.make_cassette()
+        cassette.add(
+            Interaction("POST", "/api/chat/", "", 200, lines=[(0.5, '{"a": 1}')])
+        )
+        path = tmp_path / "c.cassette"
+        cassette.save(path)
+
+        loaded = Cassette.load(path)
+
+        assert loaded.interactions == cassette.interactions
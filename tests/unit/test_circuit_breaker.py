@@ -0,0 +1,168 @@
+"""Unit tests for per-endpoint circuit breakers."""
+
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from louieai._circuit import CircuitBreaker, CircuitOpenError, is_endpoint_failure
+from louieai._client import LouieClient
+
+
+def server_error(status_code=503):
+    """Create an HTTPStatusError with the given status."""
+    return httpx.HTTPStatusError(
+        "Server error", request=Mock(), response=Mock(status_code=status_code)
+    )
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold(self):
+        """Test the circuit opens after N consecutive failures."""
+        breaker = CircuitBreaker("chat", failure_threshold=3, recovery_timeout=60)
+
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError, match="chat endpoint is unavailable"):
+            breaker.before_request()
+
+    def test_success_resets_failure_count(self):
+        """Test failures must be consecutive to open the circuit."""
+        breaker = CircuitBreaker("arrow", failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failures == 1
+
+    def test_half_open_allows_single_probe(self):
+        """Test only one probe is let through after the recovery timeout."""
+        breaker = CircuitBreaker("threads", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_probe_success_closes(self):
+        """Test a successful probe closes the circuit."""
+        breaker = CircuitBreaker("chat", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        breaker.before_request()
+        breaker.record_success()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_request()
+
+    def test_probe_failure_reopens(self):
+        """Test a failed probe re-opens the circuit for another timeout."""
+        breaker = CircuitBreaker("chat", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        breaker.before_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_is_endpoint_failure(self):
+        """Test which errors count towards opening the circuit."""
+        assert is_endpoint_failure(server_error(503))
+        assert is_endpoint_failure(httpx.ConnectError("refused"))
+        assert is_endpoint_failure(httpx.ReadTimeout("slow"))
+        assert not is_endpoint_failure(server_error(404))
+        assert not is_endpoint_failure(server_error(429))
+        assert not is_endpoint_failure(ValueError("bad"))
+
+        wrapped = RuntimeError("timeout")
+        wrapped.__cause__ = httpx.ReadTimeout("slow")
+        assert is_endpoint_failure(wrapped)
+
+
+@pytest.mark.unit
+class TestClientCircuitBreaker:
+    """Test LouieClient integration with circuit breakers."""
+
+    @pytest.fixture
+    def mock_graphistry_client(self):
+        """Mock GraphistryClient instance."""
+        mock = Mock()
+        mock.api_token = Mock(return_value="fake-token-123")
+        return mock
+
+    def test_disabled_by_default(self, mock_graphistry_client):
+        """Test no breakers are created unless configured."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        assert client.circuit_breakers == {}
+
+    def test_breaker_per_endpoint_class(self, mock_graphistry_client):
+        """Test chat, arrow and threads get independent breakers."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client, failure_threshold=2
+        )
+        assert set(client.circuit_breakers) == {"chat", "arrow", "threads"}
+
+        client._client = Mock()
+        client._client.get.side_effect = httpx.ConnectError("refused")
+
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                client.list_threads()
+
+        # Threads circuit is open and fails fast without a request
+        client._client.get.reset_mock()
+        with pytest.raises(CircuitOpenError):
+            client.get_thread("D_001")
+        client._client.get.assert_not_called()
+
+        # Other endpoint classes are unaffected
+        assert client.circuit_breakers["chat"].state == CircuitBreaker.CLOSED
+        assert client.circuit_breakers["arrow"].state == CircuitBreaker.CLOSED
+
+    def test_client_errors_do_not_open(self, mock_graphistry_client):
+        """Test 4xx responses leave the circuit closed."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client, failure_threshold=1
+        )
+        response = Mock(status_code=404)
+        response.raise_for_status.side_effect = server_error(404)
+        client._client = Mock()
+        client._client.get.return_value = response
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_thread("D_missing")
+
+        assert client.circuit_breakers["threads"].state == CircuitBreaker.CLOSED
+
+    def test_open_arrow_circuit_skips_fetch(self, mock_graphistry_client):
+        """Test dataframe fetches fail fast with a warning while open."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client,
+            failure_threshold=1,
+            recovery_timeout=60,
+        )
+        client.circuit_breakers["arrow"].record_failure()
+        client._client = Mock()
+
+        with pytest.warns(RuntimeWarning, match="CircuitOpenError"):
+            result = client._fetch_dataframe_arrow("D_001", "B_001")
+
+        assert result is None
+        client._client.get.assert_not_called()
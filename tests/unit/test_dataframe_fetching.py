@@ -3,12 +3,14 @@
 from io import BytesIO
 from unittest.mock import Mock, patch
 
+import httpx
 import pandas as pd
 import pyarrow as pa
 import pyarrow.ipc as ipc
 import pytest
 
 from louieai._client import LouieClient
+from louieai._timings import QueryTimings, record_timings
 
 
 @pytest.mark.unit
@@ -83,7 +85,9 @@ class TestDataFrameFetching:
         """Test handling of Arrow fetch failures."""
         # Mock a failed response
         mock_response = Mock()
-        mock_response.raise_for_status.side_effect = Exception("Server error")
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Server error", request=Mock(), response=Mock(status_code=500)
+        )
 
         with patch.object(client._client, "get", return_value=mock_response):
             # Should return None and warn
@@ -190,3 +194,156 @@ class TestDataFrameFetching:
                 df_elements = response.dataframe_elements
                 assert len(df_elements) == 1
                 assert "table" not in df_elements[0]
+
+
+@pytest.mark.unit
+class TestProjectedFetch:
+    """Test column selection and row windows against the mock server."""
+
+    @pytest.fixture(params=[True, False], ids=["server", "client-fallback"])
+    def server(self, request, mock_louie_server):
+        """Mock server that does or does not apply the options itself."""
+        mock_louie_server.config.df_cols = 6
+        mock_louie_server.config.arrow_slicing = request.param
+        return mock_louie_server
+
+    def test_columns_limit_offset(self, server, mock_louie_client):
+        """Test only the requested window reaches pandas either way."""
+        full = mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+
+        df = mock_louie_client._fetch_dataframe_arrow(
+            "D_1", "B_1", columns=["int_3", "float_1"], limit=10, offset=20
+        )
+
+        assert list(df.columns) == ["int_3", "float_1"]
+        pd.testing.assert_frame_equal(
+            df, full[["int_3", "float_1"]].iloc[20:30].reset_index(drop=True)
+        )
+
+    def test_offset_never_sent(self, server, mock_louie_client):
+        """Test servers are asked for rows up to the window's end, not to skip."""
+        with patch.object(
+            mock_louie_client, "_get", wraps=mock_louie_client._get
+        ) as get:
+            df = mock_louie_client._fetch_dataframe_arrow(
+                "D_1", "B_1", limit=10, offset=20
+            )
+            tail = mock_louie_client._fetch_dataframe_arrow("D_1", "B_1", offset=95)
+
+        assert get.call_args_list[0].kwargs["params"] == {"limit": 30}
+        assert "params" not in get.call_args_list[1].kwargs
+        assert df["int_0"].tolist() == list(range(20, 30))
+        assert len(tail) == server.config.df_rows - 95
+
+    def test_server_transfers_less(self, mock_louie_server, mock_louie_client):
+        """Test a supporting server sends a smaller payload."""
+        timings = QueryTimings()
+        with record_timings(timings):
+            mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+            mock_louie_client._fetch_dataframe_arrow("D_1", "B_1", columns=["int_0"])
+
+        full, narrow = (f.bytes for f in timings.arrow_fetches)
+        assert narrow < full / 2
+
+    def test_negative_limit_rejected(self, mock_louie_client):
+        """Test invalid windows fail before any request."""
+        with pytest.raises(ValueError, match="negative"):
+            mock_louie_client._fetch_dataframe_arrow("D_1", "B_1", limit=-1)
+
+    def test_cursor_fetch_df(self, mock_louie_server, mock_louie_client):
+        """Test lui.fetch_df previews the latest dataframe."""
+        from louieai.notebook.cursor import Cursor
+
+        mock_louie_server.config.df_elements = 1
+        lui = Cursor(client=mock_louie_client)
+        lui._in_jupyter = lambda: False
+        lui("show data", fetch_dataframes=False)
+
+        preview = lui.fetch_df(columns=["float_1"], limit=5)
+
+        assert preview.shape == (5, 1)
+
+    def test_cursor_fetch_df_missing_columns(
+        self, mock_louie_server, mock_louie_client
+    ):
+        """Test unknown columns are named in an error, not answered with None."""
+        from louieai.notebook.cursor import Cursor
+
+        mock_louie_server.config.df_elements = 1
+        mock_louie_server.config.arrow_slicing = False
+        lui = Cursor(client=mock_louie_client)
+        lui._in_jupyter = lambda: False
+        lui("show data", fetch_dataframes=False)
+
+        with pytest.raises(KeyError, match=r"\['nope', 'gone'\]"):
+            lui.fetch_df(columns=["float_1", "nope", "gone"], limit=5)
+
+
+@pytest.mark.unit
+class TestCompressedFetch:
+    """Test compressed Arrow transfers against the mock server."""
+
+    @pytest.fixture
+    def server(self, mock_louie_server):
+        """Mock server with a table large enough to compress."""
+        mock_louie_server.config.df_rows = 10_000
+        return mock_louie_server
+
+    def _client(self, server, mock_graphistry, **kwargs):
+        return LouieClient(
+            server_url=server.url, graphistry_client=mock_graphistry, **kwargs
+        )
+
+    @pytest.mark.parametrize("codec", ["zstd", "lz4"])
+    def test_ipc_compression(self, server, mock_graphistry, mock_louie_client, codec):
+        """Test compressed blocks decode to the same frame with fewer bytes."""
+        client = self._client(server, mock_graphistry, arrow_compression=codec)
+        timings = QueryTimings()
+
+        plain = mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+        with record_timings(timings):
+            df = client._fetch_dataframe_arrow("D_1", "B_1")
+        client._client.close()
+
+        pd.testing.assert_frame_equal(df, plain)
+        (fetch,) = timings.arrow_fetches
+        assert fetch.bytes < len(server.arrow_payload())
+        assert fetch.compression_ratio > 1
+        assert timings.as_dict()["arrow_compression_ratio"] == (fetch.compression_ratio)
+
+    def test_http_content_encoding(self, server, mock_louie_client):
+        """Test gzip responses are decoded and the wire size recorded."""
+        server.config.content_encoding = "gzip"
+        timings = QueryTimings()
+
+        with record_timings(timings):
+            df = mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+
+        assert df.shape == (10_000, 5)
+        (fetch,) = timings.arrow_fetches
+        assert fetch.bytes == len(server.arrow_payload())
+        assert fetch.wire_bytes < fetch.bytes
+
+    def test_uncompressed_ratio(self, server, mock_louie_client):
+        """Test the ratio is still reported for plain transfers."""
+        timings = QueryTimings()
+        with record_timings(timings):
+            mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+
+        (fetch,) = timings.arrow_fetches
+        assert fetch.wire_bytes == fetch.bytes
+        assert fetch.compression_ratio == pytest.approx(fetch.table_bytes / fetch.bytes)
+
+    def test_iter_batches_compressed(self, server, mock_graphistry):
+        """Test streamed batches are decompressed as they are read."""
+        client = self._client(server, mock_graphistry, arrow_compression="zstd")
+
+        batches = list(client.iter_dataframe_batches("D_1", "B_1", batch_rows=4000))
+        client._client.close()
+
+        assert [b.num_rows for b in batches] == [4000, 4000, 2000]
+
+    def test_invalid_codec(self):
+        """Test unknown codecs are rejected up front."""
+        with pytest.raises(ValueError, match="arrow_compression"):
+            LouieClient(arrow_compression="snappy")
@@ -13,6 +13,8 @@ from unittest.mock import Mock, patch
 import pandas as pd
 import pytest
 
+import louieai
+
 # Import from same directory when running tests
 try:
     from .mocks import (
@@ -304,6 +306,7 @@ def test_documentation_file(doc_file):
                     LouieClient=Mock(return_value=client),
                     louie=mock_louie_factory,
                     Cursor=Mock,
+                    **_public_types(),
                 ),
                 "louieai.notebook": Mock(lui=mock_lui),
                 "louieai.globals": Mock(lui=mock_lui),
@@ -322,6 +325,15 @@ def test_documentation_file(doc_file):
         pytest.fail(msg)
 
 
+def _public_types():
+    """Real classes exported by louieai, for docs that import them."""
+    return {
+        name: getattr(louieai, name)
+        for name in louieai.__all__
+        if name not in ("louie", "Cursor", "__version__")
+    }
+
+
 def _create_comprehensive_mock_lui(client=None):
     """Create a comprehensive mock lui object that works like the real one."""
     mock_lui = Mock()
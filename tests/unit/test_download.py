@@ -0,0 +1,134 @@
+"""Tests for resumable, ranged Arrow downloads."""
+
+import base64
+import hashlib
+from unittest.mock import patch
+
+import httpx
+import pandas as pd
+import pytest
+
+from louieai._client import LouieClient
+from louieai._download import (
+    DownloadIntegrityError,
+    expected_sha256,
+    spool_download,
+)
+from louieai._timings import QueryTimings, record_timings
+
+
+def _opener(handler):
+    """Stream opener over an httpx mock transport."""
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return lambda extra: client.stream("GET", "http://test/arrow", headers=extra)
+
+
+@pytest.mark.unit
+class TestSpoolDownload:
+    """Test the download helper against scripted responses."""
+
+    def test_digest_mismatch(self):
+        """Test a body that does not match Repr-Digest is rejected."""
+        wrong = base64.b64encode(hashlib.sha256(b"other").digest()).decode()
+        opener = _opener(
+            lambda request: httpx.Response(
+                200, content=b"payload", headers={"Repr-Digest": f"sha-256=:{wrong}:"}
+            )
+        )
+
+        with pytest.raises(DownloadIntegrityError, match="Repr-Digest"):
+            spool_download(opener)
+
+    def test_ignored_range_is_rejected(self):
+        """Test a server answering a resume with a full body is not trusted."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.headers.get("Range"))
+            if len(calls) == 1:
+                return httpx.Response(
+                    200,
+                    content=b"x" * 100,
+                    headers={"Accept-Ranges": "bytes", "ETag": '"v1"'},
+                )
+            return httpx.Response(200, content=b"y" * 100)
+
+        with (
+            patch("louieai._download.MIN_SEGMENT_BYTES", 10),
+            pytest.raises(DownloadIntegrityError, match="ignored the range"),
+        ):
+            spool_download(_opener(handler), segments=2)
+
+        assert "bytes=50-99" in calls
+
+    def test_legacy_digest_header(self):
+        """Test the RFC 3230 Digest header is understood."""
+        digest = base64.b64encode(hashlib.sha256(b"abc").digest()).decode()
+
+        assert expected_sha256(httpx.Headers({"Digest": f"SHA-256={digest}"})) == (
+            hashlib.sha256(b"abc").digest()
+        )
+        assert expected_sha256(httpx.Headers({"Digest": "md5=abc"})) is None
+
+
+@pytest.mark.unit
+class TestClientDownloads:
+    """Test ranged Arrow fetches against the mock server."""
+
+    @pytest.fixture
+    def server(self, mock_louie_server):
+        """Mock server with a block of a few hundred kilobytes."""
+        mock_louie_server.config.df_rows = 10_000
+        return mock_louie_server
+
+    @pytest.fixture
+    def client(self, server, mock_graphistry):
+        """Client downloading in up to four segments."""
+        client = LouieClient(
+            server_url=server.url, graphistry_client=mock_graphistry, arrow_segments=4
+        )
+        yield client
+        client._client.close()
+
+    def test_parallel_segments(self, server, client, mock_louie_client):
+        """Test a large block is fetched in ranged segments and reassembled."""
+        plain = mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+        timings = QueryTimings()
+
+        with (
+            patch("louieai._download.MIN_SEGMENT_BYTES", 64 * 1024),
+            record_timings(timings),
+        ):
+            df = client._fetch_dataframe_arrow("D_1", "B_1")
+
+        pd.testing.assert_frame_equal(df, plain)
+        assert server.stats.requests["arrow"] == 1 + 4
+        (fetch,) = timings.arrow_fetches
+        assert fetch.bytes == len(server.arrow_payload())
+
+    def test_resume_after_drop(self, server, client):
+        """Test a dropped transfer continues from the last byte received."""
+        server.config.arrow_drops = 1
+        server.config.arrow_drop_bytes = 4096
+
+        df = client._fetch_dataframe_arrow("D_1", "B_1")
+
+        assert df.shape == (10_000, 5)
+        assert server.stats.requests["arrow"] == 2
+        resumed = server.stats.last_headers["arrow"]
+        assert resumed["Range"].startswith("bytes=4096-")
+        assert resumed["If-Range"].startswith('"')
+
+    def test_no_resume_without_ranges(self, server, client):
+        """Test a drop fails the fetch when the server cannot resume."""
+        server.config.arrow_ranges = False
+        server.config.arrow_drops = 1
+        server.config.arrow_drop_bytes = 4096
+
+        with pytest.warns(RuntimeWarning, match="Failed to fetch dataframe"):
+            assert client._fetch_dataframe_arrow("D_1", "B_1") is None
+
+    def test_invalid_segments(self):
+        """Test arrow_segments must be positive."""
+        with pytest.raises(ValueError, match="arrow_segments"):
+            LouieClient(arrow_segments=0)
@@ -0,0 +1,187 @@
+"""Tests for bulk thread export to Parquet datasets."""
+
+import json
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+
+from louieai._export import ELEMENTS_SCHEMA, ThreadExporter, _element_record
+
+
+@pytest.fixture
+def server(mock_louie_server):
+    """Mock server answering with a text and a dataframe element."""
+    mock_louie_server.config.df_elements = 1
+    return mock_louie_server
+
+
+@pytest.fixture
+def thread_ids(server, mock_louie_client):
+    """Ids of two threads with content, besides five seeded empty ones."""
+    ids = []
+    for prompt in ("first", "second"):
+        ids.append(mock_louie_client.add_cell("", prompt).thread_id)
+    return ids
+
+
+def _requests(server, endpoint):
+    return server.stats.requests.get(endpoint, 0)
+
+
+@pytest.mark.unit
+class TestThreadExport:
+    """Test ThreadExporter against the mock server."""
+
+    def test_writes_partitioned_datasets(
+        self, server, mock_louie_client, thread_ids, tmp_path
+    ):
+        """Test elements and blocks land in hive partitions per thread."""
+        report = mock_louie_client.export_threads(tmp_path, threads=thread_ids)
+
+        assert report.exported == 2
+        assert report.blocks == 2
+        assert report.rows == 200
+        assert report.failed == {}
+
+        elements = ds.dataset(tmp_path / "elements", partitioning="hive").to_table()
+        assert set(elements.column("thread_id").to_pylist()) == set(thread_ids)
+        assert elements.num_rows == report.elements == 4
+        assert elements.select(ELEMENTS_SCHEMA.names).schema == ELEMENTS_SCHEMA
+        text = [t for t in elements.column("text").to_pylist() if t]
+        assert len(text) == 2
+
+        blocks = ds.dataset(tmp_path / "blocks", partitioning="hive").to_table()
+        assert blocks.num_rows == 200
+        assert set(blocks.column("block_id").to_pylist()) == {"B_df_0000"}
+        assert not (tmp_path / "_staging").exists()
+
+    def test_lists_all_threads(self, server, mock_louie_client, thread_ids, tmp_path):
+        """Test every listed thread is exported when none are given."""
+        exporter = ThreadExporter(mock_louie_client, tmp_path, concurrency=2)
+
+        report = exporter.export(page_size=3)
+
+        assert report.exported == 7
+        assert report.blocks == 2
+        assert _requests(server, "thread") == 7
+
+    def test_incremental_skips_unchanged(
+        self, server, mock_louie_client, thread_ids, tmp_path
+    ):
+        """Test a second export only rewrites threads that changed."""
+        mock_louie_client.export_threads(tmp_path)
+        details = _requests(server, "thread")
+
+        report = mock_louie_client.export_threads(tmp_path)
+        assert (report.exported, report.skipped) == (0, 7)
+        assert _requests(server, "thread") == details  # Listing only
+
+        mock_louie_client.add_cell(thread_ids[0], "more")
+        report = mock_louie_client.export_threads(tmp_path)
+        assert (report.exported, report.skipped) == (1, 6)
+
+        elements = ds.dataset(tmp_path / "elements", partitioning="hive").to_table()
+        assert elements.num_rows == 6
+
+    def test_ids_skip_by_content(self, server, mock_louie_client, thread_ids, tmp_path):
+        """Test threads given by id are skipped when their elements match."""
+        mock_louie_client.export_threads(tmp_path, threads=thread_ids)
+        arrow = _requests(server, "arrow")
+
+        report = mock_louie_client.export_threads(tmp_path, threads=thread_ids)
+
+        assert (report.exported, report.skipped) == (0, 2)
+        assert _requests(server, "arrow") == arrow
+
+    def test_full_export_rewrites(
+        self, server, mock_louie_client, thread_ids, tmp_path
+    ):
+        """Test incremental=False exports every thread again."""
+        mock_louie_client.export_threads(tmp_path, threads=thread_ids)
+
+        report = mock_louie_client.export_threads(
+            tmp_path, threads=thread_ids, incremental=False
+        )
+
+        assert report.exported == 2
+        manifest = json.loads((tmp_path / "_manifest.json").read_text())
+        assert set(manifest["threads"]) == set(thread_ids)
+
+    def test_failures_are_reported(
+        self, server, mock_louie_client, thread_ids, tmp_path
+    ):
+        """Test a failing thread is recorded and the rest still export."""
+        report = mock_louie_client.export_threads(
+            tmp_path, threads=[*thread_ids, "D_missing"]
+        )
+
+        assert report.exported == 2
+        assert "D_missing" in report.failed
+        manifest = json.loads((tmp_path / "_manifest.json").read_text())
+        assert "D_missing" not in manifest["threads"]
+
+    def test_concurrency_validated(self, mock_louie_client, tmp_path):
+        """Test concurrency must be positive."""
+        with pytest.raises(ValueError, match="concurrency"):
+            ThreadExporter(mock_louie_client, tmp_path, concurrency=0)
+
+    def test_ids_are_escaped_in_partitions(self, mock_louie_client, tmp_path):
+        """Test ids that are not path-safe stay inside the export, round-trip."""
+        root = tmp_path / "export"
+        thread_id = "D_../../escaped"
+        elements = [{"id": "B_1", "type": "DfElement", "block_id": "../../B x%2F"}]
+        block = pa.record_batch({"x": [1, 2]})
+        with (
+            patch.object(
+                mock_louie_client,
+                "_get_thread_detail",
+                return_value={"elements": elements},
+            ),
+            patch.object(
+                mock_louie_client, "iter_dataframe_batches", return_value=[block]
+            ),
+        ):
+            report = mock_louie_client.export_threads(root, threads=[thread_id])
+
+        assert report.failed == {}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["export"]
+        blocks = ds.dataset(root / "blocks", partitioning="hive").to_table()
+        assert blocks.column("thread_id").to_pylist() == [thread_id] * 2
+        assert blocks.column("block_id").to_pylist() == ["../../B x%2F"] * 2
+
+    def test_listing_is_read_as_threads_export(self, mock_louie_client, tmp_path):
+        """Test threads are taken from the listing in bounded batches."""
+        listed = []
+        exporter = ThreadExporter(mock_louie_client, tmp_path, concurrency=2)
+
+        def threads():
+            for i in range(50):
+                listed.append(i)
+                yield f"D_{i}"
+
+        lag = []
+        done = []
+
+        def export_one(thread, report):
+            lag.append(len(listed) - len(done))
+            done.append(thread)
+
+        with patch.object(exporter, "_export_one", side_effect=export_one):
+            exporter.export(threads())
+
+        assert len(done) == 50
+        assert max(lag) <= 2 * exporter.concurrency + 1
+
+
+@pytest.mark.unit
+def test_element_text_fields():
+    """Test text is taken from content, text or value, and not duplicated."""
+    content = _element_record(0, {"type": "TextElement", "content": "a"}, None)
+    value = _element_record(1, {"type": "TextElement", "value": "b", "x": 1}, None)
+    other = _element_record(2, {"type": "GraphElement", "value": {"n": 1}}, None)
+
+    assert (content["text"], json.loads(content["data"])) == ("a", {})
+    assert (value["text"], json.loads(value["data"])) == ("b", {"x": 1})
+    assert (other["text"], json.loads(other["data"])) == (None, {"value": {"n": 1}})
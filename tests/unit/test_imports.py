@@ -106,3 +106,24 @@ class TestImports:
         expected = ["louie", "Cursor", "Response", "Thread", "__version__"]
         for name in expected:
             assert name in louieai.__all__, f"{name} should be in __all__"
+
+    def test_configuration_types_exported(self):
+        """Test types users pass to or catch from the client are public."""
+        import louieai
+        from louieai._circuit import CircuitOpenError
+        from louieai._metrics import MetricsRegistry
+        from louieai._ratelimit import RateLimiter
+        from louieai._watchdog import StreamTimeoutError
+
+        assert louieai.RateLimiter is RateLimiter
+        assert louieai.CircuitOpenError is CircuitOpenError
+        assert louieai.StreamTimeoutError is StreamTimeoutError
+        assert louieai.MetricsRegistry is MetricsRegistry
+        for name in (
+            "CancelToken",
+            "QueryTimings",
+            "Instrumentation",
+            "OpenTelemetryInstrumentation",
+            "SharedTableCache",
+        ):
+            assert name in louieai.__all__
@@ -0,0 +1,102 @@
+"""Tests for memory-optimized Arrow to pandas conversion."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from louieai._client import LouieClient
+from louieai._ingest import to_pandas_optimized
+from louieai._timings import QueryTimings, record_timings
+
+
+@pytest.fixture
+def log_table():
+    """Log-analytics shaped result: repetitive strings, narrow numbers."""
+    rows = 20_000
+    rng = np.random.default_rng(0)
+    return pa.table(
+        {
+            "status": rng.choice(["ok", "denied", "error"], rows),
+            "host": [f"host-{i % 40}" for i in range(rows)],
+            "session": [f"session-{i}" for i in range(rows)],
+            "port": rng.integers(0, 60_000, rows),
+            "bytes": rng.integers(0, 2**40, rows),
+            "score": rng.random(rows, dtype=np.float32).astype(np.float64),
+            "latency": rng.random(rows),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestToPandasOptimized:
+    """Test the conversion choices and report."""
+
+    def test_column_types(self, log_table):
+        """Test each column gets the narrowest safe type."""
+        df, report = to_pandas_optimized(log_table)
+
+        assert isinstance(df["status"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["host"].dtype, pd.CategoricalDtype)
+        assert df["session"].dtype == pd.StringDtype("pyarrow")
+        assert df["port"].dtype == np.int32
+        assert df["bytes"].dtype == np.int64
+        assert df["score"].dtype == np.float32
+        assert df["latency"].dtype == np.float64
+        assert report.columns == {
+            "status": "category",
+            "host": "category",
+            "session": "string[pyarrow]",
+            "port": "int32",
+            "score": "float32",
+        }
+
+    def test_values_are_unchanged(self, log_table):
+        """Test optimizing never changes a value."""
+        df, _ = to_pandas_optimized(log_table)
+        plain = log_table.to_pandas()
+
+        for name in plain.columns:
+            assert (df[name].astype(object) == plain[name].astype(object)).all()
+
+    def test_report_measures_savings(self, log_table):
+        """Test the report estimates the default conversion closely."""
+        df, report = to_pandas_optimized(log_table)
+        plain = log_table.to_pandas().memory_usage(deep=True, index=False).sum()
+
+        assert report.after_bytes == df.memory_usage(deep=True, index=False).sum()
+        assert report.before_bytes == pytest.approx(plain, rel=0.05)
+        assert report.saved_bytes > 0 and report.ratio > 1
+
+    def test_nulls_keep_integer_width(self):
+        """Test integer columns with nulls are left for pandas to widen."""
+        table = pa.table({"n": pa.array([1, None, 3], pa.int64())})
+
+        df, report = to_pandas_optimized(table)
+
+        assert df["n"].tolist()[0] == 1 and pd.isna(df["n"][1])
+        assert report.columns == {}
+
+
+@pytest.mark.unit
+class TestClientOptimize:
+    """Test the client option."""
+
+    def test_fetch_reports_saving(self, mock_louie_server, mock_graphistry):
+        """Test fetched frames are optimized and the saving recorded."""
+        mock_louie_server.config.df_rows = 10_000
+        client = LouieClient(
+            server_url=mock_louie_server.url,
+            graphistry_client=mock_graphistry,
+            optimize_dataframes=True,
+        )
+        timings = QueryTimings()
+
+        with record_timings(timings):
+            df = client._fetch_dataframe_arrow("D_1", "B_1")
+        client._client.close()
+
+        assert isinstance(df["str_2"].dtype, pd.CategoricalDtype)
+        assert df["int_0"].dtype == np.int16
+        (fetch,) = timings.arrow_fetches
+        assert fetch.pandas_bytes_saved > 0
@@ -0,0 +1,233 @@
+"""Tests for instrumentation hooks and the OpenTelemetry adapter."""
+
+import importlib.util
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from louieai._client import LouieClient
+from louieai._instrumentation import (
+    ARROW_FETCH,
+    AUTH_REFRESH,
+    CHAT,
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    instrument,
+)
+from louieai._ratelimit import RateLimiter
+from louieai.auth import _handle_auth_error
+from louieai.notebook.streaming import stream_response
+from tests.mock_server import arrow_ipc_bytes, make_arrow_table
+
+HAS_OTEL_API = importlib.util.find_spec("opentelemetry") is not None
+try:
+    import opentelemetry.sdk.trace  # noqa: F401
+
+    HAS_OTEL_SDK = True
+except ImportError:
+    HAS_OTEL_SDK = False
+
+
+class RecordingInstrumentation(Instrumentation):
+    """Instrumentation that records every hook call."""
+
+    def __init__(self):
+        self.calls = []
+        self._next = 0
+
+    def start(self, operation, attributes):
+        self._next += 1
+        self.calls.append(("start", operation, dict(attributes)))
+        return self._next
+
+    def event(self, handle, name, attributes):
+        self.calls.append(("event", name, dict(attributes)))
+
+    def end(self, handle, attributes, error):
+        self.calls.append(("end", handle, dict(attributes), error))
+
+    def inject(self, handle, headers):
+        headers["traceparent"] = f"00-{handle:032x}-{handle:016x}-01"
+
+    def names(self):
+        """Operation starts and event names, in order."""
+        return [call[1] for call in self.calls if call[0] in ("start", "event")]
+
+
+@pytest.mark.unit
+class TestInstrumentHelper:
+    """Test the instrument() context manager."""
+
+    def test_disabled_yields_none(self):
+        """Test no operation is created without instrumentation."""
+        with instrument(None, CHAT, {}) as op:
+            assert op is None
+
+    def test_error_is_reported_on_end(self):
+        """Test an exception ends the operation with the error."""
+        hooks = RecordingInstrumentation()
+
+        with pytest.raises(ValueError), instrument(hooks, CHAT, {"a": 1}) as op:
+            op.attributes["b"] = 2
+            raise ValueError("boom")
+
+        assert hooks.calls[0] == ("start", CHAT, {"a": 1})
+        kind, _, attributes, error = hooks.calls[1]
+        assert kind == "end"
+        assert attributes == {"b": 2}
+        assert isinstance(error, ValueError)
+
+
+@pytest.mark.unit
+class TestClientInstrumentation:
+    """Test hooks fire around real client operations."""
+
+    @pytest.fixture
+    def hooks(self):
+        """Recording instrumentation."""
+        return RecordingInstrumentation()
+
+    @pytest.fixture
+    def client(self, mock_louie_server, mock_graphistry, hooks):
+        """Instrumented client talking to the mock server."""
+        mock_louie_server.config.text_elements = 2
+        mock_louie_server.config.df_elements = 1
+        client = LouieClient(
+            server_url=mock_louie_server.url,
+            graphistry_client=mock_graphistry,
+            instrumentation=hooks,
+        )
+        yield client
+        client._client.close()
+
+    def test_chat_and_arrow_hooks(self, client, hooks, mock_louie_server):
+        """Test chat start/end, stream events and nested Arrow fetch."""
+        response = client.add_cell("", "show data", agent="TestAgent")
+
+        assert hooks.names() == [
+            CHAT,
+            "first_byte",
+            "thread_id",
+            "first_element",
+            "stream_end",
+            ARROW_FETCH,
+        ]
+        assert hooks.calls[0][2]["louie.agent"] == "TestAgent"
+        assert hooks.calls[2][2] == {"louie.thread_id": response.thread_id}
+
+        arrow_end, chat_end = [call for call in hooks.calls if call[0] == "end"]
+        assert arrow_end[1] == 2 and arrow_end[3] is None
+        assert arrow_end[2]["louie.arrow.bytes"] == len(
+            mock_louie_server.arrow_payload()
+        )
+        assert arrow_end[2]["louie.arrow.rows"] == 100
+        assert chat_end[1] == 1
+        assert chat_end[2]["louie.thread_id"] == response.thread_id
+        assert chat_end[2]["louie.elements"] == 3
+        assert chat_end[2]["louie.elements.text"] == 2
+        assert chat_end[2]["louie.elements.dataframe"] == 1
+
+    def test_traceparent_sent_on_requests(self, client, mock_louie_server):
+        """Test injected headers reach the server on chat and Arrow requests."""
+        client.add_cell("", "show data")
+
+        headers = mock_louie_server.stats.last_headers
+        assert headers["chat"]["traceparent"].startswith("00-")
+        assert headers["arrow"]["traceparent"] != headers["chat"]["traceparent"]
+
+    def test_notebook_streaming_hooks(self, client, hooks):
+        """Test the notebook streaming path is instrumented too."""
+        stream_response(client, thread_id="", prompt="hi")
+
+        assert hooks.names()[:5] == [
+            CHAT,
+            "first_byte",
+            "thread_id",
+            "first_element",
+            "stream_end",
+        ]
+        chat_end = [call for call in hooks.calls if call[0] == "end"][-1]
+        assert chat_end[2]["louie.elements"] == 3
+
+    def test_retry_event_on_throttle(self, mock_graphistry, hooks):
+        """Test 429 retries are reported on the running operation."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry,
+            rate_limiter=RateLimiter(rate=100),
+            instrumentation=hooks,
+        )
+        throttled = Mock(status_code=429, headers={"Retry-After": "0"})
+        ok = Mock(status_code=200, headers={})
+        ok.content = arrow_ipc_bytes(make_arrow_table(3, 2))
+        client._client = Mock()
+        client._client.get.side_effect = [throttled, ok]
+
+        df = client._fetch_dataframe_arrow("D_1", "B_1")
+
+        assert df.shape == (3, 2)
+        assert hooks.names() == [ARROW_FETCH, "retry"]
+        assert hooks.calls[1][2] == {"http.status_code": 429, "louie.attempt": 1}
+
+    def test_auth_refresh_operation(self, hooks):
+        """Test 401 handling is reported as an auth refresh."""
+        client = Mock()
+        client._instrumentation = hooks
+        client.auth_manager.handle_auth_error.return_value = True
+        error = httpx.HTTPStatusError(
+            "401", request=Mock(), response=Mock(status_code=401)
+        )
+
+        assert _handle_auth_error(client, error) is True
+
+        assert hooks.calls[0][:2] == ("start", AUTH_REFRESH)
+        assert hooks.calls[1][2] == {"louie.auth.refreshed": True}
+
+    def test_non_auth_errors_not_reported(self, hooks):
+        """Test other failures do not produce auth refresh operations."""
+        client = Mock()
+        client._instrumentation = hooks
+        client.auth_manager.handle_auth_error.return_value = False
+
+        assert _handle_auth_error(client, RuntimeError("timeout")) is False
+        assert hooks.calls == []
+
+
+@pytest.mark.unit
+class TestOpenTelemetryInstrumentation:
+    """Test the optional OpenTelemetry adapter."""
+
+    @pytest.mark.skipif(HAS_OTEL_API, reason="opentelemetry-api is installed")
+    def test_requires_opentelemetry(self):
+        """Test a clear error when opentelemetry-api is missing."""
+        with pytest.raises(ImportError, match="pip install"):
+            OpenTelemetryInstrumentation()
+
+    @pytest.mark.skipif(not HAS_OTEL_SDK, reason="opentelemetry-sdk not installed")
+    def test_spans_and_traceparent(self, mock_louie_server, mock_graphistry):
+        """Test operations become nested spans and propagate traceparent."""
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        mock_louie_server.config.df_elements = 1
+        client = LouieClient(
+            server_url=mock_louie_server.url,
+            graphistry_client=mock_graphistry,
+            instrumentation=OpenTelemetryInstrumentation(provider.get_tracer("test")),
+        )
+
+        client.add_cell("", "show data")
+
+        arrow, chat = exporter.get_finished_spans()
+        assert chat.name == CHAT and arrow.name == ARROW_FETCH
+        assert arrow.parent.span_id == chat.context.span_id
+        assert chat.attributes["louie.elements"] == 2
+        assert [e.name for e in chat.events][:2] == ["first_byte", "thread_id"]
+        trace_id = f"{chat.context.trace_id:032x}"
+        assert trace_id in mock_louie_server.stats.last_headers["chat"]["traceparent"]
@@ -0,0 +1,99 @@
+"""Tests for streaming dataframe blocks as Arrow record batches."""
+
+import io
+
+import pyarrow as pa
+import pytest
+
+from louieai._backends import iter_arrow_batches
+from louieai.notebook.cursor import Cursor
+from tests.mock_server import arrow_ipc_bytes, make_arrow_table
+
+
+def _chunks(payload: bytes, size: int) -> list[bytes]:
+    """Split a payload the way it might arrive off the wire."""
+    return [payload[i : i + size] for i in range(0, len(payload), size)]
+
+
+@pytest.mark.unit
+class TestIterArrowBatches:
+    """Test incremental decoding of IPC bytes."""
+
+    def test_file_format(self):
+        """Test the file format is read back batch by batch."""
+        table = make_arrow_table(1000, 3)
+
+        batches = list(
+            iter_arrow_batches(_chunks(arrow_ipc_bytes(table), 100), batch_rows=300)
+        )
+
+        assert [b.num_rows for b in batches] == [300, 300, 300, 100]
+        assert pa.Table.from_batches(batches).equals(table)
+
+    def test_stream_format_is_incremental(self):
+        """Test stream batches are yielded before the body is fully read."""
+        table = make_arrow_table(1000, 2)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=250):
+                writer.write_batch(batch)
+        pieces = _chunks(sink.getvalue(), 7)
+        consumed = 0
+
+        def wire():
+            nonlocal consumed
+            for piece in pieces:
+                consumed += 1
+                yield piece
+
+        batches = iter_arrow_batches(wire())
+        first = next(batches)
+
+        assert first.num_rows == 250
+        assert consumed < len(pieces)
+        rest = list(batches)
+        assert pa.Table.from_batches([first, *rest]).equals(table)
+
+    def test_invalid_batch_rows(self):
+        """Test batch_rows must be positive."""
+        with pytest.raises(ValueError, match="batch_rows"):
+            list(iter_arrow_batches([b""], batch_rows=0))
+
+
+@pytest.mark.unit
+class TestClientIterBatches:
+    """Test streaming blocks from the mock server."""
+
+    def test_iter_dataframe_batches(self, mock_louie_server, mock_louie_client):
+        """Test a block streams in bounded batches."""
+        mock_louie_server.config.df_elements = 1
+        response = mock_louie_client.add_cell("", "show data", fetch_dataframes=False)
+        (elem,) = response.dataframe_elements
+        assert "table" not in elem
+
+        batches = list(
+            mock_louie_client.iter_dataframe_batches(
+                response.thread_id, elem["id"], batch_rows=30
+            )
+        )
+
+        assert [b.num_rows for b in batches] == [30, 30, 30, 10]
+        assert mock_louie_server.stats.requests["arrow"] == 1
+
+    def test_cursor_iter_batches(self, mock_louie_server, mock_louie_client):
+        """Test lui.iter_batches streams the latest dataframe."""
+        mock_louie_server.config.df_elements = 1
+        lui = Cursor(client=mock_louie_client)
+        lui._in_jupyter = lambda: False
+
+        lui("show data", fetch_dataframes=False)
+
+        assert lui.df is None
+        assert sum(b.num_rows for b in lui.iter_batches()) == 100
+
+    def test_cursor_without_dataframe(self, mock_louie_client):
+        """Test a clear error when there is nothing to stream."""
+        lui = Cursor(client=mock_louie_client)
+
+        with pytest.raises(ValueError, match="no dataframe"):
+            next(lui.iter_batches())
@@ -0,0 +1,155 @@
+"""Tests for paginated, prefetching thread iteration."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from louieai._client import Thread
+
+
+@pytest.fixture
+def server(mock_louie_server):
+    """Mock server with 25 threads."""
+    for i in range(5, 25):
+        mock_louie_server.threads[f"D_mock_{i:04d}"] = f"Mock thread {i}"
+    return mock_louie_server
+
+
+def _listings(server):
+    return server.stats.requests.get("threads", 0)
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.mark.unit
+class TestIterThreads:
+    """Test LouieClient.iter_threads against the mock server."""
+
+    def test_yields_every_thread(self, server, mock_louie_client):
+        """Test all pages are walked and iteration stops at the end."""
+        threads = list(mock_louie_client.iter_threads(page_size=10))
+
+        assert [t.id for t in threads] == list(server.threads)
+        assert all(isinstance(t, Thread) for t in threads)
+
+    def test_exact_multiple_of_page_size(self, server, mock_louie_client):
+        """Test the reported total ends iteration without an extra request."""
+        threads = list(mock_louie_client.iter_threads(page_size=5, prefetch=0))
+
+        assert len(threads) == 25
+        assert _listings(server) == 5
+
+    def test_capped_page_size(self, server, mock_louie_client):
+        """Test a server serving smaller pages than asked is walked to the end."""
+        server.config.max_page_size = 4
+
+        threads = list(mock_louie_client.iter_threads(page_size=10, prefetch=1))
+
+        assert [t.id for t in threads] == list(server.threads)
+
+    def test_silently_capped_page_size(self, mock_louie_client):
+        """Test a page shorter than the largest served ends the listing."""
+        ids = iter(range(8))
+        pages = {
+            page: [Thread(id=f"D_{next(ids)}") for _ in range(n)]
+            for page, n in ((1, 3), (2, 3), (3, 2))
+        }
+        with patch.object(
+            mock_louie_client,
+            "_list_threads_page",
+            side_effect=lambda page, *args, **kwargs: (pages[page], False),
+        ) as list_page:
+            threads = list(mock_louie_client.iter_threads(page_size=10, prefetch=0))
+
+        assert [t.id for t in threads] == [f"D_{i}" for i in range(8)]
+        assert list_page.call_count == 3
+
+    def test_ignored_page_parameter(self, mock_louie_client):
+        """Test iteration ends when every page returns the same threads."""
+        same = [Thread(id="D_1"), Thread(id="D_2")]
+        with patch.object(
+            mock_louie_client,
+            "_list_threads_page",
+            side_effect=lambda page, *args, **kwargs: (same, False),
+        ):
+            threads = list(mock_louie_client.iter_threads(page_size=2, prefetch=2))
+
+        assert [t.id for t in threads] == ["D_1", "D_2"]
+
+    def test_sorting_and_filters_pass_through(self, server, mock_louie_client):
+        """Test sort and filter parameters reach the server."""
+        threads = list(
+            mock_louie_client.iter_threads(
+                page_size=10, sort_by="name", sort_order="desc"
+            )
+        )
+        assert [t.name for t in threads] == sorted(server.threads.values())[::-1]
+
+        (thread,) = mock_louie_client.iter_threads(name="Mock thread 7")
+        assert thread.id == "D_mock_0007"
+
+    def test_pages_are_prefetched(self, server, mock_louie_client):
+        """Test later pages are requested before the caller reaches them."""
+        threads = mock_louie_client.iter_threads(page_size=5, prefetch=3)
+
+        next(threads)
+
+        assert _wait_for(lambda: _listings(server) >= 4)
+        threads.close()
+
+    def test_no_prefetch_is_sequential(self, server, mock_louie_client):
+        """Test prefetch=0 requests one page at a time."""
+        threads = mock_louie_client.iter_threads(page_size=5, prefetch=0)
+
+        next(threads)
+        time.sleep(0.05)
+
+        assert _listings(server) == 1
+        threads.close()
+
+    def test_moved_threads_yielded_once(self, mock_louie_client):
+        """Test a thread seen on two pages is only yielded the first time."""
+        pages = {
+            1: [Thread(id="D_1"), Thread(id="D_2")],
+            2: [Thread(id="D_2"), Thread(id="D_3")],
+            3: [],
+        }
+        with patch.object(
+            mock_louie_client,
+            "_list_threads_page",
+            side_effect=lambda page, *args, **kwargs: (pages[page], not pages[page]),
+        ):
+            threads = list(mock_louie_client.iter_threads(page_size=2, prefetch=1))
+
+        assert [t.id for t in threads] == ["D_1", "D_2", "D_3"]
+
+    def test_seen_ids_are_bounded(self, mock_louie_client):
+        """Test only the most recent pages' ids are remembered."""
+        pages = {
+            1: [Thread(id="D_1")],
+            2: [Thread(id="D_2")],
+            3: [Thread(id="D_3")],
+            4: [Thread(id="D_1")],
+            5: [],
+        }
+        with patch.object(
+            mock_louie_client,
+            "_list_threads_page",
+            side_effect=lambda page, *args, **kwargs: (pages[page], not pages[page]),
+        ):
+            threads = list(mock_louie_client.iter_threads(page_size=1, prefetch=0))
+
+        assert [t.id for t in threads] == ["D_1", "D_2", "D_3", "D_1"]
+
+    def test_invalid_arguments(self, mock_louie_client):
+        """Test page_size and prefetch are validated."""
+        with pytest.raises(ValueError, match="page_size"):
+            next(mock_louie_client.iter_threads(page_size=0))
+        with pytest.raises(ValueError, match="prefetch"):
+            next(mock_louie_client.iter_threads(prefetch=-1))
@@ -0,0 +1,176 @@
+"""Tests for the in-process metrics registry."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from louieai._client import LouieClient
+from louieai._instrumentation import (
+    ARROW_FETCH,
+    AUTH_REFRESH,
+    CHAT,
+    Instrumentation,
+    MultiInstrumentation,
+    instrument,
+)
+from louieai._metrics import (
+    Counter,
+    Histogram,
+    MetricsInstrumentation,
+    MetricsRegistry,
+)
+from louieai._watchdog import StreamTimeoutError
+
+
+@pytest.mark.unit
+class TestMetricTypes:
+    """Test counters, histograms and the text export."""
+
+    def test_counter_sums_across_threads(self):
+        """Test per-thread shards add up to the true total."""
+        counter = Counter("c_total", "help")
+
+        def work():
+            for _ in range(1000):
+                counter.inc(status="ok")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert counter.value(status="ok") == 8000
+        assert counter.value(status="error") == 0
+
+    def test_exited_thread_shards_are_folded(self):
+        """Test shards of finished threads are merged, not kept forever."""
+        counter = Counter("c_total", "help")
+        hist = Histogram("h_seconds", "help", buckets=(1.0,))
+
+        def work():
+            counter.inc(status="ok")
+            hist.observe(0.5)
+
+        for _ in range(50):
+            t = threading.Thread(target=work)
+            t.start()
+            t.join()
+
+        assert counter.value(status="ok") == 50
+        assert hist.values()[()] == ([50, 50], 25.0, 50)
+        assert counter._shards == []
+        assert hist._shards == []
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test bucket counts, sum and count."""
+        hist = Histogram("h_seconds", "help", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            hist.observe(value)
+
+        ((key, (cumulative, total, count)),) = hist.values().items()
+
+        assert key == ()
+        assert cumulative == [1, 3, 4]
+        assert total == pytest.approx(6.25)
+        assert count == 4
+
+    def test_prometheus_text(self):
+        """Test the exposition format, including label escaping."""
+        registry = MetricsRegistry()
+        registry.requests.inc(operation=CHAT, agent='a"b', status="ok")
+        registry.stream_duration.observe(0.3, agent="x")
+
+        text = registry.to_prometheus()
+
+        assert "# TYPE louie_requests_total counter" in text
+        assert (
+            'louie_requests_total{agent="a\\"b",operation="louie.chat",status="ok"} 1'
+            in text
+        )
+        assert 'louie_stream_duration_seconds_bucket{agent="x",le="0.25"} 0' in text
+        assert 'louie_stream_duration_seconds_bucket{agent="x",le="0.5"} 1' in text
+        assert 'louie_stream_duration_seconds_bucket{agent="x",le="+Inf"} 1' in text
+        assert 'louie_stream_duration_seconds_count{agent="x"} 1' in text
+        assert text.endswith("\n")
+
+
+@pytest.mark.unit
+class TestMetricsInstrumentation:
+    """Test hooks translate operations into metrics."""
+
+    @pytest.fixture
+    def registry(self):
+        """Empty registry."""
+        return MetricsRegistry()
+
+    def test_chat_timeout_status(self, registry):
+        """Test timed-out chats are counted by reason."""
+        hooks = MetricsInstrumentation(registry)
+
+        with (
+            pytest.raises(StreamTimeoutError),
+            instrument(hooks, CHAT, {"louie.agent": "A"}),
+        ):
+            raise StreamTimeoutError("late", "idle_timeout")
+
+        assert registry.requests.value(operation=CHAT, agent="A", status="timeout")
+        assert registry.timeouts.value(reason="idle_timeout") == 1
+
+    def test_auth_refresh_results(self, registry):
+        """Test refreshes are counted by whether they succeeded."""
+        hooks = MetricsInstrumentation(registry)
+
+        with instrument(hooks, AUTH_REFRESH, {}) as op:
+            op.attributes["louie.auth.refreshed"] = True
+        with instrument(hooks, AUTH_REFRESH, {}) as op:
+            op.attributes["louie.auth.refreshed"] = False
+
+        assert registry.auth_refreshes.value(result="refreshed") == 1
+        assert registry.auth_refreshes.value(result="failed") == 1
+
+    def test_multi_instrumentation_forwards(self, registry):
+        """Test user hooks still run next to metrics."""
+        user = Mock(spec=Instrumentation)
+        user.start.return_value = "span"
+        hooks = MultiInstrumentation(user, MetricsInstrumentation(registry))
+
+        with instrument(hooks, ARROW_FETCH, {}) as op:
+            op.event("retry")
+            op.attributes["louie.arrow.bytes"] = 10
+
+        user.event.assert_called_once_with("span", "retry", {})
+        user.end.assert_called_once_with("span", {"louie.arrow.bytes": 10}, None)
+        assert registry.arrow_bytes.value() == 10
+        assert registry.retries.value(operation=ARROW_FETCH) == 1
+
+
+@pytest.mark.unit
+class TestClientMetrics:
+    """Test a client records metrics for real requests."""
+
+    def test_add_cell_updates_registry(self, mock_louie_server, mock_graphistry):
+        """Test chat, stream and Arrow metrics from the mock server."""
+        mock_louie_server.config.df_elements = 1
+        registry = MetricsRegistry()
+        client = LouieClient(
+            server_url=mock_louie_server.url,
+            graphistry_client=mock_graphistry,
+            metrics=registry,
+        )
+
+        client.add_cell("", "show data", agent="TestAgent")
+        client.add_cell("", "show data", agent="TestAgent")
+        client._client.close()
+
+        assert (
+            registry.requests.value(operation=CHAT, agent="TestAgent", status="ok") == 2
+        )
+        assert registry.requests.value(operation=ARROW_FETCH, status="ok") == 2
+        assert registry.arrow_bytes.value() == 2 * len(
+            mock_louie_server.arrow_payload()
+        )
+        ((_, (_, _, count)),) = registry.time_to_first_element.values().items()
+        assert count == 2
+        assert "louie_stream_duration_seconds_count" in registry.to_prometheus()
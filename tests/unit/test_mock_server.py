@@ -0,0 +1,109 @@
+"""Tests for the local stand-in Louie server over real HTTP."""
+
+import time
+
+import httpx
+import pytest
+
+from louieai.notebook.streaming import stream_response
+from tests.mock_server import MockServerConfig, make_arrow_table
+
+
+@pytest.mark.unit
+class TestMockLouieServer:
+    """Exercise client paths end to end against the mock server."""
+
+    def test_chat_stream_merges_updates(self, mock_louie_server, mock_louie_client):
+        """Test streamed text updates are merged into one element each."""
+        mock_louie_server.config.text_elements = 3
+        mock_louie_server.config.updates_per_element = 4
+
+        response = mock_louie_client.add_cell("", "hello")
+
+        assert response.thread_id.startswith("D_mock_")
+        assert len(response.text_elements) == 3
+        assert len(response.text_elements[0]["text"]) == 4 * 40
+        assert mock_louie_server.stats.requests["chat"] == 1
+
+    def test_dataframes_fetched_via_arrow(self, mock_louie_server, mock_louie_client):
+        """Test DfElements are resolved through the Arrow endpoint."""
+        mock_louie_server.config.df_elements = 2
+        mock_louie_server.config.df_rows = 250
+        mock_louie_server.config.df_cols = 4
+
+        response = mock_louie_client.add_cell("", "show data")
+
+        tables = [e["table"] for e in response.dataframe_elements]
+        assert len(tables) == 2
+        assert tables[0].shape == (250, 4)
+        assert mock_louie_server.stats.requests["arrow"] == 2
+
+    def test_existing_thread_is_continued(self, mock_louie_client):
+        """Test dthread_id is echoed back for follow-up queries."""
+        first = mock_louie_client.add_cell("", "hello")
+        second = mock_louie_client.add_cell(first.thread_id, "again")
+
+        assert second.thread_id == first.thread_id
+
+    def test_thread_listing(self, mock_louie_server, mock_louie_client):
+        """Test /api/dthreads pagination and lookup."""
+        threads = mock_louie_client.list_threads(page=1, page_size=3)
+        assert [t.id for t in threads] == ["D_mock_0000", "D_mock_0001", "D_mock_0002"]
+
+        thread = mock_louie_client.get_thread("D_mock_0004")
+        assert thread.name == "Mock thread 4"
+
+        with pytest.raises(httpx.HTTPStatusError):
+            mock_louie_client.get_thread("D_missing")
+
+    def test_line_delay_paces_stream(self, mock_louie_server, mock_louie_client):
+        """Test configured delays are applied between streamed lines."""
+        mock_louie_server.config.updates_per_element = 5
+        mock_louie_server.config.line_delay = 0.02
+
+        start = time.monotonic()
+        mock_louie_client.add_cell("", "slow")
+
+        assert time.monotonic() - start >= 0.1
+
+    def test_idle_deadline_against_real_socket(
+        self, mock_louie_server, mock_graphistry
+    ):
+        """Test the stream watchdog cuts off a stalled server."""
+        from louieai._client import LouieClient
+
+        mock_louie_server.config.updates_per_element = 2
+        mock_louie_server.config.line_delay = 1.0
+        client = LouieClient(
+            server_url=mock_louie_server.url,
+            graphistry_client=mock_graphistry,
+            streaming_timeout=0.2,
+        )
+
+        start = time.monotonic()
+        response = client.add_cell("", "stalled")
+
+        assert time.monotonic() - start < 1.0
+        assert response.thread_id.startswith("D_mock_")
+        assert response.truncation_reason == "idle_timeout"
+
+    def test_stream_response_display_path(self, mock_louie_server, mock_louie_client):
+        """Test the notebook streaming path over real HTTP."""
+        mock_louie_server.config.text_elements = 2
+        mock_louie_server.config.df_elements = 1
+
+        result = stream_response(mock_louie_client, thread_id="", prompt="hi")
+
+        assert len(result["elements"]) == 3
+        assert result["elements"][-1]["table"].shape == (100, 5)
+
+    def test_make_arrow_table_is_deterministic(self):
+        """Test generated tables are reproducible across runs."""
+        assert make_arrow_table(10, 3).equals(make_arrow_table(10, 3))
+        assert make_arrow_table(10, 3).num_columns == 3
+
+    def test_config_defaults(self):
+        """Test the default config streams one small text element."""
+        config = MockServerConfig()
+        assert config.text_elements == 1
+        assert config.df_elements == 0
@@ -0,0 +1,220 @@
+"""Unit tests for client-side rate limiting."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from louieai._client import LouieClient
+from louieai._ratelimit import RateLimiter, parse_retry_after
+
+
+def mock_http_response(status_code=200, headers=None):
+    """Create a mock httpx response with a given status."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+    response.json = Mock(return_value={"items": []})
+    return response
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test RateLimiter token bucket and in-flight cap."""
+
+    def test_rejects_invalid_config(self):
+        """Test invalid rate and in-flight values raise ValueError."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+        with pytest.raises(ValueError):
+            RateLimiter(max_in_flight=0)
+
+    def test_token_bucket_paces_requests(self):
+        """Test requests beyond the burst are spaced by the rate."""
+        limiter = RateLimiter(rate=20, burst=1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            with limiter.slot():
+                pass
+        elapsed = time.monotonic() - start
+
+        # First request is free, next two wait ~50ms each
+        assert elapsed >= 0.09
+
+    def test_max_in_flight_caps_concurrency(self):
+        """Test no more than max_in_flight requests run at once."""
+        limiter = RateLimiter(max_in_flight=2)
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal peak
+            with limiter.slot():
+                with lock:
+                    peak = max(peak, limiter.in_flight)
+                time.sleep(0.02)
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    def test_throttle_halves_rate_and_recovers(self):
+        """Test 429 backoff halves the rate and successes restore it."""
+        limiter = RateLimiter(rate=10)
+
+        limiter.on_throttle(retry_after=0)
+        assert limiter.rate == 5
+        limiter.on_throttle(retry_after=0)
+        assert limiter.rate == 2.5
+
+        for _ in range(20):
+            limiter.on_success()
+        assert limiter.rate == 10
+
+    def test_throttle_respects_min_rate(self):
+        """Test backoff never drops below min_rate."""
+        limiter = RateLimiter(rate=1, min_rate=0.5)
+        for _ in range(5):
+            limiter.on_throttle(retry_after=0)
+        assert limiter.rate == 0.5
+
+    def test_retry_after_blocks_new_requests(self):
+        """Test Retry-After holds requests even without a rate cap."""
+        limiter = RateLimiter(max_in_flight=4)
+        limiter.on_throttle(retry_after=0.1)
+
+        start = time.monotonic()
+        with limiter.slot():
+            pass
+        assert time.monotonic() - start >= 0.09
+
+    def test_shared_returns_same_instance(self):
+        """Test shared limiters are registered by key."""
+        a = RateLimiter.shared("test-shared-key", rate=3)
+        b = RateLimiter.shared("test-shared-key", rate=99)
+        c = RateLimiter.shared("test-other-key", rate=3)
+
+        assert a is b
+        assert a.rate == 3
+        assert a is not c
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing of seconds values."""
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after("1.5") == 1.5
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+
+
+@pytest.mark.unit
+class TestClientRateLimiting:
+    """Test LouieClient integration with RateLimiter."""
+
+    @pytest.fixture
+    def mock_graphistry_client(self):
+        """Mock GraphistryClient instance."""
+        mock = Mock()
+        mock.api_token = Mock(return_value="fake-token-123")
+        return mock
+
+    def test_no_limiter_by_default(self, mock_graphistry_client):
+        """Test clients are unlimited unless configured."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        assert client.rate_limiter is None
+
+    def test_limiter_from_kwargs(self, mock_graphistry_client):
+        """Test rate_limit and max_in_flight build a limiter."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client, rate_limit=5, max_in_flight=2
+        )
+        assert client.rate_limiter is not None
+        assert client.rate_limiter.rate == 5
+        assert client.rate_limiter.max_in_flight == 2
+
+    def test_zero_rate_rejected(self, mock_graphistry_client):
+        """Test rate_limit=0 is validated rather than ignored."""
+        with pytest.raises(ValueError, match="rate"):
+            LouieClient(graphistry_client=mock_graphistry_client, rate_limit=0)
+        with pytest.raises(ValueError, match="max_in_flight"):
+            LouieClient(graphistry_client=mock_graphistry_client, max_in_flight=0)
+
+    def test_limiter_shared_between_clients(self, mock_graphistry_client):
+        """Test an explicit limiter is shared, not copied."""
+        limiter = RateLimiter(rate=5)
+        a = LouieClient(graphistry_client=mock_graphistry_client, rate_limiter=limiter)
+        b = LouieClient(graphistry_client=mock_graphistry_client, rate_limiter=limiter)
+        assert a.rate_limiter is b.rate_limiter is limiter
+
+    def test_get_retries_after_429(self, mock_graphistry_client):
+        """Test throttled GETs are retried and slow the limiter down."""
+        limiter = RateLimiter(rate=100)
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client, rate_limiter=limiter
+        )
+        client._client = Mock()
+        client._client.get.side_effect = [
+            mock_http_response(429, {"Retry-After": "0"}),
+            mock_http_response(200),
+        ]
+
+        threads = client.list_threads()
+
+        assert threads == []
+        assert client._client.get.call_count == 2
+        assert limiter.rate < 100
+
+    def test_get_gives_up_after_max_retries(self, mock_graphistry_client):
+        """Test persistent 429s surface as HTTP errors."""
+        limiter = RateLimiter(max_in_flight=1, max_retries=1)
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client, rate_limiter=limiter
+        )
+        throttled = mock_http_response(429, {"Retry-After": "0"})
+        throttled.raise_for_status.side_effect = RuntimeError("429")
+        client._client = Mock()
+        client._client.get.return_value = throttled
+
+        with pytest.raises(RuntimeError, match="429"):
+            client.get_thread("D_001")
+        assert client._client.get.call_count == 2
+
+    def test_chat_stream_retries_after_429(self, mock_graphistry_client):
+        """Test add_cell retries a throttled chat request."""
+        client = LouieClient(graphistry_client=mock_graphistry_client, max_in_flight=1)
+
+        throttled = mock_http_response(429, {"Retry-After": "0"})
+        ok = mock_http_response(200)
+        ok.iter_lines.return_value = iter(
+            [
+                '{"dthread_id": "D_001"}',
+                '{"payload": {"id": "B_001", "type": "TextElement", "text": "Hi"}}',
+            ]
+        )
+
+        stream_cms = []
+        for response in (throttled, ok):
+            cm = Mock()
+            cm.__enter__ = Mock(return_value=response)
+            cm.__exit__ = Mock(return_value=None)
+            stream_cms.append(cm)
+
+        with patch("louieai._client.httpx.Client") as mock_client_class:
+            mock_client_instance = Mock()
+            mock_client_instance.stream.side_effect = stream_cms
+            mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
+            mock_client_instance.__exit__ = Mock(return_value=None)
+            mock_client_class.return_value = mock_client_instance
+
+            response = client.add_cell("", "hello")
+
+        assert response.thread_id == "D_001"
+        assert mock_client_instance.stream.call_count == 2
+        assert client.rate_limiter.in_flight == 0
@@ -0,0 +1,148 @@
+"""Tests for the cross-process shared dataframe cache."""
+
+import base64
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from unittest.mock import Mock
+
+import pyarrow as pa
+import pytest
+
+from louieai._client import LouieClient
+from louieai._shared_cache import SharedTableCache
+from louieai._timings import QueryTimings, record_timings
+from tests.mock_server import make_arrow_table
+
+
+@pytest.mark.unit
+class TestSharedTableCache:
+    """Test storing, attaching and cleanup."""
+
+    def test_attach_without_copying(self, tmp_path):
+        """Test a second cache on the same directory maps the stored table."""
+        table = make_arrow_table(10_000, 3)
+        SharedTableCache(tmp_path).store(("D_1", "B_1"), table)
+
+        before = pa.total_allocated_bytes()
+        loaded = SharedTableCache(tmp_path).load(("D_1", "B_1"))
+
+        assert loaded.equals(table)
+        assert pa.total_allocated_bytes() == before
+
+    def test_other_process_attaches(self, tmp_path):
+        """Test a separate interpreter reads what this one stored."""
+        SharedTableCache(tmp_path).store("key", make_arrow_table(100, 2))
+        script = textwrap.dedent(
+            f"""
+            from louieai._shared_cache import SharedTableCache
+            table = SharedTableCache({str(tmp_path)!r}).load("key")
+            print(table.num_rows)
+            """
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "100"
+
+    def test_lru_cleanup(self, tmp_path):
+        """Test the least recently read files are removed first."""
+        table = make_arrow_table(1000, 2)
+        cache = SharedTableCache(tmp_path)
+        cache.store("a", table)
+        size = cache.path("a").stat().st_size
+        cache.max_bytes = 2 * size
+        cache.store("b", table)
+        past = time.time() - 60
+        os.utime(cache.path("b"), (past, past))
+
+        cache.store("c", table)
+
+        assert cache.load("b") is None
+        assert cache.load("a") is not None and cache.load("c") is not None
+
+    def test_corrupt_file_is_discarded(self, tmp_path):
+        """Test an unreadable file is treated as a miss and removed."""
+        cache = SharedTableCache(tmp_path)
+        cache.path("k").write_bytes(b"not arrow")
+
+        assert cache.load("k") is None
+        assert not cache.path("k").exists()
+
+    def test_symlinked_directory_refused(self, tmp_path):
+        """Test a planted symlink is not followed."""
+        target = tmp_path / "target"
+        target.mkdir(mode=0o700)
+        (tmp_path / "link").symlink_to(target)
+
+        with pytest.raises(PermissionError, match="not a directory"):
+            SharedTableCache(tmp_path / "link")
+
+    def test_open_directory_refused(self, tmp_path):
+        """Test a directory other users can access is refused."""
+        directory = tmp_path / "open"
+        directory.mkdir()
+        directory.chmod(0o777)
+
+        with pytest.raises(PermissionError, match="other users"):
+            SharedTableCache(directory)
+
+
+@pytest.mark.unit
+class TestClientSharedCache:
+    """Test clients sharing blocks through the cache."""
+
+    def test_second_client_attaches(self, tmp_path, mock_louie_server, mock_graphistry):
+        """Test a second client (another process) skips the download."""
+        clients = [
+            LouieClient(
+                server_url=mock_louie_server.url,
+                graphistry_client=mock_graphistry,
+                shared_cache=SharedTableCache(tmp_path),
+            )
+            for _ in range(2)
+        ]
+        timings = QueryTimings()
+
+        with record_timings(timings):
+            first = clients[0]._fetch_dataframe_arrow("D_1", "B_1")
+            second = clients[1]._fetch_dataframe_arrow("D_1", "B_1")
+        for client in clients:
+            client._client.close()
+
+        assert first.equals(second)
+        assert mock_louie_server.stats.requests["arrow"] == 1
+        assert [f.cache for f in timings.arrow_fetches] == ["miss", "attached"]
+
+    def test_other_users_do_not_attach(self, tmp_path, mock_louie_server):
+        """Test tables are only shared between clients acting as one user."""
+        tokens = [
+            _jwt(username="alice", exp=1),
+            _jwt(username="mallory", exp=1),
+            _jwt(username="alice", exp=2),
+        ]
+        clients = [
+            LouieClient(
+                server_url=mock_louie_server.url,
+                graphistry_client=Mock(api_token=Mock(return_value=token)),
+                shared_cache=SharedTableCache(tmp_path),
+            )
+            for token in tokens
+        ]
+        for client in clients:
+            client._fetch_dataframe_arrow("D_1", "B_1")
+            client._client.close()
+
+        # The third client has its own token but acts as the same user
+        assert mock_louie_server.stats.requests["arrow"] == 2
+
+
+def _jwt(**claims):
+    """Unsigned JWT with the given claims."""
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"e30.{payload.decode()}.sig"
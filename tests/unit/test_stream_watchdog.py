@@ -0,0 +1,293 @@
+"""Unit tests for chat stream deadlines and truncation."""
+
+import socket
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from louieai._cancel import CancelToken
+from louieai._client import LouieClient
+from louieai._watchdog import (
+    CANCELLED,
+    FIRST_ELEMENT_TIMEOUT,
+    IDLE_TIMEOUT,
+    TOTAL_TIMEOUT,
+    StreamDeadlines,
+    StreamTimeoutError,
+    StreamWatchdog,
+)
+from louieai.notebook.streaming import stream_response
+
+from .mocks import BlockingResponse
+
+THREAD_LINE = '{"dthread_id": "D_001"}'
+TEXT_LINE = '{"payload": {"id": "B_001", "type": "TextElement", "text": "Hi"}}'
+
+
+@pytest.mark.unit
+class TestStreamWatchdog:
+    """Test StreamWatchdog deadline enforcement."""
+
+    def run(self, response, deadlines):
+        """Read all lines under a watchdog, returning lines and elapsed time."""
+        start = time.monotonic()
+        with StreamWatchdog(deadlines, on_expire=response.close) as watchdog:
+            lines = list(watchdog.iter_lines(response))
+        return lines, watchdog, time.monotonic() - start
+
+    def test_complete_stream_not_truncated(self):
+        """Test a stream that ends normally has no truncation reason."""
+        response = BlockingResponse([THREAD_LINE, "", TEXT_LINE], hang=False)
+        lines, watchdog, _ = self.run(response, StreamDeadlines(total=5, idle=5))
+
+        assert lines == [THREAD_LINE, TEXT_LINE]
+        assert not watchdog.expired
+        assert watchdog.reason is None
+
+    def test_idle_deadline_unblocks_reader(self):
+        """Test a silent stream is cut off at the idle deadline."""
+        response = BlockingResponse([THREAD_LINE])
+        lines, watchdog, elapsed = self.run(response, StreamDeadlines(idle=0.1))
+
+        assert lines == [THREAD_LINE]
+        assert watchdog.reason == IDLE_TIMEOUT
+        assert elapsed < 2
+
+    def test_activity_pushes_back_idle_deadline(self):
+        """Test steady activity keeps the stream alive past the idle window."""
+        response = BlockingResponse([THREAD_LINE] + [TEXT_LINE] * 5, interval=0.05)
+        lines, watchdog, elapsed = self.run(response, StreamDeadlines(idle=0.15))
+
+        assert len(lines) == 6
+        assert watchdog.reason == IDLE_TIMEOUT
+        assert elapsed > 0.25
+
+    def test_total_deadline_stops_active_stream(self):
+        """Test the overall deadline applies even while lines keep arriving."""
+        response = BlockingResponse([TEXT_LINE] * 100, interval=0.02, hang=False)
+        lines, watchdog, elapsed = self.run(
+            response, StreamDeadlines(total=0.1, idle=5)
+        )
+
+        assert watchdog.reason == TOTAL_TIMEOUT
+        assert len(lines) < 100
+        assert elapsed < 1
+
+    def test_first_element_deadline(self):
+        """Test the first-element deadline ignores the thread ID line."""
+        response = BlockingResponse([THREAD_LINE])
+        _, watchdog, _ = self.run(response, StreamDeadlines(idle=5, first_element=0.1))
+
+        assert watchdog.reason == FIRST_ELEMENT_TIMEOUT
+
+    def test_read_timeout_backstop_marks_idle(self):
+        """Test an httpx ReadTimeout is reported as an idle timeout."""
+        response = Mock()
+        response.iter_lines.side_effect = httpx.ReadTimeout("slow")
+
+        with StreamWatchdog(StreamDeadlines()) as watchdog:
+            lines = list(watchdog.iter_lines(response))
+
+        assert lines == []
+        assert watchdog.reason == IDLE_TIMEOUT
+
+    def test_unexpected_transport_error_raises(self):
+        """Test transport errors not caused by the watchdog propagate."""
+        response = Mock()
+        response.iter_lines.side_effect = httpx.ReadError("reset")
+
+        with (
+            StreamWatchdog(StreamDeadlines(idle=5)) as watchdog,
+            pytest.raises(httpx.ReadError),
+        ):
+            list(watchdog.iter_lines(response))
+
+
+@pytest.mark.unit
+class TestAddCellTruncation:
+    """Test add_cell marks partial responses as truncated."""
+
+    @pytest.fixture
+    def mock_graphistry_client(self):
+        """Mock GraphistryClient instance."""
+        mock = Mock()
+        mock.api_token = Mock(return_value="fake-token-123")
+        return mock
+
+    def add_cell(self, client, response):
+        """Run add_cell against a fake streaming response."""
+        stream_cm = Mock()
+        stream_cm.__enter__ = Mock(return_value=response)
+        stream_cm.__exit__ = Mock(return_value=None)
+
+        with patch("louieai._client.httpx.Client") as mock_client_class:
+            mock_client_instance = Mock()
+            mock_client_instance.stream.return_value = stream_cm
+            mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
+            mock_client_instance.__exit__ = Mock(return_value=None)
+            mock_client_class.return_value = mock_client_instance
+            return client.add_cell("", "hello")
+
+    def test_complete_response_not_truncated(self, mock_graphistry_client):
+        """Test a normally completed stream is not flagged."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        response = self.add_cell(
+            client, BlockingResponse([THREAD_LINE, TEXT_LINE], hang=False)
+        )
+
+        assert response.truncated is False
+        assert response.truncation_reason is None
+
+    def test_idle_stream_returns_truncated_response(self, mock_graphistry_client):
+        """Test partial results are returned and flagged on idle timeout."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client, streaming_timeout=0.1
+        )
+        response = self.add_cell(client, BlockingResponse([THREAD_LINE, TEXT_LINE]))
+
+        assert response.thread_id == "D_001"
+        assert len(response.elements) == 1
+        assert response.truncated is True
+        assert response.truncation_reason == IDLE_TIMEOUT
+
+    def test_no_data_raises_stream_timeout(self, mock_graphistry_client):
+        """Test a stream with nothing received raises StreamTimeoutError."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client, streaming_timeout=0.1
+        )
+
+        with pytest.raises(StreamTimeoutError, match="idle_timeout") as exc_info:
+            self.add_cell(client, BlockingResponse([]))
+
+        assert isinstance(exc_info.value, RuntimeError)
+        assert exc_info.value.reason == IDLE_TIMEOUT
+
+    def test_timeouts_count_against_circuit(self, mock_graphistry_client):
+        """Test truncated streams count as chat endpoint failures."""
+        client = LouieClient(
+            graphistry_client=mock_graphistry_client,
+            streaming_timeout=0.1,
+            failure_threshold=2,
+        )
+        for _ in range(2):
+            self.add_cell(client, BlockingResponse([THREAD_LINE]))
+
+        assert client.circuit_breakers["chat"].state == "open"
+
+
+@pytest.fixture
+def silent_server():
+    """URL of a server that accepts connections but never answers."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    accepted = []
+    stop = threading.Event()
+
+    def serve():
+        listener.settimeout(0.05)
+        while not stop.is_set():
+            try:
+                accepted.append(listener.accept()[0])
+            except OSError:
+                continue
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{listener.getsockname()[1]}"
+    stop.set()
+    thread.join()
+    for conn in accepted:
+        conn.close()
+    listener.close()
+
+
+@pytest.mark.unit
+class TestDeadlinesBeforeResponse:
+    """Test deadlines and cancellation cover a server that never answers."""
+
+    @pytest.fixture
+    def mock_graphistry_client(self):
+        """Mock GraphistryClient instance."""
+        mock = Mock()
+        mock.api_token = Mock(return_value="fake-token-123")
+        return mock
+
+    def test_first_element_deadline_without_headers(
+        self, silent_server, mock_graphistry_client
+    ):
+        """Test the first-element deadline fires before any headers arrive."""
+        client = LouieClient(
+            server_url=silent_server,
+            graphistry_client=mock_graphistry_client,
+            streaming_timeout=30,
+            first_element_timeout=0.2,
+        )
+
+        start = time.monotonic()
+        with pytest.raises(StreamTimeoutError) as exc_info:
+            client.add_cell("", "hello")
+
+        assert exc_info.value.reason == FIRST_ELEMENT_TIMEOUT
+        assert time.monotonic() - start < 5
+
+    def test_cancel_without_headers(self, silent_server, mock_graphistry_client):
+        """Test cancelling a query the server has not answered yet."""
+        client = LouieClient(
+            server_url=silent_server,
+            graphistry_client=mock_graphistry_client,
+            streaming_timeout=30,
+        )
+        token = CancelToken()
+        threading.Timer(0.2, token.cancel).start()
+
+        start = time.monotonic()
+        response = client.add_cell("", "hello", cancel_token=token)
+
+        assert response.truncation_reason == CANCELLED
+        assert response.elements == []
+        assert time.monotonic() - start < 5
+
+    def test_notebook_stream_times_out_like_client(
+        self, silent_server, mock_graphistry_client
+    ):
+        """Test the notebook display raises the same timeout as add_cell."""
+        client = LouieClient(
+            server_url=silent_server,
+            graphistry_client=mock_graphistry_client,
+            streaming_timeout=30,
+            first_element_timeout=0.2,
+        )
+
+        with pytest.raises(StreamTimeoutError, match="first_element_timeout") as exc:
+            stream_response(client, thread_id="", prompt="hello")
+
+        assert exc.value.reason == FIRST_ELEMENT_TIMEOUT
+
+    def test_notebook_cancel_without_headers(
+        self, silent_server, mock_graphistry_client
+    ):
+        """Test the notebook display cancels like add_cell."""
+        client = LouieClient(
+            server_url=silent_server,
+            graphistry_client=mock_graphistry_client,
+            streaming_timeout=30,
+        )
+        token = CancelToken()
+        threading.Timer(0.2, token.cancel).start()
+
+        result = stream_response(client, thread_id="", prompt="hi", cancel_token=token)
+
+        assert result["truncation_reason"] == CANCELLED
+        assert result["elements"] == []
+
+    def test_total_deadline_opt_in(self, mock_graphistry_client):
+        """Test timeout keeps its old meaning and total_timeout is opt-in."""
+        client = LouieClient(graphistry_client=mock_graphistry_client)
+        assert client._stream_deadlines().total is None
+
+        client = LouieClient(graphistry_client=mock_graphistry_client, total_timeout=5)
+        assert client._stream_deadlines().total == 5
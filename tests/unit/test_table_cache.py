@@ -0,0 +1,155 @@
+"""Tests for single-flight dataframe fetches and the table cache."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from louieai._client import LouieClient
+from louieai._table_cache import HIT, MISS, SHARED, TableCache
+from louieai._timings import QueryTimings, record_timings
+from tests.mock_server import make_arrow_table
+
+
+@pytest.mark.unit
+class TestTableCache:
+    """Test coalescing and eviction."""
+
+    def test_concurrent_callers_share_one_fetch(self):
+        """Test callers arriving mid-fetch wait for the same table."""
+        cache = TableCache()
+        table = make_arrow_table(10, 2)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return table
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = [pool.submit(cache.get, "k", fetch) for _ in range(6)]
+            started.wait(5)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(t is table for t, _ in results)
+        assert [how for _, how in results].count(MISS) == 1
+        assert {how for _, how in results} <= {MISS, SHARED, HIT}
+        assert cache.get("k", fetch) == (table, HIT)
+
+    def test_errors_reach_waiters_and_are_not_cached(self):
+        """Test a failed fetch raises for everyone and is retried later."""
+        cache = TableCache()
+
+        def fail():
+            raise OSError("down")
+
+        with pytest.raises(OSError, match="down"):
+            cache.get("k", fail)
+
+        table, how = cache.get("k", lambda: make_arrow_table(1, 1))
+        assert how == MISS and table.num_rows == 1
+
+    def test_lru_eviction_by_bytes(self):
+        """Test the least recently used table goes first."""
+        small = make_arrow_table(100, 1)
+        cache = TableCache(max_bytes=2 * small.nbytes)
+        cache.get("a", lambda: small)
+        cache.get("b", lambda: make_arrow_table(100, 1))
+        cache.get("a", lambda: small)
+
+        cache.get("c", lambda: make_arrow_table(100, 1))
+
+        assert cache.get("a", lambda: small)[1] == HIT
+        assert cache.get("b", lambda: small)[1] == MISS
+        assert cache.nbytes <= cache.max_bytes
+
+    def test_slices_count_their_whole_buffers(self):
+        """Test a zero-copy slice is charged for the memory it keeps alive."""
+        full = make_arrow_table(100_000, 1)
+        cache = TableCache(max_bytes=full.nbytes // 2)
+
+        cache.get("a", lambda: full.slice(0, 10))
+
+        assert len(cache) == 0
+
+    def test_zero_bytes_keeps_nothing(self):
+        """Test a zero budget still works, without caching."""
+        cache = TableCache(max_bytes=0)
+        cache.get("a", lambda: make_arrow_table(10, 1))
+
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestClientTableCache:
+    """Test dataframe fetches through the client."""
+
+    def test_repeat_fetch_is_served_from_cache(
+        self, mock_louie_server, mock_louie_client
+    ):
+        """Test the second fetch of a block makes no request."""
+        timings = QueryTimings()
+        with record_timings(timings):
+            first = mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+            second = mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+
+        assert first.equals(second) and first is not second
+        assert mock_louie_server.stats.requests["arrow"] == 1
+        assert [f.cache for f in timings.arrow_fetches] == [MISS, HIT]
+        assert timings.arrow_fetches[1].bytes == 0
+
+    def test_windows_are_cached_separately(self, mock_louie_server, mock_louie_client):
+        """Test a different column selection is its own entry."""
+        mock_louie_client._fetch_dataframe_arrow("D_1", "B_1")
+        df = mock_louie_client._fetch_dataframe_arrow("D_1", "B_1", columns=["int_0"])
+
+        assert list(df.columns) == ["int_0"]
+        assert mock_louie_server.stats.requests["arrow"] == 2
+
+    def test_windows_do_not_keep_the_block_alive(
+        self, mock_louie_server, mock_louie_client
+    ):
+        """Test a window the client sliced itself is cached as a small copy."""
+        mock_louie_server.config.df_rows = 100_000
+        mock_louie_server.config.arrow_slicing = False
+
+        mock_louie_client._fetch_dataframe_arrow(
+            "D_1", "B_1", columns=["int_0"], limit=10, offset=5
+        )
+
+        assert 0 < mock_louie_client._table_cache.nbytes <= 1000
+
+    def test_concurrent_fetches_share_a_download(
+        self, mock_louie_server, mock_louie_client
+    ):
+        """Test simultaneous fetches of a block make one request."""
+        mock_louie_server.config.arrow_delay = 0.2
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            frames = list(
+                pool.map(
+                    lambda _: mock_louie_client._fetch_dataframe_arrow("D_1", "B_1"),
+                    range(4),
+                )
+            )
+
+        assert all(df.shape == (100, 5) for df in frames)
+        assert mock_louie_server.stats.requests["arrow"] == 1
+
+    def test_cache_disabled(self, mock_louie_server, mock_graphistry):
+        """Test dataframe_cache_bytes=0 fetches every time."""
+        client = LouieClient(
+            server_url=mock_louie_server.url,
+            graphistry_client=mock_graphistry,
+            dataframe_cache_bytes=0,
+        )
+
+        client._fetch_dataframe_arrow("D_1", "B_1")
+        client._fetch_dataframe_arrow("D_1", "B_1")
+        client._client.close()
+
+        assert mock_louie_server.stats.requests["arrow"] == 2
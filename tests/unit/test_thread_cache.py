@@ -0,0 +1,171 @@
+"""Tests for cached, revalidated and batched thread lookups."""
+
+import httpx
+import pytest
+
+from louieai._client import LouieClient, Thread
+from louieai._thread_cache import ThreadCache
+from louieai.notebook.streaming import stream_response
+
+
+def _lookups(server):
+    return server.stats.requests.get("thread", 0)
+
+
+def _sent(server, header):
+    headers = server.stats.last_headers["thread"]
+    return {k.lower(): v for k, v in headers.items()}.get(header.lower())
+
+
+@pytest.fixture
+def revalidating_client(mock_louie_server, mock_graphistry):
+    """Client that revalidates every thread lookup."""
+    client = LouieClient(
+        server_url=mock_louie_server.url,
+        graphistry_client=mock_graphistry,
+        thread_cache_ttl=0,
+    )
+    yield client
+    client._client.close()
+
+
+@pytest.mark.unit
+class TestThreadCache:
+    """Test the cache on its own."""
+
+    def test_fresh_within_ttl(self):
+        """Test entries are served until the TTL passes."""
+        cache = ThreadCache(ttl=60)
+        thread = Thread(id="D_1", name="One")
+
+        assert cache.fresh("D_1") is None
+        cache.store("D_1", thread, '"abc"', None)
+
+        assert cache.fresh("D_1") == thread
+        assert ThreadCache(ttl=0).fresh("D_1") is None
+
+    def test_validators(self):
+        """Test conditional headers come from the stored validators."""
+        cache = ThreadCache(ttl=0)
+        cache.store("D_1", Thread(id="D_1"), '"abc"', "Wed, 01 Jan 2025 00:00:00 GMT")
+
+        assert cache.fresh("D_1") is None
+        assert cache.validators("D_1") == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        assert cache.validators("D_2") == {}
+
+    def test_revalidated_restarts_ttl(self):
+        """Test a 304 makes the entry fresh again."""
+        cache = ThreadCache(ttl=60)
+        thread = Thread(id="D_1")
+        cache.store("D_1", thread, '"abc"', None)
+        cache._entries["D_1"].fetched_at -= 120
+
+        assert cache.fresh("D_1") is None
+        assert cache.revalidated("D_1") == thread
+        assert cache.fresh("D_1") == thread
+        assert cache.revalidated("D_2") is None
+
+    def test_copies_in_and_out(self):
+        """Test callers modifying a thread do not change the cached one."""
+        cache = ThreadCache(ttl=60)
+        thread = Thread(id="D_1", name="One")
+        cache.store("D_1", thread, None, None)
+
+        thread.name = "Changed"
+        cache.fresh("D_1").name = "Changed"
+        cache.revalidated("D_1").name = "Changed"
+
+        assert cache.fresh("D_1").name == "One"
+
+    def test_bounded(self):
+        """Test the least recently used entries are dropped."""
+        cache = ThreadCache(max_entries=2)
+        for i in range(3):
+            cache.store(f"D_{i}", Thread(id=f"D_{i}"), None, None)
+
+        assert len(cache) == 2
+        assert cache.fresh("D_0") is None
+
+    def test_negative_ttl(self):
+        """Test the TTL must not be negative."""
+        with pytest.raises(ValueError, match="ttl"):
+            ThreadCache(ttl=-1)
+
+
+@pytest.mark.unit
+class TestCachedLookups:
+    """Test get_thread and get_threads against the mock server."""
+
+    def test_repeat_lookup_is_cached(self, mock_louie_server, mock_louie_client):
+        """Test a second lookup within the TTL makes no request."""
+        first = mock_louie_client.get_thread("D_mock_0001")
+        second = mock_louie_client.get_thread("D_mock_0001")
+
+        assert second == first
+        assert second is not first
+        assert _lookups(mock_louie_server) == 1
+
+    def test_unchanged_thread_revalidates(self, mock_louie_server, revalidating_client):
+        """Test a stale entry is revalidated with its ETag and kept on 304."""
+        first = revalidating_client.get_thread("D_mock_0001")
+        second = revalidating_client.get_thread("D_mock_0001")
+
+        assert second == first
+        assert _lookups(mock_louie_server) == 2
+        assert _sent(mock_louie_server, "If-None-Match")
+
+    def test_changed_thread_refetched(self, mock_louie_server, revalidating_client):
+        """Test a thread changed on the server is fetched again."""
+        revalidating_client.get_thread("D_mock_0001")
+        mock_louie_server.threads["D_mock_0001"] = "Renamed"
+
+        thread = revalidating_client.get_thread("D_mock_0001")
+
+        assert thread.name == "Renamed"
+
+    def test_chat_invalidates(self, mock_louie_server, mock_louie_client):
+        """Test adding to a thread drops its cached metadata."""
+        before = mock_louie_client.get_thread("D_mock_0001")
+
+        mock_louie_client.add_cell("D_mock_0001", "more")
+        after = mock_louie_client.get_thread("D_mock_0001")
+
+        assert after.last_modified != before.last_modified
+        assert _lookups(mock_louie_server) == 2
+
+    def test_notebook_stream_invalidates(self, mock_louie_server, mock_louie_client):
+        """Test streaming to a thread from a notebook drops its cached metadata."""
+        before = mock_louie_client.get_thread("D_mock_0001")
+
+        stream_response(mock_louie_client, thread_id="D_mock_0001", prompt="more")
+        after = mock_louie_client.get_thread("D_mock_0001")
+
+        assert after.last_modified != before.last_modified
+        assert _lookups(mock_louie_server) == 2
+
+    def test_get_threads(self, mock_louie_server, mock_louie_client):
+        """Test batch lookups keep order, fetch duplicates once and cache."""
+        ids = ["D_mock_0003", "D_mock_0000", "D_mock_0003", "D_mock_0004"]
+
+        threads = mock_louie_client.get_threads(ids, concurrency=3)
+
+        assert [t.id for t in threads] == ids
+        assert threads[0] == threads[2]
+        assert threads[0] is not threads[2]
+        assert _lookups(mock_louie_server) == 3
+
+        mock_louie_client.get_threads(ids)
+        assert _lookups(mock_louie_server) == 3
+
+    def test_get_threads_missing(self, mock_louie_server, mock_louie_client):
+        """Test an unknown thread fails the batch."""
+        with pytest.raises(httpx.HTTPStatusError):
+            mock_louie_client.get_threads(["D_mock_0000", "D_missing"])
+
+    def test_get_threads_concurrency_validated(self, mock_louie_client):
+        """Test concurrency must be positive."""
+        with pytest.raises(ValueError, match="concurrency"):
+            mock_louie_client.get_threads(["D_mock_0000"], concurrency=0)
@@ -0,0 +1,215 @@
+"""Tests for per-query timing breakdowns."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from louieai._client import Response
+from louieai._timings import ArrowFetchTiming, QueryTimings
+from louieai.notebook.cursor import Cursor
+from louieai.notebook.streaming import stream_response
+
+
+@pytest.mark.unit
+class TestQueryTimings:
+    """Test the timing record itself."""
+
+    def test_on_line_records_first_arrivals(self):
+        """Test thread id and element arrivals keep their first offset."""
+        timings = QueryTimings()
+        start = timings._start
+
+        timings.on_line({"dthread_id": "D_1"}, start + 0.1)
+        timings.on_line({"payload": {"id": "B_1", "text": "a"}}, start + 0.2)
+        timings.on_line({"payload": {"id": "B_1", "text": "ab"}}, start + 0.3)
+        timings.on_line({"payload": {"id": "B_2"}}, start + 0.4)
+
+        assert timings.thread_id_s == pytest.approx(0.1)
+        assert timings.first_element_s == pytest.approx(0.2)
+        assert timings.element_arrivals == {
+            "B_1": pytest.approx(0.2),
+            "B_2": pytest.approx(0.4),
+        }
+
+    def test_http_trace_measures_connect(self):
+        """Test connection setup is timed from httpx trace events."""
+        timings = QueryTimings()
+
+        timings.http_trace("connection.connect_tcp.started", {})
+        timings.http_trace("connection.connect_tcp.complete", {})
+
+        assert timings.connect_s is not None and timings.connect_s >= 0
+
+    def test_aggregate_summarizes_phases(self):
+        """Test batches summarize each phase over the queries that had it."""
+        batch = [
+            QueryTimings(headers_s=0.01, total_s=1.0),
+            QueryTimings(
+                headers_s=0.03,
+                total_s=3.0,
+                arrow_fetches=[ArrowFetchTiming("B_1", 0.2, 1000, 0.01, 0.02)],
+            ),
+            None,
+        ]
+
+        summary = QueryTimings.aggregate(batch)
+
+        assert summary["total_s"]["count"] == 2
+        assert summary["total_s"]["mean"] == pytest.approx(2.0)
+        assert summary["total_s"]["p50"] == pytest.approx(2.0)
+        assert summary["total_s"]["max"] == 3.0
+        assert summary["arrow_bytes"]["count"] == 1
+        assert summary["arrow_bytes"]["max"] == 1000
+        assert "connect_s" not in summary
+
+
+@pytest.mark.unit
+class TestResponseTimings:
+    """Test timings recorded on real queries against the mock server."""
+
+    def test_add_cell_records_breakdown(self, mock_louie_server, mock_louie_client):
+        """Test every phase is filled in and ordered."""
+        mock_louie_server.config.text_elements = 2
+        mock_louie_server.config.df_elements = 1
+        mock_louie_server.config.line_delay = 0.01
+
+        timings = mock_louie_client.add_cell("", "show data").timings
+
+        assert timings is not None
+        assert timings.headers_s is not None
+        assert timings.connect_s is not None
+        assert (
+            timings.headers_s
+            <= timings.ttfb_s
+            <= timings.thread_id_s
+            <= timings.first_element_s
+            <= timings.total_s
+        )
+        assert timings.stream_s >= 0.05
+        assert set(timings.element_arrivals) == {
+            "B_text_0000",
+            "B_text_0001",
+            "B_df_0000",
+        }
+        (fetch,) = timings.arrow_fetches
+        assert fetch.block_id == "B_df_0000"
+        assert fetch.bytes == len(mock_louie_server.arrow_payload())
+        assert fetch.decode_s >= 0 and fetch.pandas_s >= 0
+
+    def test_stream_response_records_breakdown(
+        self, mock_louie_server, mock_louie_client
+    ):
+        """Test the notebook streaming path records timings too."""
+        mock_louie_server.config.df_elements = 1
+
+        result = stream_response(mock_louie_client, thread_id="", prompt="hi")
+
+        timings = result["timings"]
+        assert timings.first_element_s is not None
+        assert len(timings.arrow_fetches) == 1
+        assert timings.total_s >= timings.first_element_s
+
+    def test_add_cell_records_auth_refresh(self, mock_louie_server, mock_louie_client):
+        """Test an expired token refreshed mid-query lands in the timings."""
+        mock_louie_server.config.expired_tokens = 1
+
+        response = mock_louie_client.add_cell("", "hi")
+
+        timings = response.timings
+        ((start_s, duration_s),) = timings.auth_refreshes
+        assert 0 <= start_s <= start_s + duration_s <= timings.total_s
+        assert mock_louie_server.stats.requests["chat"] == 2
+        tracks = {
+            e["args"]["name"]
+            for e in timings.to_chrome_trace()["traceEvents"]
+            if e["name"] == "thread_name"
+        }
+        assert "auth" in tracks
+
+    def test_arrow_fetch_records_auth_refresh(
+        self, mock_louie_server, mock_louie_client
+    ):
+        """Test an expired token on an Arrow fetch is refreshed, not dropped."""
+        mock_louie_server.config.df_elements = 1
+        mock_louie_server.config.arrow_expired_tokens = 1
+
+        response = mock_louie_client.add_cell("", "show data")
+
+        (element,) = response.dataframe_elements
+        assert element["table"] is not None
+        assert mock_louie_server.stats.requests["arrow"] == 2
+        assert len(response.timings.auth_refreshes) == 1
+
+    def test_cursor_exposes_latest_timings(self):
+        """Test lui.timings and lui[-n].timings read from history."""
+        client = Mock()
+        older, latest = QueryTimings(total_s=1.0), QueryTimings(total_s=2.0)
+        client.add_cell.side_effect = [
+            Response("D_1", [], timings=older),
+            Response("D_1", [], timings=latest),
+        ]
+        lui = Cursor(client=client)
+        assert lui.timings is None
+
+        with patch.object(lui, "_in_jupyter", return_value=False):
+            lui("first")
+            lui("second")
+
+        assert lui.timings is latest
+        assert lui[-2].timings is older
+        assert QueryTimings.aggregate([lui[-2].timings, lui.timings])["total_s"][
+            "mean"
+        ] == pytest.approx(1.5)
+
+
+@pytest.mark.unit
+class TestChromeTrace:
+    """Test the timeline export."""
+
+    def test_tracks_and_events(self, tmp_path):
+        """Test phases, element updates and Arrow fetches become trace events."""
+        timings = QueryTimings(
+            headers_s=0.01,
+            ttfb_s=0.05,
+            stream_s=0.5,
+            total_s=0.8,
+            arrow_fetches=[ArrowFetchTiming("B_df", 0.1, 500, 0.01, 0.02, start_s=0.6)],
+            auth_refreshes=[(0.0, 0.005)],
+        )
+        start = timings._start
+        timings.on_line({"payload": {"id": "B_1", "type": "TextElement"}}, start + 0.1)
+        timings.on_line({"payload": {"id": "B_1", "type": "TextElement"}}, start + 0.3)
+
+        trace = timings.to_chrome_trace(name="q1")
+        events = trace["traceEvents"]
+
+        tracks = {
+            e["args"]["name"]: e["tid"] for e in events if e["name"] == "thread_name"
+        }
+        assert set(tracks) == {"request", "TextElement B_1", "arrow", "auth"}
+        slices = {(e["tid"], e["name"]): e for e in events if e["ph"] == "X"}
+        assert slices[(tracks["request"], "q1")]["dur"] == pytest.approx(800_000)
+        element = slices[(tracks["TextElement B_1"], "TextElement")]
+        assert element["ts"] == pytest.approx(100_000)
+        assert element["dur"] == pytest.approx(200_000)
+        assert element["args"]["updates"] == 2
+        assert slices[(tracks["arrow"], "arrow decode")]["ts"] == pytest.approx(700_000)
+        marks = [e["name"] for e in events if e["ph"] == "i"]
+        assert marks.count("update") == 2 and "first_element" in marks
+
+        path = tmp_path / "q1.json"
+        timings.save_trace(path, name="q1")
+        assert json.loads(path.read_text()) == trace
+
+    def test_add_cell_trace_has_arrow_start(self, mock_louie_server, mock_louie_client):
+        """Test real queries record where each Arrow fetch started."""
+        mock_louie_server.config.df_elements = 1
+
+        timings = mock_louie_client.add_cell("", "show data").timings
+
+        (fetch,) = timings.arrow_fetches
+        assert timings.stream_s is not None
+        assert fetch.start_s >= timings.ttfb_s + timings.stream_s
+        names = {e["name"] for e in timings.to_chrome_trace()["traceEvents"]}
+        assert {"arrow fetch", "stream", "update"} <= names